@@ -33,8 +33,24 @@ in copyright infringement under DMCA and international IP treaties.
 For legitimate licensing: https://itdeo.tech/1c-processor-generator
 """
 
-from .generator import ProcessorGenerator
-from .models import Processor, Attribute, TabularSection, Column
+_LAZY_EXPORTS = {
+    "ProcessorGenerator": "generator",
+    "Processor": "models",
+    "Attribute": "models",
+    "TabularSection": "models",
+    "Column": "models",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 # PRO module - internal use only (not part of public API)
 # End users should use CLI: python -m 1c_processor_generator yaml ...
@@ -3,32 +3,18 @@
 import sys
 import argparse
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-try:
-    from .generator import ProcessorGenerator, create_minimal_processor
-    from .models import Processor, ValidationConfig
-    from .metadata_analyzer import MetadataAnalyzer
-    from .yaml_parser import parse_yaml_config
-    from .test_generator import TestGenerator
-    from .sync_tool import run_sync
-    from .pro import LicensedEPFCompiler
-    from .pro import get_license_manager, send_first_run_telemetry
-    from .pro import check_version_in_background
-except ImportError:
-                                                    
-    from generator import ProcessorGenerator, create_minimal_processor
-    from models import Processor, ValidationConfig
-    from metadata_analyzer import MetadataAnalyzer
-    from yaml_parser import parse_yaml_config
-    from test_generator import TestGenerator
-    from sync_tool import run_sync
-    from pro import LicensedEPFCompiler
-    from pro import get_license_manager, send_first_run_telemetry
-    from pro import check_version_in_background
-
-
-def create_example_processor() -> Processor:
+from .profiling import span, start_profiling, stop_profiling
+
+if TYPE_CHECKING:
+    from .models import Processor
+
+
+def create_example_processor() -> "Processor":
                                                       
+    from .models import Column, Processor
+
     processor = Processor(
         name="ПримерОбработки",
         synonym_ru="Пример обработки",
@@ -58,22 +44,20 @@ def create_example_processor() -> Processor:
         synonym_uk="Дані",
     )
 
-    ts.columns.append(Processor.__dict__['add_attribute'].__func__(
-        ts,
+    ts.columns.append(Column(
         name="Выбрано",
         type="boolean",
         synonym_ru="Выбрано",
         synonym_uk="Вибрано",
-    ).__dict__)
+    ))
 
-    ts.columns.append(Processor.__dict__['add_attribute'].__func__(
-        ts,
+    ts.columns.append(Column(
         name="Наименование",
         type="string",
         synonym_ru="Наименование",
         synonym_uk="Найменування",
         length=150,
-    ).__dict__)
+    ))
 
                     
     processor.add_form_element(
@@ -99,6 +83,8 @@ def create_example_processor() -> Processor:
 
 def cmd_minimal(args):
                                               
+    from .generator import create_minimal_processor
+
     print(f"🚀 Створення мінімальної обробки '{args.name}' (версія {args.version})...")
     processor = create_minimal_processor(args.name, args.version)
     return generate_processor(args, processor)
@@ -113,6 +99,10 @@ def cmd_example(args):
 
 def _cloud_compile(args):
                                                             
+    from .generator import ProcessorGenerator
+    from .yaml_parser import parse_yaml_config
+    from .pro import get_license_manager
+
     print(f"☁️  Хмарна компіляція EPF: {args.config}...")
 
                                                       
@@ -141,7 +131,9 @@ def _cloud_compile(args):
         args.config,
         handlers_dir=args.handlers,
         handlers_file=args.handlers_file,
-        normalize_bsl_escapes=getattr(args, 'normalize_bsl_escapes', False)
+        normalize_bsl_escapes=getattr(args, 'normalize_bsl_escapes', False),
+        config_cache=getattr(args, 'config_cache', None),
+        processor_snapshot=getattr(args, 'processor_snapshot', None),
     )
     if not processor:
         print("❌ Помилка парсингу YAML")
@@ -235,6 +227,8 @@ def _cloud_compile(args):
 
 def cmd_yaml(args):
                                                        
+    from .yaml_parser import parse_yaml_config
+
     if not args.config.exists():
         print(f"❌ Помилка: Файл не знайдено: {args.config}")
         sys.exit(1)
@@ -252,7 +246,11 @@ def cmd_yaml(args):
         args.config,
         handlers_dir=args.handlers,
         handlers_file=args.handlers_file,
-        normalize_bsl_escapes=getattr(args, 'normalize_bsl_escapes', False)
+        normalize_bsl_escapes=getattr(args, 'normalize_bsl_escapes', False),
+        config_cache=getattr(args, 'config_cache', None),
+        processor_snapshot=getattr(args, 'processor_snapshot', None),
+        deterministic_uuids=getattr(args, 'deterministic_uuids', None),
+        pin_uuids=getattr(args, 'pin_uuids', None),
     )
 
     if not processor:
@@ -262,8 +260,61 @@ def cmd_yaml(args):
     return generate_processor(args, processor)
 
 
+def cmd_build(args):
+                                                                  
+    import os
+    import time
+    from .batch_builder import (
+        discover_configs, build_configs, write_build_report, print_build_summary, REPORT_FILE_NAME,
+    )
+
+    configs = discover_configs(args.target)
+    if not configs:
+        print(f"❌ Конфігурації не знайдено: {args.target}")
+        return 1
+
+    output_dir = args.output or Path.cwd() / "tmp"
+    base_dir = Path(args.target) if Path(args.target).is_dir() else None
+    jobs = args.jobs or None
+
+    print(f"🚀 Пакетна збірка: {len(configs)} конфігурацій → {output_dir}")
+    started = time.perf_counter()
+    try:
+        results = build_configs(
+            configs,
+            output_dir,
+            jobs=jobs,
+            base_dir=base_dir,
+            dry_run=args.dry_run,
+            normalize_bsl_escapes=args.normalize_bsl_escapes,
+            form_jobs=args.form_jobs,
+            force=args.force,
+            config_cache=args.config_cache,
+            processor_snapshot=args.processor_snapshot,
+            deterministic_uuids=args.deterministic_uuids,
+            stable_ids=args.stable_element_ids,
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    total_seconds = time.perf_counter() - started
+
+    print(f"\n📊 Результати збірки:")
+    print_build_summary(results, verbose=args.verbose)
+
+    failed = sum(1 for r in results if not r.success)
+    report_path = args.report or output_dir / REPORT_FILE_NAME
+    write_build_report(results, report_path, jobs or os.cpu_count() or 1, total_seconds)
+
+    print(f"\n{'✅' if not failed else '⚠️ '} Успішно: {len(results) - failed}/{len(results)} за {total_seconds:.2f}s")
+    print(f"📄 Звіт: {report_path}")
+    return 1 if failed else 0
+
+
 def cmd_sync(args):
                                                                                 
+    from .sync_tool import run_sync
+
                           
     if not args.modified_xml.exists():
         print(f"❌ Помилка: Modified XML не знайдено: {args.modified_xml}")
@@ -308,6 +359,8 @@ def cmd_sync(args):
 
 def cmd_decompile(args):
                                                                      
+    from .pro import LicensedEPFCompiler
+
     if not args.epf_file.exists():
         print(f"❌ Помилка: Бінарний файл не знайдено: {args.epf_file}")
         sys.exit(1)
@@ -519,6 +572,8 @@ def search_features(registry: dict, query: str) -> dict:
 
 def cmd_activate(args):
                                           
+    from .pro import get_license_manager
+
     print(f"🔑 Активація ліцензії: {args.license_key[:8]}***")
     print()
 
@@ -554,6 +609,8 @@ def cmd_activate(args):
 
 def cmd_license_status(args):
                                            
+    from .pro import get_license_manager
+
     mgr = get_license_manager()
     status = mgr.get_license_status()
 
@@ -729,6 +786,8 @@ def cmd_excel2mxl(args):
 
 def cmd_trial(args):
                                                     
+    from .pro import get_license_manager
+
     print(f"🎁 Запит trial ліцензії для: {args.email}")
     print()
 
@@ -785,6 +844,8 @@ def _adjust_platform_version_for_epf(args, processor):
 
 def generate_processor(args, processor):
                                                                       
+    from .generator import ProcessorGenerator
+
                                   
     output_dir = args.output or Path.cwd() / "tmp"
 
@@ -800,7 +861,13 @@ def generate_processor(args, processor):
 
                    
     generator = ProcessorGenerator(processor)
-    processor_root = generator.generate(str(output_dir), dry_run=args.dry_run)
+    processor_root = generator.generate(
+        str(output_dir),
+        dry_run=args.dry_run,
+        jobs=getattr(args, "jobs", 1),
+        force=getattr(args, "force", False),
+        stable_ids=getattr(args, "stable_element_ids", False),
+    )
 
     if not processor_root:
         print("\n❌ Помилка генерації XML")
@@ -808,7 +875,8 @@ def generate_processor(args, processor):
 
                                            
     if args.output_format == "epf" and not args.dry_run:
-        compile_to_epf(args, processor, processor_root, output_dir, generator)
+        with span("compile_to_epf"):
+            compile_to_epf(args, processor, processor_root, output_dir, generator)
     else:
         print("\n✨ Готово!")
 
@@ -826,6 +894,9 @@ def has_validation_config(processor):
 
 def compile_to_epf(args, processor, processor_root, output_dir, generator):
                                    
+    from .metadata_analyzer import MetadataAnalyzer
+    from .pro import LicensedEPFCompiler
+
     print("\n🔧 Генерація вихідного файлу...")
 
                                                                          
@@ -855,16 +926,18 @@ def compile_to_epf(args, processor, processor_root, output_dir, generator):
         if needs_validation:
             print(f"   Виявлено налаштування валідації (синтаксична: {processor.validation.syntax_check_enabled}, семантична: {processor.validation.semantic_check_enabled})")
         print("   Використовую Configuration mode для валідації та/або підтримки метаданих...")
-        compilation_success = compiler.compile_epf_with_configuration(
-            output_dir,
-            epf_path,
-            processor,
-            requirements,
-            ignore_validation_errors=args.ignore_validation_errors
-        )
+        with span("compile_epf", mode="configuration"):
+            compilation_success = compiler.compile_epf_with_configuration(
+                output_dir,
+                epf_path,
+                processor,
+                requirements,
+                ignore_validation_errors=args.ignore_validation_errors
+            )
     else:
         print("   Метаданих не виявлено, валідація не налаштована, використовую швидкий режим компіляції...")
-        compilation_success = compiler.compile_epf(xml_root, epf_path)
+        with span("compile_epf", mode="fast"):
+            compilation_success = compiler.compile_epf(xml_root, epf_path)
 
     if compilation_success:
         print(f"\n🎉 Готово! Бінарний файл створено: {epf_path}")
@@ -873,14 +946,17 @@ def compile_to_epf(args, processor, processor_root, output_dir, generator):
                                                                           
                                                        
         print(f"\n📸 Створюю snapshot з бінарного файлу експорту...")
-        if generator.save_snapshot_from_epf(epf_path, output_dir, compiler):
+        with span("snapshot_from_epf"):
+            snapshot_saved = generator.save_snapshot_from_epf(epf_path, output_dir, compiler)
+        if snapshot_saved:
             print(f"✅ Snapshot збережено (включає Form.xml файли для sync tool)")
         else:
             print(f"⚠️  Помилка збереження snapshot (але Бінарний файл створено успішно)")
 
                                                          
         if processor.tests_config:
-            generate_tests(processor, epf_path, output_dir, args.compiler_path, compiler.last_temp_ib)
+            with span("generate_tests"):
+                generate_tests(processor, epf_path, output_dir, args.compiler_path, compiler.last_temp_ib)
     else:
         print("\n❌ Помилка генерації")
         print(f"   XML файли збережено: {processor_root}")
@@ -889,6 +965,9 @@ def compile_to_epf(args, processor, processor_root, output_dir, generator):
 
 def generate_tests(processor, epf_path, output_dir, compiler_path=None, temp_ib_path=None):
                                                              
+    from .test_generator import TestGenerator
+    from .pro import LicensedEPFCompiler
+
     if not processor.tests_config:
         return
 
@@ -1116,6 +1195,12 @@ def create_parser():
     parser_minimal.add_argument("--ignore-validation-errors", action="store_true",
                                help="Ігнорувати помилки BSL валідації під час компіляції (за замовчуванням зупиняється при помилках, v2.12.0+)")
     parser_minimal.add_argument("--dry-run", action="store_true", help="Перевірка без створення файлів")
+    parser_minimal.add_argument("--force", action="store_true",
+                               help="Перегенерувати всі файли, ігноруючи .generation_manifest.json (v2.77.0+)")
+    parser_minimal.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                               help="Кількість потоків для рендерингу форм (за замовчуванням 1, v2.77.0+)")
+    parser_minimal.add_argument("--profile", type=Path, metavar="OUT_JSON",
+                               help="Зберегти профіль етапів у форматі Chrome trace (chrome://tracing, Perfetto, v2.77.0+)")
     parser_minimal.set_defaults(func=cmd_minimal)
 
                      
@@ -1130,6 +1215,12 @@ def create_parser():
     parser_example.add_argument("--ignore-validation-errors", action="store_true",
                                help="Ігнорувати помилки BSL валідації під час компіляції (за замовчуванням зупиняється при помилках, v2.12.0+)")
     parser_example.add_argument("--dry-run", action="store_true", help="Перевірка без створення файлів")
+    parser_example.add_argument("--force", action="store_true",
+                               help="Перегенерувати всі файли, ігноруючи .generation_manifest.json (v2.77.0+)")
+    parser_example.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                               help="Кількість потоків для рендерингу форм (за замовчуванням 1, v2.77.0+)")
+    parser_example.add_argument("--profile", type=Path, metavar="OUT_JSON",
+                               help="Зберегти профіль етапів у форматі Chrome trace (chrome://tracing, Perfetto, v2.77.0+)")
     parser_example.set_defaults(func=cmd_example)
 
                   
@@ -1152,8 +1243,52 @@ def create_parser():
     parser_yaml.add_argument("--cloud", action="store_true",
                             help="Компілювати EPF через хмарний сервіс (потребує PRO ліцензію з cloud_compilation)")
     parser_yaml.add_argument("--dry-run", action="store_true", help="Перевірка без створення файлів")
+    parser_yaml.add_argument("--config-cache", nargs="?", const=True, default=None, metavar="DIR",
+                            help="Кешувати розібраний та валідований YAML (опційно вказати директорію кешу, v2.77.0+)")
+    parser_yaml.add_argument("--processor-snapshot", nargs="?", const=True, default=None, metavar="PATH",
+                            help="Повторно використовувати .processor.bin моделі, якщо вхідні файли не змінились (опційно директорія або файл, v2.77.0+)")
+    parser_yaml.add_argument("--deterministic-uuids", nargs="?", const=True, default=None, metavar="NAMESPACE",
+                            help="Виводити UUID через uuid5 з namespace та шляху об'єкта для відтворюваного виводу (v2.77.0+)")
+    parser_yaml.add_argument("--pin-uuids", type=Path, metavar="SOURCE",
+                            help="Закріпити UUID з попереднього виводу: .processor.bin, .json карта, XML обробки або _snapshot (v2.77.0+)")
+    parser_yaml.add_argument("--stable-element-ids", action="store_true",
+                            help="Зберігати ID елементів форм між генераціями (.element_ids.json), нові елементи отримують ID вище максимального (v2.77.0+)")
+    parser_yaml.add_argument("--force", action="store_true",
+                            help="Перегенерувати всі файли, ігноруючи .generation_manifest.json (v2.77.0+)")
+    parser_yaml.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                            help="Кількість потоків для рендерингу форм (за замовчуванням 1, v2.77.0+)")
+    parser_yaml.add_argument("--profile", type=Path, metavar="OUT_JSON",
+                            help="Зберегти профіль етапів у форматі Chrome trace (chrome://tracing, Perfetto, v2.77.0+)")
     parser_yaml.set_defaults(func=cmd_yaml)
 
+                   
+    parser_build = subparsers.add_parser("build",
+                                          help="Пакетна збірка багатьох YAML конфігурацій в одному процесі (v2.77.0+)")
+    parser_build.add_argument("target",
+                              help="Директорія (шукає config.yaml рекурсивно) або glob-шаблон конфігурацій")
+    parser_build.add_argument("--output", "-o", type=Path, help="Директорія для виводу (за замовчуванням ./tmp)")
+    parser_build.add_argument("--jobs", "-j", type=int, default=0, metavar="N",
+                              help="Кількість процесів (за замовчуванням кількість CPU)")
+    parser_build.add_argument("--form-jobs", type=int, default=1, metavar="N",
+                              help="Кількість потоків для рендерингу форм в кожній обробці")
+    parser_build.add_argument("--report", type=Path,
+                              help="Шлях до JSON звіту (за замовчуванням <output>/build_report.json)")
+    parser_build.add_argument("--normalize-bsl-escapes", action="store_true",
+                              help="Нормалізувати escape-послідовності (\\n→newline) в BSL запитах")
+    parser_build.add_argument("--verbose", "-v", action="store_true", help="Показати повний лог кожної конфігурації")
+    parser_build.add_argument("--dry-run", action="store_true", help="Перевірка без створення файлів")
+    parser_build.add_argument("--force", action="store_true",
+                              help="Перегенерувати всі файли, ігноруючи .generation_manifest.json (v2.77.0+)")
+    parser_build.add_argument("--config-cache", nargs="?", const=True, default=None, metavar="DIR",
+                              help="Кешувати розібраний та валідований YAML (опційно вказати директорію кешу, v2.77.0+)")
+    parser_build.add_argument("--processor-snapshot", nargs="?", const=True, default=None, metavar="DIR",
+                              help="Повторно використовувати .processor.bin моделей, якщо вхідні файли не змінились (v2.77.0+)")
+    parser_build.add_argument("--deterministic-uuids", nargs="?", const=True, default=None, metavar="NAMESPACE",
+                              help="Виводити UUID через uuid5 з namespace та шляху об'єкта для відтворюваного виводу (v2.77.0+)")
+    parser_build.add_argument("--stable-element-ids", action="store_true",
+                              help="Зберігати ID елементів форм між генераціями (.element_ids.json, v2.77.0+)")
+    parser_build.set_defaults(func=cmd_build)
+
                        
     parser_decompile = subparsers.add_parser("decompile", help="Розпакувати EPF назад в XML формат (v2.8.1+)")
     parser_decompile.add_argument("epf_file", type=Path, help="Шлях до EPF файлу для декомпіляції")
@@ -1193,7 +1328,7 @@ def create_parser():
                                 help="Показати деталі конкретної фічі")
     parser_features.add_argument("--json", "-j", action="store_true",
                                 help="Вивід у JSON форматі (для програмного використання)")
-    parser_features.set_defaults(func=cmd_features)
+    parser_features.set_defaults(func=cmd_features, background_services=False)
 
                                                
     parser_activate = subparsers.add_parser("activate",
@@ -1248,19 +1383,35 @@ def create_parser():
     return parser
 
 
-def main():
+def start_background_services():
                              
+    from .pro import check_version_in_background, send_first_run_telemetry
+
                                                              
     send_first_run_telemetry()
 
                                                            
     check_version_in_background()
 
+
+def main(argv=None):
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-                                   
-    return args.func(args)
+    if getattr(args, "background_services", True):
+        start_background_services()
+
+    profile_path = getattr(args, "profile", None)
+    if profile_path:
+        start_profiling()
+
+    try:
+        return args.func(args)
+    finally:
+        profiler = stop_profiling()
+        if profile_path and profiler:
+            profiler.write(profile_path)
+            print(f"\n⏱️  Профіль збережено: {profile_path} ({len(profiler.events)} подій)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,225 @@
+import glob
+import io
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout, redirect_stderr
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+CONFIG_FILE_NAME = "config.yaml"
+HANDLERS_FILE_NAME = "handlers.bsl"
+HANDLERS_DIR_NAME = "handlers"
+REPORT_FILE_NAME = "build_report.json"
+
+
+@dataclass
+class BuildResult:
+    config: str
+    success: bool = False
+    processor_name: Optional[str] = None
+    output: Optional[str] = None
+    error: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    log: str = ""
+
+
+def discover_configs(target: str) -> List[Path]:
+    path = Path(target)
+    if path.is_file():
+        return [path]
+    if path.is_dir():
+        return sorted(path.rglob(CONFIG_FILE_NAME))
+    return sorted(Path(p) for p in glob.glob(str(target), recursive=True) if Path(p).is_file())
+
+
+def _config_output_dir(config_path: Path, base_dir: Optional[Path], output_dir: Path) -> Path:
+    if base_dir is not None:
+        try:
+            relative = config_path.parent.resolve().relative_to(base_dir.resolve())
+            if relative.parts:
+                return output_dir / relative
+        except ValueError:
+            pass
+    return output_dir / config_path.parent.name
+
+
+def _common_base_dir(configs: List[Path]) -> Optional[Path]:
+    if len(configs) < 2:
+        return None
+    try:
+        return Path(os.path.commonpath([str(config.parent.resolve()) for config in configs]))
+    except ValueError:
+        return None
+
+
+def plan_output_dirs(configs: List[Path], output_dir: Path, base_dir: Optional[Path] = None) -> List[Path]:
+    if base_dir is None:
+        base_dir = _common_base_dir(configs)
+    planned = [_config_output_dir(config, base_dir, output_dir) for config in configs]
+
+    owners: Dict[str, List[str]] = {}
+    for config, out in zip(configs, planned):
+        owners.setdefault(os.path.normcase(str(out.resolve())), []).append(str(config))
+    duplicates = {out: names for out, names in owners.items() if len(names) > 1}
+    if duplicates:
+        lines = [f"{out}: {', '.join(names)}" for out, names in sorted(duplicates.items())]
+        raise ValueError("Кілька конфігурацій пишуть в одну директорію виводу:\n   " + "\n   ".join(lines))
+    return planned
+
+
+def _resolve_handlers(config_path: Path):
+    handlers_file = config_path.parent / HANDLERS_FILE_NAME
+    if handlers_file.is_file():
+        return None, handlers_file
+    handlers_dir = config_path.parent / HANDLERS_DIR_NAME
+    if handlers_dir.is_dir():
+        return handlers_dir, None
+    return None, None
+
+
+WARM_TEMPLATES = ("processor.xml.j2", "form_meta.xml.j2", "form.xml.j2", "template_meta.xml.j2")
+
+
+def _init_worker() -> None:
+    from .pro._gc import get_generation_context
+    from .yaml_parser import _get_schema_validator
+    from .generator import get_shared_environment
+
+    get_generation_context()
+    _get_schema_validator()
+    env = get_shared_environment()
+    for name in WARM_TEMPLATES:
+        env.get_template(name)
+
+
+def _build_one(config: str, output_dir: str, options: Dict) -> BuildResult:
+    from .yaml_parser import parse_yaml_config
+    from .generator import ProcessorGenerator
+
+    config_path = Path(config)
+    result = BuildResult(config=config)
+    log = io.StringIO()
+    started = time.perf_counter()
+
+    try:
+        with redirect_stdout(log), redirect_stderr(log):
+            handlers_dir, handlers_file = _resolve_handlers(config_path)
+
+            stage_started = time.perf_counter()
+            processor = parse_yaml_config(
+                config_path,
+                handlers_dir=handlers_dir,
+                handlers_file=handlers_file,
+                normalize_bsl_escapes=options.get("normalize_bsl_escapes", False),
+                config_cache=options.get("config_cache"),
+                processor_snapshot=options.get("processor_snapshot"),
+                deterministic_uuids=options.get("deterministic_uuids"),
+            )
+            result.timings["parse"] = round(time.perf_counter() - stage_started, 4)
+
+            if not processor:
+                result.error = "Помилка парсингу YAML"
+            else:
+                result.processor_name = processor.name
+                stage_started = time.perf_counter()
+                generator = ProcessorGenerator(processor)
+                processor_root = generator.generate(
+                    output_dir,
+                    dry_run=options.get("dry_run", False),
+                    jobs=options.get("form_jobs", 1),
+                    force=options.get("force", False),
+                    stable_ids=options.get("stable_ids", False),
+                )
+                result.timings["generate"] = round(time.perf_counter() - stage_started, 4)
+
+                if processor_root is None and not options.get("dry_run", False):
+                    result.error = "Помилка генерації XML"
+                else:
+                    result.success = True
+                    result.output = str(processor_root) if processor_root else None
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+        log.write(traceback.format_exc())
+
+    result.timings["total"] = round(time.perf_counter() - started, 4)
+    result.log = log.getvalue()
+    return result
+
+
+def build_configs(
+    configs: List[Path],
+    output_dir: Path,
+    jobs: Optional[int] = None,
+    base_dir: Optional[Path] = None,
+    dry_run: bool = False,
+    normalize_bsl_escapes: bool = False,
+    form_jobs: int = 1,
+    force: bool = False,
+    config_cache=None,
+    processor_snapshot=None,
+    deterministic_uuids=None,
+    stable_ids: bool = False,
+) -> List[BuildResult]:
+    options = {
+        "dry_run": dry_run,
+        "normalize_bsl_escapes": normalize_bsl_escapes,
+        "form_jobs": form_jobs,
+        "force": force,
+        "config_cache": config_cache,
+        "processor_snapshot": processor_snapshot,
+        "deterministic_uuids": deterministic_uuids,
+        "stable_ids": stable_ids,
+    }
+    tasks = [
+        (str(config), str(out))
+        for config, out in zip(configs, plan_output_dirs(configs, output_dir, base_dir))
+    ]
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(tasks) or 1))
+    if jobs == 1:
+        _init_worker()
+        return [_build_one(config, out, options) for config, out in tasks]
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as executor:
+        futures = [executor.submit(_build_one, config, out, options) for config, out in tasks]
+        return [future.result() for future in futures]
+
+
+def write_build_report(results: List[BuildResult], report_path: Path, jobs: int, total_seconds: float) -> None:
+    failed = [r for r in results if not r.success]
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "jobs": jobs,
+        "total": len(results),
+        "succeeded": len(results) - len(failed),
+        "failed": len(failed),
+        "total_seconds": round(total_seconds, 4),
+        "failures": [{"config": r.config, "error": r.error} for r in failed],
+        "results": [
+            {k: v for k, v in asdict(r).items() if k != "log" or not r.success}
+            for r in results
+        ],
+    }
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def print_build_summary(results: List[BuildResult], verbose: bool = False) -> None:
+    name_width = max((len(r.config) for r in results), default=0)
+    for r in results:
+        status = "✅" if r.success else "❌"
+        timing = f"{r.timings.get('total', 0.0):.2f}s"
+        details = r.processor_name or ""
+        if not r.success:
+            details = r.error or "невідома помилка"
+        print(f"   {status} {r.config:<{name_width}}  {timing:>8}  {details}")
+        if verbose or not r.success:
+            tail = r.log.strip().splitlines()[-15:] if not verbose else r.log.strip().splitlines()
+            for line in tail:
+                print(f"      │ {line}")
@@ -1,19 +1,50 @@
    
 
+import difflib
+import hashlib
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 import logging
 
+from .bsl_lexer import BSLModule, code_tokens, scan_bsl
+
 logger = logging.getLogger(__name__)
 
+SHINGLE_SIZE = 4
+SHINGLE_BASE = 1_000_003
+SHINGLE_MOD = (1 << 61) - 1
+RENAME_SIMILARITY = 0.75
+RENAME_MIN_BODY_TOKENS = 8
+
+
+def token_fingerprint(tokens: List[str]) -> str:
+    return hashlib.blake2b("\x1f".join(tokens).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def token_shingles(tokens: List[str], size: int = SHINGLE_SIZE) -> FrozenSet[int]:
+    hashes = [int.from_bytes(hashlib.blake2b(t.encode("utf-8"), digest_size=8).digest(), "little") for t in tokens]
+    if len(hashes) <= size:
+        return frozenset([int(token_fingerprint(tokens), 16) % SHINGLE_MOD]) if hashes else frozenset()
+
+    drop = pow(SHINGLE_BASE, size - 1, SHINGLE_MOD)
+    rolling = 0
+    for value in hashes[:size]:
+        rolling = (rolling * SHINGLE_BASE + value) % SHINGLE_MOD
+    shingles = {rolling}
+    for i in range(size, len(hashes)):
+        rolling = ((rolling - hashes[i - size] * drop) * SHINGLE_BASE + hashes[i]) % SHINGLE_MOD
+        shingles.add(rolling)
+    return frozenset(shingles)
+
 
 class BSLChangeType(Enum):
                                        
     PROCEDURE_ADDED = "procedure_added"
     PROCEDURE_DELETED = "procedure_deleted"
     PROCEDURE_MODIFIED = "procedure_modified"
+    PROCEDURE_RENAMED = "procedure_renamed"
     REGION_ADDED = "region_added"
     REGION_DELETED = "region_deleted"
 
@@ -28,6 +59,48 @@ class BSLProcedure:
     full_text: str                             
     line_number: int                        
     directives: List[str]                                          
+    params: str = ""
+    export: bool = False
+    is_async: bool = False
+    _tokens: Optional[List[str]] = field(default=None, repr=False, compare=False)
+    _body_size: int = field(default=0, repr=False, compare=False)
+    _fingerprint: Optional[str] = field(default=None, repr=False, compare=False)
+    _shingles: Optional[FrozenSet[int]] = field(default=None, repr=False, compare=False)
+
+    def _tokenize(self) -> None:
+        tokens = [*self.directives, "async" if self.is_async else "",
+                  "function" if self.is_function else "procedure",
+                  "(", *code_tokens(self.params), ")"]
+        if self.export:
+            tokens.append("export")
+        body = code_tokens(self.body)
+        tokens.extend(body)
+        self._body_size = len(body)
+        self._tokens = tokens
+
+    @property
+    def tokens(self) -> List[str]:
+        if self._tokens is None:
+            self._tokenize()
+        return self._tokens
+
+    @property
+    def body_size(self) -> int:
+        if self._tokens is None:
+            self._tokenize()
+        return self._body_size
+
+    @property
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = token_fingerprint(self.tokens)
+        return self._fingerprint
+
+    @property
+    def shingles(self) -> FrozenSet[int]:
+        if self._shingles is None:
+            self._shingles = token_shingles(self.tokens)
+        return self._shingles
 
     def normalize_body(self) -> str:
                    
@@ -57,6 +130,8 @@ class BSLChange:
     old_code: Optional[str] = None
     new_code: Optional[str] = None
     region_name: Optional[str] = None
+    old_procedure_name: Optional[str] = None
+    similarity: Optional[float] = None
 
     def __str__(self) -> str:
                                                    
@@ -66,6 +141,8 @@ class BSLChange:
             return f"Procedure deleted: {self.procedure_name}"
         elif self.change_type == BSLChangeType.PROCEDURE_MODIFIED:
             return f"Procedure modified: {self.procedure_name}"
+        elif self.change_type == BSLChangeType.PROCEDURE_RENAMED:
+            return f"Procedure renamed: {self.old_procedure_name} -> {self.procedure_name}"
         elif self.change_type == BSLChangeType.REGION_ADDED:
             return f"Region added: {self.region_name}"
         elif self.change_type == BSLChangeType.REGION_DELETED:
@@ -76,43 +153,29 @@ class BSLChange:
 class BSLDiffer:
            
 
-                                    
-    PROCEDURE_PATTERN = re.compile(
-        r'(?P<directives>(?:&[А-ЯЁа-яёA-Za-z]+\s*)*)'
-        r'(?P<type>Процедура|Функция)\s+'
-        r'(?P<name>[А-ЯЁа-яёA-Za-z0-9_]+)'
-        r'\s*\((?P<params>[^)]*)\)'
-        r'(?P<export>\s+Экспорт)?'
-        r'(?P<body>.*?)'
-        r'Конец(?:Процедуры|Функции)',
-        re.DOTALL | re.MULTILINE | re.IGNORECASE
-    )
-
-    REGION_PATTERN = re.compile(
-        r'#Область\s+(?P<name>[^\r\n]+)'
-        r'(?P<content>.*?)'
-        r'#КонецОбласті',
-        re.DOTALL | re.MULTILINE | re.IGNORECASE
-    )
-
     def __init__(self, original_bsl: str, modified_bsl: str):
                    
         self.original_bsl = original_bsl
         self.modified_bsl = modified_bsl
         self.changes: List[BSLChange] = []
+        self._line_diffs: Dict[str, List[str]] = {}
+
+        original_module = scan_bsl(original_bsl)
+        modified_module = scan_bsl(modified_bsl)
 
                           
-        self.original_procedures = self._parse_procedures(original_bsl)
-        self.modified_procedures = self._parse_procedures(modified_bsl)
+        self.original_procedures = self._parse_procedures(original_module)
+        self.modified_procedures = self._parse_procedures(modified_module)
 
                        
-        self.original_regions = self._parse_regions(original_bsl)
-        self.modified_regions = self._parse_regions(modified_bsl)
+        self.original_regions = self._parse_regions(original_module)
+        self.modified_regions = self._parse_regions(modified_module)
 
     def detect_changes(self) -> List[BSLChange]:
                    
         logger.info("Detecting changes in BSL code...")
         self.changes = []
+        self._line_diffs = {}
 
         self._compare_procedures()
         self._compare_regions()
@@ -125,40 +188,113 @@ class BSLDiffer:
         original_names = set(self.original_procedures.keys())
         modified_names = set(self.modified_procedures.keys())
 
+        added = [self.modified_procedures[n] for n in modified_names - original_names]
+        deleted = [self.original_procedures[n] for n in original_names - modified_names]
+        renamed = self._match_renames(deleted, added)
+        renamed_old = {old_proc.name for old_proc, _, _ in renamed}
+        renamed_new = {new_proc.name for _, new_proc, _ in renamed}
+
                                
-        added = modified_names - original_names
-        for name in added:
-            proc = self.modified_procedures[name]
+        for proc in sorted(added, key=lambda p: p.line_number):
+            if proc.name in renamed_new:
+                continue
             self.changes.append(BSLChange(
                 change_type=BSLChangeType.PROCEDURE_ADDED,
-                procedure_name=name,
+                procedure_name=proc.name,
                 new_code=proc.full_text
             ))
 
                                  
-        deleted = original_names - modified_names
-        for name in deleted:
-            proc = self.original_procedures[name]
+        for proc in sorted(deleted, key=lambda p: p.line_number):
+            if proc.name in renamed_old:
+                continue
             self.changes.append(BSLChange(
                 change_type=BSLChangeType.PROCEDURE_DELETED,
-                procedure_name=name,
+                procedure_name=proc.name,
                 old_code=proc.full_text
             ))
 
                                   
         common = original_names & modified_names
-        for name in common:
+        for name in sorted(common, key=lambda n: self.modified_procedures[n].line_number):
             orig_proc = self.original_procedures[name]
             mod_proc = self.modified_procedures[name]
 
-                                       
-            if orig_proc.normalize_body() != mod_proc.normalize_body():
-                self.changes.append(BSLChange(
-                    change_type=BSLChangeType.PROCEDURE_MODIFIED,
-                    procedure_name=name,
-                    old_code=orig_proc.full_text,
-                    new_code=mod_proc.full_text
-                ))
+            if orig_proc.full_text == mod_proc.full_text or orig_proc.fingerprint == mod_proc.fingerprint:
+                continue
+
+            self.changes.append(BSLChange(
+                change_type=BSLChangeType.PROCEDURE_MODIFIED,
+                procedure_name=name,
+                old_code=orig_proc.full_text,
+                new_code=mod_proc.full_text
+            ))
+
+        for old_proc, new_proc, similarity in renamed:
+            self.changes.append(BSLChange(
+                change_type=BSLChangeType.PROCEDURE_RENAMED,
+                procedure_name=new_proc.name,
+                old_procedure_name=old_proc.name,
+                old_code=old_proc.full_text,
+                new_code=new_proc.full_text,
+                similarity=similarity
+            ))
+
+    def _match_renames(
+        self,
+        deleted: List[BSLProcedure],
+        added: List[BSLProcedure]
+    ) -> List[Tuple[BSLProcedure, BSLProcedure, float]]:
+                   
+        deleted = [proc for proc in deleted if proc.body_size >= RENAME_MIN_BODY_TOKENS]
+        added = [proc for proc in added if proc.body_size >= RENAME_MIN_BODY_TOKENS]
+        if not deleted or not added:
+            return []
+
+        matches = []
+        by_fingerprint: Dict[str, List[BSLProcedure]] = {}
+        for proc in deleted:
+            by_fingerprint.setdefault(proc.fingerprint, []).append(proc)
+
+        unmatched_added = []
+        for proc in added:
+            candidates = by_fingerprint.get(proc.fingerprint)
+            if candidates:
+                matches.append((candidates.pop(0), proc, 1.0))
+            else:
+                unmatched_added.append(proc)
+
+        unmatched_deleted = [proc for procs in by_fingerprint.values() for proc in procs]
+        if not unmatched_deleted or not unmatched_added:
+            return matches
+
+        buckets: Dict[int, List[int]] = {}
+        for index, proc in enumerate(unmatched_deleted):
+            for shingle in proc.shingles:
+                buckets.setdefault(shingle, []).append(index)
+
+        scored = []
+        for added_index, proc in enumerate(unmatched_added):
+            shared: Dict[int, int] = {}
+            for shingle in proc.shingles:
+                for deleted_index in buckets.get(shingle, ()):
+                    shared[deleted_index] = shared.get(deleted_index, 0) + 1
+            size = len(proc.shingles)
+            for deleted_index, count in shared.items():
+                similarity = count / (size + len(unmatched_deleted[deleted_index].shingles) - count)
+                if similarity >= RENAME_SIMILARITY:
+                    scored.append((similarity, added_index, deleted_index))
+
+        used_added: Set[int] = set()
+        used_deleted: Set[int] = set()
+        for similarity, added_index, deleted_index in sorted(scored, key=lambda item: (-item[0], item[1], item[2])):
+            if added_index in used_added or deleted_index in used_deleted:
+                continue
+            used_added.add(added_index)
+            used_deleted.add(deleted_index)
+            matches.append((unmatched_deleted[deleted_index], unmatched_added[added_index], similarity))
+
+        return matches
 
     def _compare_regions(self):
                                                                  
@@ -183,57 +319,46 @@ class BSLDiffer:
                 old_code=self.original_regions[name].content
             ))
 
-    def _parse_procedures(self, code: str) -> Dict[str, BSLProcedure]:
+    def _parse_procedures(self, module: BSLModule) -> Dict[str, BSLProcedure]:
                    
         procedures = {}
+        code = module.text
 
-        for match in self.PROCEDURE_PATTERN.finditer(code):
-            directives_text = match.group('directives') or ''
-            proc_type = match.group('type')
-            name = match.group('name')
-            params = match.group('params') or ''
-            export = match.group('export') or ''
-            body = match.group('body')
+        for proc in module.procedures:
+            if not proc.terminated:
+                continue
 
-                              
-            directives = re.findall(r'&([А-ЯЁа-яёA-Za-z]+)', directives_text)
+            directives_text = code[proc.start:proc.header_start]
+            params = code[proc.params_start:proc.params_end]
+            export = code[proc.params_end + 1:proc.body_start]
 
                              
-            signature = f"{directives_text}{proc_type} {name}({params}){export}"
-
-                                     
-            full_text = match.group(0)
+            signature = f"{directives_text}{proc.keyword} {proc.name}({params}){export}"
 
-                             
-            line_number = code[:match.start()].count('\n') + 1
-
-            is_function = proc_type.lower() == 'функция'
-
-            procedures[name] = BSLProcedure(
-                name=name,
-                is_function=is_function,
+            procedures[proc.name] = BSLProcedure(
+                name=proc.name,
+                is_function=proc.is_function,
                 signature=signature,
-                body=body,
-                full_text=full_text,
-                line_number=line_number,
-                directives=directives
+                body=code[proc.body_start:proc.body_end],
+                full_text=code[proc.start:proc.end],
+                line_number=proc.line,
+                directives=proc.directive_names,
+                params=params,
+                export=proc.export,
+                is_async=proc.is_async
             )
 
         return procedures
 
-    def _parse_regions(self, code: str) -> Dict[str, BSLRegion]:
+    def _parse_regions(self, module: BSLModule) -> Dict[str, BSLRegion]:
                    
         regions = {}
 
-        for match in self.REGION_PATTERN.finditer(code):
-            name = match.group('name').strip()
-            content = match.group('content')
-            line_number = code[:match.start()].count('\n') + 1
-
-            regions[name] = BSLRegion(
-                name=name,
-                content=content,
-                line_number=line_number
+        for region in sorted(module.regions, key=lambda r: r.start):
+            regions[region.name] = BSLRegion(
+                name=region.name,
+                content=module.text[region.content_start:region.content_end],
+                line_number=region.line
             )
 
         return regions
@@ -253,6 +378,10 @@ class BSLDiffer:
         return [c for c in self.changes
                 if c.change_type == BSLChangeType.PROCEDURE_MODIFIED]
 
+    def get_renamed_procedures(self) -> List[BSLChange]:
+        return [c for c in self.changes
+                if c.change_type == BSLChangeType.PROCEDURE_RENAMED]
+
     def print_summary(self):
                                                                    
         if not self.changes:
@@ -267,6 +396,7 @@ class BSLDiffer:
         added_procs = self.get_added_procedures()
         deleted_procs = self.get_deleted_procedures()
         modified_procs = self.get_modified_procedures()
+        renamed_procs = self.get_renamed_procedures()
 
         if added_procs:
             print(f"\nADDED PROCEDURES ({len(added_procs)}):")
@@ -286,16 +416,46 @@ class BSLDiffer:
             for change in modified_procs:
                 print(f"  • {change.procedure_name}")
 
+        if renamed_procs:
+            print(f"\nRENAMED PROCEDURES ({len(renamed_procs)}):")
+            print("-" * 70)
+            for change in renamed_procs:
+                print(f"  • {change.old_procedure_name} -> {change.procedure_name} ({change.similarity:.0%})")
+
         print(f"\n{'='*70}\n")
 
-    def get_procedure_diff(self, procedure_name: str) -> Optional[tuple]:
-                   
+    def _find_code_change(self, procedure_name: str) -> Optional[BSLChange]:
         for change in self.changes:
-            if (change.change_type == BSLChangeType.PROCEDURE_MODIFIED and
-                change.procedure_name == procedure_name):
-                return (change.old_code, change.new_code)
+            if change.change_type not in (BSLChangeType.PROCEDURE_MODIFIED, BSLChangeType.PROCEDURE_RENAMED):
+                continue
+            if procedure_name in (change.procedure_name, change.old_procedure_name):
+                return change
         return None
 
+    def get_procedure_diff(self, procedure_name: str) -> Optional[tuple]:
+                   
+        change = self._find_code_change(procedure_name)
+        if change is None:
+            return None
+        return (change.old_code, change.new_code)
+
+    def get_procedure_line_diff(self, procedure_name: str) -> Optional[List[str]]:
+                   
+        change = self._find_code_change(procedure_name)
+        if change is None:
+            return None
+
+        if change.procedure_name not in self._line_diffs:
+            old_name = change.old_procedure_name or change.procedure_name
+            self._line_diffs[change.procedure_name] = list(difflib.unified_diff(
+                change.old_code.splitlines(),
+                change.new_code.splitlines(),
+                fromfile=old_name,
+                tofile=change.procedure_name,
+                lineterm=""
+            ))
+        return self._line_diffs[change.procedure_name]
+
 
 class BSLCodeExtractor:
            
@@ -4,19 +4,36 @@ import re
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+from .bsl_lexer import scan_bsl
+from .file_prefetch import InputRecorder
+
                                                      
-from .pro._gc import get_generation_context
+_GEN_CTX_KEYS = {
+    "FORM_EVENT_SIGNATURES": "form_event_signatures",
+    "ELEMENT_EVENT_SIGNATURES": "element_event_signatures",
+    "EVENT_HANDLER_TEMPLATE": "event_handler_template",
+    "SERVER_CALL_TEMPLATE": "server_call_template",
+    "SERVER_PROCEDURE_TEMPLATE": "server_procedure_template",
+    "LONG_OPERATION_CLIENT_BUTTON_TEMPLATE": "long_operation_client_button_template",
+    "LONG_OPERATION_SERVER_START_TEMPLATE": "long_operation_server_start_template",
+    "LONG_OPERATION_CLIENT_COMPLETION_TEMPLATE": "long_operation_client_completion_template",
+}
+
+_gen_ctx: Optional[Dict] = None
+
+
+def _generation_context() -> Dict:
+    global _gen_ctx
+    if _gen_ctx is None:
+        from .pro._gc import get_generation_context
+        _gen_ctx = get_generation_context()
+    return _gen_ctx
 
-                                       
-_gen_ctx = get_generation_context()
-FORM_EVENT_SIGNATURES = _gen_ctx["form_event_signatures"]
-ELEMENT_EVENT_SIGNATURES = _gen_ctx["element_event_signatures"]
-EVENT_HANDLER_TEMPLATE = _gen_ctx["event_handler_template"]
-SERVER_CALL_TEMPLATE = _gen_ctx["server_call_template"]
-SERVER_PROCEDURE_TEMPLATE = _gen_ctx["server_procedure_template"]
-LONG_OPERATION_CLIENT_BUTTON_TEMPLATE = _gen_ctx["long_operation_client_button_template"]
-LONG_OPERATION_SERVER_START_TEMPLATE = _gen_ctx["long_operation_server_start_template"]
-LONG_OPERATION_CLIENT_COMPLETION_TEMPLATE = _gen_ctx["long_operation_client_completion_template"]
+
+def __getattr__(name: str):
+    if name in _GEN_CTX_KEYS:
+        return _generation_context()[_GEN_CTX_KEYS[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class BSLInjector:
@@ -41,9 +58,11 @@ class BSLInjector:
         handlers_dir: Optional[Path] = None,
         handlers_file: Optional[Path] = None,
         normalize_escapes: bool = False,
+        inputs: Optional[InputRecorder] = None,
     ):
                    
         self.handlers_dir = None
+        self.inputs = inputs if inputs is not None else InputRecorder()
         self._loaded_handlers: Dict[str, str] = {}
         self._helper_procedures_cache: Dict[str, str] = {}                    
         self._form_handlers_cache: Dict[str, Dict[str, str]] = {}                                    
@@ -78,7 +97,7 @@ class BSLInjector:
                    
         from .bsl_splitter import BSLSplitter
 
-        bsl_file = Path(bsl_file)
+        bsl_file = self.inputs.record(bsl_file)
 
         if not bsl_file.exists():
             print(f"❌ BSL файл не знайдено: {bsl_file}")
@@ -144,7 +163,7 @@ class BSLInjector:
         if form_name in self._form_handlers_cache:
             return self._form_handlers_cache[form_name]
 
-        handlers_file = Path(handlers_file)
+        handlers_file = self.inputs.record(handlers_file)
         if not handlers_file.exists():
             print(f"❌ BSL файл для форми '{form_name}' не знайдено: {handlers_file}")
             return {}
@@ -200,7 +219,7 @@ class BSLInjector:
             return None
 
                               
-        handler_file = search_dir / f"{handler_name}.bsl"
+        handler_file = self.inputs.record(search_dir / f"{handler_name}.bsl")
 
         if not handler_file.exists():
             print(f"⚠️  BSL файл не знайдено: {handler_file}")
@@ -229,7 +248,7 @@ class BSLInjector:
             return code
 
                                     
-        return EVENT_HANDLER_TEMPLATE.format(
+        return _generation_context()["event_handler_template"].format(
             directive=event_signature["directive"],
             handler_name=handler_name,
             params=event_signature["params"],
@@ -251,7 +270,7 @@ class BSLInjector:
             if self.has_bsl_signature(client_code):
                 client_proc = client_code
             else:
-                client_proc = EVENT_HANDLER_TEMPLATE.format(
+                client_proc = _generation_context()["event_handler_template"].format(
                     directive="НаКлиенте",
                     handler_name=client_handler,
                     params=params,
@@ -259,7 +278,7 @@ class BSLInjector:
                 )
         else:
                                                          
-            client_proc = SERVER_CALL_TEMPLATE.format(
+            client_proc = _generation_context()["server_call_template"].format(
                 client_handler=client_handler,
                 params=params,
                 server_handler=server_handler,
@@ -273,7 +292,7 @@ class BSLInjector:
             else:
                                             
                 server_body = self._indent_code(server_code)
-                server_proc = SERVER_PROCEDURE_TEMPLATE.format(
+                server_proc = _generation_context()["server_procedure_template"].format(
                     server_handler=server_handler
                 ).replace(
                     "// Вставить содержимое обработчика.",
@@ -281,7 +300,7 @@ class BSLInjector:
                 )
         else:
                                                             
-            server_proc = SERVER_PROCEDURE_TEMPLATE.format(
+            server_proc = _generation_context()["server_procedure_template"].format(
                 server_handler=server_handler
             )
 
@@ -299,7 +318,7 @@ class BSLInjector:
             return code
 
         directive = "НаКлиенте" if is_client else "НаСервере"
-        return EVENT_HANDLER_TEMPLATE.format(
+        return _generation_context()["event_handler_template"].format(
             directive=directive,
             handler_name=handler_name,
             params="Команда",
@@ -344,7 +363,7 @@ class BSLInjector:
         if self.has_bsl_signature(code):
             return code
 
-        return EVENT_HANDLER_TEMPLATE.format(
+        return _generation_context()["event_handler_template"].format(
             directive=directive,
             handler_name=handler_name,
             params=params,
@@ -372,7 +391,7 @@ class BSLInjector:
                 if not hasattr(form, "events_bsl"):
                     form.events_bsl = {}
 
-                event_sig = FORM_EVENT_SIGNATURES.get(event_name)
+                event_sig = _generation_context()["form_event_signatures"].get(event_name)
                 if not event_sig:
                     print(f"⚠️  Невідома подія форми: {event_name}")
                     continue
@@ -443,7 +462,7 @@ class BSLInjector:
                 if code:
                     used_handlers.add(handler_name)
 
-                    event_sig = ELEMENT_EVENT_SIGNATURES.get(event_name)
+                    event_sig = _generation_context()["element_event_signatures"].get(event_name)
                     if not event_sig:
                         print(f"⚠️  Невідома подія елемента: {event_name}")
                         continue
@@ -471,8 +490,6 @@ class BSLInjector:
                         wrapped = self.wrap_handler_code(main_code, handler_name, event_sig)
 
                                            
-                    if not hasattr(elem, "bsl_code"):
-                        elem.bsl_code = {}
                     elem.bsl_code[event_name] = wrapped
 
                                                                
@@ -626,7 +643,7 @@ class BSLInjector:
 \t"""
 
                                                                
-            client_button_code = LONG_OPERATION_CLIENT_BUTTON_TEMPLATE.format(
+            client_button_code = _generation_context()["long_operation_client_button_template"].format(
                 command_name=cmd.name,
                 validation_call=validation_call,
                 waiting_params_code=waiting_params_code
@@ -648,7 +665,7 @@ class BSLInjector:
                 wait_initial_code = ""
 
                                                                                  
-            server_start_code = LONG_OPERATION_SERVER_START_TEMPLATE.format(
+            server_start_code = _generation_context()["long_operation_server_start_template"].format(
                 command_name=cmd.name,
                 parameters_code=parameters_code,
                 job_title=cmd.title_ru,
@@ -782,78 +799,19 @@ class BSLInjector:
 
     def _split_procedures(self, code: str) -> Tuple[str, Dict[str, str]]:
                    
+        module = scan_bsl(code)
         procedures = {}
-        preamble_lines = []                           
-        current_proc_name = None
-        current_proc_lines = []
-        depth = 0
-        found_first_procedure = False                                        
-
-                                                  
-        proc_start_pattern = re.compile(
-            r'^\s*(?:&\w+\s+)?(?:Процедура|Функция|Procedure|Function|Асинх|Async)\s+(\w+)',
-            re.IGNORECASE
-        )
-        proc_end_pattern = re.compile(
-            r'^\s*(?:КонецПроцедуры|КонецФункции|EndProcedure|EndFunction)',
-            re.IGNORECASE
-        )
-
-        lines = code.split('\n')
-
-                                                                                        
-        directive_pattern = re.compile(r'^\s*&\w+\s*$', re.IGNORECASE)
-
-        for i, line in enumerate(lines):
-                                                   
-            match = proc_start_pattern.match(line)
-            if match and depth == 0:
-                                                         
-                if current_proc_name and current_proc_lines:
-                    procedures[current_proc_name] = '\n'.join(current_proc_lines)
-
-                                                       
-                found_first_procedure = True
-
-                                                                   
-                                                                             
-                if preamble_lines and directive_pattern.match(preamble_lines[-1]):
-                    directive_line = preamble_lines.pop()
-                    current_proc_lines = [directive_line, line]
-                else:
-                    current_proc_lines = [line]
-
-                                          
-                current_proc_name = match.group(1)
-                depth = 1
-                continue
-
-                                                               
-            if not found_first_procedure:
-                preamble_lines.append(line)
-                continue
-
-                                         
-            if current_proc_name:
-                current_proc_lines.append(line)
-
-                                              
-                if proc_end_pattern.match(line):
-                    depth -= 1
-                    if depth == 0:
-                                             
-                        procedures[current_proc_name] = '\n'.join(current_proc_lines)
-                        current_proc_name = None
-                        current_proc_lines = []
-                                                                             
-                elif proc_start_pattern.match(line):
-                    depth += 1
-
-                                                          
-        if current_proc_name and current_proc_lines:
-            procedures[current_proc_name] = '\n'.join(current_proc_lines)
+        for proc in module.procedures:
+            start = module.line_start(proc.start)
+            end = module.line_end(proc.end) if proc.terminated else len(code)
+            procedures[proc.name] = code[start:end]
 
                                                                       
+        first_start = module.line_start(module.procedures[0].start) if module.procedures else len(code)
+        preamble_lines = code[:first_start].split('\n')
+        if module.procedures:
+            preamble_lines.pop()
+
                                                              
         while preamble_lines:
             last_line = preamble_lines[-1].strip()
@@ -0,0 +1,394 @@
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .line_index import LineIndex
+
+PROCEDURE_KEYWORDS = frozenset({"процедура", "функция", "procedure", "function"})
+FUNCTION_KEYWORDS = frozenset({"функция", "function"})
+END_KEYWORDS = frozenset({"конецпроцедуры", "конецфункции", "endprocedure", "endfunction"})
+VARIABLE_KEYWORDS = frozenset({"перем", "var"})
+
+REGION_START = frozenset({"область", "region"})
+REGION_END = frozenset({"конецобласти", "endregion"})
+IF_START = frozenset({"если", "if"})
+IF_BRANCH = frozenset({"иначеесли", "elsif", "иначе", "else"})
+IF_END = frozenset({"конецесли", "endif"})
+
+_DIRECTIVE = r'&[^\W\d]\w*(?:[ \t]*\([^\n]*?\))?'
+
+_TOKEN = re.compile(
+    r'(?P<preprocessor>^[ \t]*#[^\n]*)'
+    rf'|(?P<directive>^[ \t]*{_DIRECTIVE})'
+    r'|(?P<keyword>[ПпФфКкPpFfEeVv](?<![\w.].)(?:роцедура|ункция|rocedure|unction'
+    r'|онецПроцедуры|онецФункции|ndProcedure|ndFunction|ерем|ar)(?!\w))',
+    re.MULTILINE | re.IGNORECASE,
+)
+
+_LINE_LEXEME = re.compile(r'"(?:[^"]|"")*(?P<string_end>")?|\'[^\']*(?P<date_end>\')?|//')
+_VARIABLE_END = re.compile(r'//[^\n]*|;')
+_COMMENT = re.compile(r'//[^\n]*')
+
+_HEADER_PREFIX = re.compile(
+    rf'[ \t]*(?:{_DIRECTIVE}[ \t]*)*(?:(?P<async>Асинх|Async)[ \t]+)?',
+    re.IGNORECASE,
+)
+_VARIABLE_PREFIX = re.compile(rf'[ \t]*(?:{_DIRECTIVE}[ \t]*)*', re.IGNORECASE)
+_INLINE_DIRECTIVE = re.compile(_DIRECTIVE)
+_HEADER_NAME = re.compile(r'\s+(?P<name>[^\W\d]\w*)\s*\(')
+_PARAMS_TOKEN = re.compile(r'"(?:[^"]|"")*"?|\'[^\']*\'?|//[^\n]*|[();]')
+_EXPORT = re.compile(r'[ \t]+(?:Экспорт|Export)(?!\w)', re.IGNORECASE)
+_CODE_TOKEN = re.compile(r'//[^\n]*|"(?:[^"]|"")*"?|\'[^\']*\'?|\w+|[^\w\s]')
+_WHITESPACE = re.compile(r'\s+')
+_PREPROCESSOR = re.compile(r'[ \t]*#[ \t]*(?P<keyword>[^\W\d]\w*)(?P<rest>[^\n]*)')
+_CONDITION_END = re.compile(r'\s+(?:Тогда|Then)\s*$', re.IGNORECASE)
+
+
+@dataclass
+class BSLDirective:
+    name: str
+    start: int
+    end: int
+    line: int
+
+
+@dataclass
+class BSLProcedureSpan:
+    name: str
+    keyword: str
+    is_function: bool
+    is_async: bool
+    export: bool
+    directives: List[BSLDirective]
+    start: int
+    header_start: int
+    params_start: int
+    params_end: int
+    body_start: int
+    body_end: int
+    end: int
+    line: int
+    header_line: int
+    end_line: int
+    terminated: bool = True
+    end_keyword: str = ""
+
+    @property
+    def directive_names(self) -> List[str]:
+        return [d.name for d in self.directives]
+
+
+@dataclass
+class BSLRegionSpan:
+    name: str
+    start: int
+    content_start: int
+    content_end: int
+    end: int
+    line: int
+    end_line: int
+    depth: int
+
+
+@dataclass
+class BSLVariableSpan:
+    names: List[str]
+    export: bool
+    directives: List[BSLDirective]
+    start: int
+    keyword_start: int
+    end: int
+    line: int
+    end_line: int
+
+
+@dataclass
+class BSLPreprocessorBlock:
+    condition: str
+    start: int
+    end: int
+    line: int
+    end_line: int
+    branch_lines: List[int] = field(default_factory=list)
+
+
+@dataclass
+class BSLModule:
+    text: str
+    procedures: List[BSLProcedureSpan] = field(default_factory=list)
+    directives: List[BSLDirective] = field(default_factory=list)
+    regions: List[BSLRegionSpan] = field(default_factory=list)
+    variables: List[BSLVariableSpan] = field(default_factory=list)
+    preprocessor_blocks: List[BSLPreprocessorBlock] = field(default_factory=list)
+    lines: LineIndex = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.lines = LineIndex(self.text)
+
+    def find_procedure(self, name: str) -> Optional[BSLProcedureSpan]:
+        folded = name.casefold()
+        for proc in self.procedures:
+            if proc.name.casefold() == folded:
+                return proc
+        return None
+
+    def procedure_map(self, terminated_only: bool = True) -> Dict[str, BSLProcedureSpan]:
+        return {p.name: p for p in self.procedures if p.terminated or not terminated_only}
+
+    def line_start(self, offset: int) -> int:
+        return self.lines.line_start(offset)
+
+    def line_end(self, offset: int) -> int:
+        return self.lines.line_end(offset)
+
+
+def _directive_name(directive: str) -> str:
+    return directive[1:].split("(", 1)[0].strip()
+
+
+class _Scanner:
+
+    def __init__(self, text: str):
+        self.text = text
+        self.module = BSLModule(text)
+        self.line_at = self.module.lines.line
+        self._pending: List[BSLDirective] = []
+        self._proc: Optional[BSLProcedureSpan] = None
+        self._regions: List[tuple] = []
+        self._blocks: List[BSLPreprocessorBlock] = []
+
+    def scan(self) -> BSLModule:
+        text = self.text
+        pos = 0
+        search = _TOKEN.search
+        while True:
+            match = search(text, pos)
+            if match is None:
+                break
+            pos = match.end()
+            kind = match.lastgroup
+            if kind == "keyword":
+                pos = self._keyword(match)
+            elif kind == "directive":
+                self._directive(match)
+            elif kind == "preprocessor":
+                self._preprocessor(match)
+
+        if self._proc is not None:
+            proc = self._proc
+            proc.body_end = proc.end = len(text)
+            proc.end_line = self.line_at(len(text))
+            proc.terminated = False
+            self.module.procedures.append(proc)
+        return self.module
+
+    def _directive(self, match) -> None:
+        if self._proc is not None:
+            return
+        start = match.start() + match.group().index("&")
+        directive = BSLDirective(
+            name=_directive_name(self.text[start:match.end()]),
+            start=start,
+            end=match.end(),
+            line=self.line_at(start),
+        )
+        self.module.directives.append(directive)
+        self._pending.append(directive)
+
+    def _keyword(self, match) -> int:
+        word = match.group().casefold()
+        pos = match.end()
+
+        if self._proc is not None:
+            if word in END_KEYWORDS and self._in_code(match.start()):
+                proc = self._proc
+                proc.body_end = match.start()
+                proc.end = pos
+                proc.end_line = self.line_at(match.start())
+                proc.end_keyword = match.group()
+                self.module.procedures.append(proc)
+                self._proc = None
+            return pos
+
+        if word in END_KEYWORDS:
+            self._pending = []
+            return pos
+
+        line_start = self.module.lines.line_start(match.start())
+        prefix = self.text[line_start:match.start()]
+
+        if word in VARIABLE_KEYWORDS:
+            if not _VARIABLE_PREFIX.fullmatch(prefix):
+                return pos
+            return self._variable(match, prefix, line_start)
+
+        if word not in PROCEDURE_KEYWORDS:
+            return pos
+
+        prefix_match = _HEADER_PREFIX.fullmatch(prefix)
+        header = _HEADER_NAME.match(self.text, pos)
+        if prefix_match is None or header is None:
+            return pos
+
+        params_start = header.end()
+        params_end = self._params_end(params_start)
+        if params_end is None:
+            return pos
+
+        export = _EXPORT.match(self.text, params_end + 1)
+        body_start = export.end() if export else params_end + 1
+        directives = self._take_directives(prefix, line_start)
+        header_start = line_start + prefix_match.start("async") if prefix_match.group("async") else match.start()
+        start = directives[0].start if directives else header_start
+        keyword = match.group()
+        if prefix_match.group("async"):
+            keyword = f"{prefix_match.group('async')} {keyword}"
+
+        self._proc = BSLProcedureSpan(
+            name=header.group("name"),
+            keyword=keyword,
+            is_function=word in FUNCTION_KEYWORDS,
+            is_async=bool(prefix_match.group("async")),
+            export=bool(export),
+            directives=directives,
+            start=start,
+            header_start=header_start,
+            params_start=params_start,
+            params_end=params_end,
+            body_start=body_start,
+            body_end=body_start,
+            end=body_start,
+            line=self.line_at(start),
+            header_line=self.line_at(header_start),
+            end_line=0,
+        )
+        return body_start
+
+    def _take_directives(self, prefix: str, line_start: int) -> List[BSLDirective]:
+        directives, self._pending = self._pending, []
+        for inline in _INLINE_DIRECTIVE.finditer(prefix):
+            start = line_start + inline.start()
+            if directives and directives[-1].start == start:
+                continue
+            directive = BSLDirective(
+                name=_directive_name(inline.group()),
+                start=start,
+                end=line_start + inline.end(),
+                line=self.line_at(start),
+            )
+            self.module.directives.append(directive)
+            directives.append(directive)
+        return directives
+
+    def _params_end(self, pos: int) -> Optional[int]:
+        depth = 1
+        for token in _PARAMS_TOKEN.finditer(self.text, pos):
+            value = token.group()
+            if value == ";":
+                return None
+            if value == "(":
+                depth += 1
+            elif value == ")":
+                depth -= 1
+                if depth == 0:
+                    return token.start()
+        return None
+
+    def _in_code(self, pos: int) -> bool:
+        prefix = self.text[self.module.lines.line_start(pos):pos]
+        if '"' not in prefix and "'" not in prefix and "/" not in prefix and "|" not in prefix:
+            return True
+        stripped = prefix.lstrip()
+        if stripped.startswith("|"):
+            prefix = '"' + stripped[1:]
+        for lexeme in _LINE_LEXEME.finditer(prefix):
+            if lexeme.group() == "//":
+                return False
+            if lexeme.group()[0] == '"' and lexeme.group("string_end") is None:
+                return False
+            if lexeme.group()[0] == "'" and lexeme.group("date_end") is None:
+                return False
+        return True
+
+    def _variable(self, match, prefix: str, line_start: int) -> int:
+        directives = self._take_directives(prefix, line_start)
+        start = directives[0].start if directives else match.start()
+        end = None
+        for token in _VARIABLE_END.finditer(self.text, match.end()):
+            if token.group() == ";":
+                end = token.start()
+                break
+        if end is None:
+            return match.end()
+
+        names = []
+        export = False
+        declaration = _COMMENT.sub("", self.text[match.end():end])
+        for part in declaration.split(","):
+            words = part.split()
+            if not words:
+                continue
+            if len(words) > 1 and words[-1].casefold() in ("экспорт", "export"):
+                export = True
+            names.append(words[0])
+        self.module.variables.append(BSLVariableSpan(
+            names=names,
+            export=export,
+            directives=directives,
+            start=start,
+            keyword_start=match.start(),
+            end=end + 1,
+            line=self.line_at(start),
+            end_line=self.line_at(end),
+        ))
+        return end + 1
+
+    def _preprocessor(self, match) -> None:
+        self._pending = []
+        parsed = _PREPROCESSOR.match(match.group())
+        if parsed is None:
+            return
+        word = parsed.group("keyword").casefold()
+        start = match.start() + match.group().index("#")
+        line = self.line_at(start)
+
+        if word in REGION_START:
+            self._regions.append((parsed.group("rest").strip(), start, match.end(), line))
+        elif word in REGION_END:
+            if self._regions:
+                name, region_start, content_start, region_line = self._regions.pop()
+                self.module.regions.append(BSLRegionSpan(
+                    name=name,
+                    start=region_start,
+                    content_start=content_start,
+                    content_end=start,
+                    end=match.end(),
+                    line=region_line,
+                    end_line=line,
+                    depth=len(self._regions),
+                ))
+        elif word in IF_START:
+            condition = _CONDITION_END.sub("", parsed.group("rest")).strip()
+            self._blocks.append(BSLPreprocessorBlock(condition, start, match.end(), line, line))
+        elif word in IF_BRANCH:
+            if self._blocks:
+                self._blocks[-1].branch_lines.append(line)
+        elif word in IF_END:
+            if self._blocks:
+                block = self._blocks.pop()
+                block.end = match.end()
+                block.end_line = line
+                self.module.preprocessor_blocks.append(block)
+
+
+def code_tokens(text: str, start: int = 0, end: Optional[int] = None) -> List[str]:
+    tokens = _CODE_TOKEN.findall(text, start, len(text) if end is None else end)
+    return [
+        _WHITESPACE.sub(" ", token) if token[0] in "\"'" else token
+        for token in tokens
+        if not token.startswith("//")
+    ]
+
+
+def scan_bsl(text: str) -> BSLModule:
+    return _Scanner(text).scan()
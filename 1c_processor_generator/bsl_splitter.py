@@ -3,7 +3,25 @@
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+from .bsl_lexer import BSLModule, BSLProcedureSpan, scan_bsl
 from .constants import ENCODING_UTF8_BOM
+from .file_prefetch import decode_text
+
+BOM_ENCODINGS = (
+    (b"\xef\xbb\xbf", "utf-8"),
+    (b"\xff\xfe", "utf-16-le"),
+    (b"\xfe\xff", "utf-16-be"),
+)
+
+
+def decode_bsl(data: bytes) -> str:
+    for bom, encoding in BOM_ENCODINGS:
+        if data.startswith(bom):
+            return decode_text(data[len(bom):], encoding)
+    try:
+        return decode_text(data, "utf-8")
+    except UnicodeDecodeError:
+        return decode_text(data, "windows-1251")
 
 
 class BSLSplitter:
@@ -11,56 +29,21 @@ class BSLSplitter:
 
                                           
 
-                                                         
-                                                                                         
-    PROCEDURE_PATTERN = re.compile(
-        r'(?:^|\n)'                                 
-        r'((?:&[^\n]+\n)+)?'                                                     
-        r'\s*'                   
-        r'(Процедура|Функция|Procedure|Function|Асинх|Async)'                
-        r'\s+'           
-        r'(\w+)'                                    
-        r'\s*\('                     
-        r'([^)]*)'                                                 
-        r'\)'                    
-        r'(.*?)'                                        
-        r'(КонецПроцедуры|КонецФункции|EndProcedure|EndFunction)',                            
-        re.DOTALL | re.MULTILINE | re.IGNORECASE
-    )
-
                                        
     COMMENTS_BEFORE_PROCEDURE = re.compile(
         r'((?:^|\n)(?://[^\n]*\n)+)',                    
         re.MULTILINE
     )
 
-                                           
-    DOCUMENTATION_REGION_PATTERN = re.compile(
-        r'#Область\s+Документация\s*\n(.*?)\n#КонецОбласти',
-        re.DOTALL | re.IGNORECASE
-    )
+    DOCUMENTATION_REGION_NAME = re.compile(r'Документация', re.IGNORECASE)
 
-                                            
-                                                                         
-                                                           
-                                                                                          
-    OBJECT_MODULE_REGION_PATTERN = re.compile(
-        r"(?:^|\n)#(?:Область|Region)\s+(?:Модуль(?:Объекта|Об['\u0027]?єкта)|ObjectModule)\s*\n(.*?)\n#(?:КонецОбласти|EndRegion)",
-        re.DOTALL | re.IGNORECASE
+    OBJECT_MODULE_REGION_NAME = re.compile(
+        r"Модуль(?:Объекта|Об['\u0027]?єкта)|ObjectModule",
+        re.IGNORECASE
     )
 
-                                        
-                                                      
-                                                         
-                                                                                 
-    MODULE_VARIABLE_PATTERN = re.compile(
-        r'((?:^[ \t]*//[^\n]*\n)*'                                                      
-        r'(?:^[ \t]*&[^\n]+\n)?'                                     
-        r'^[ \t]*(?:Перем|Var)\s+'                                   
-        r'[^;]+;'                                                             
-        r'(?:[ \t]*//[^\n]*)?)',                                           
-        re.MULTILINE | re.IGNORECASE
-    )
+    DIRECTIVE_LINE = re.compile(r'[ \t]*&[^\n]+')
+    COMMENT_LINE = re.compile(r'[ \t]*//[^\n]*')
 
     def __init__(self, bsl_file_path: Path):
                    
@@ -71,93 +54,102 @@ class BSLSplitter:
 
                                   
         self.content = self._load_file()
+        self._module: Optional[BSLModule] = None
+        self._consumed: List[Tuple[int, int]] = []
 
     def _load_file(self) -> str:
                    
-        try:
-                                   
-            return self.bsl_file_path.read_text(encoding=ENCODING_UTF8_BOM)
-        except UnicodeDecodeError:
-                                               
-            try:
-                return self.bsl_file_path.read_text(encoding="utf-8")
-            except UnicodeDecodeError:
-                                                                     
-                return self.bsl_file_path.read_text(encoding="windows-1251")
+        return decode_bsl(self.bsl_file_path.read_bytes())
+
+    def _scan(self) -> BSLModule:
+        if self._module is None:
+            self._module = scan_bsl(self.content)
+        return self._module
+
+    def _is_consumed(self, start: int, end: int) -> bool:
+        return any(start < consumed_end and consumed_start < end for consumed_start, consumed_end in self._consumed)
+
+    def _procedures(self) -> List[BSLProcedureSpan]:
+        return [
+            proc for proc in self._scan().procedures
+            if proc.terminated and not self._is_consumed(proc.start, proc.end)
+        ]
+
+    def _take_region(self, name_pattern: re.Pattern) -> Optional[str]:
+        for region in sorted(self._scan().regions, key=lambda r: r.start):
+            if name_pattern.fullmatch(region.name) and not self._is_consumed(region.start, region.end):
+                self._consumed.append((region.start, region.end))
+                return self.content[region.content_start:region.content_end].strip()
+        return None
 
     def extract_documentation_region(self) -> Optional[str]:
                    
-        match = self.DOCUMENTATION_REGION_PATTERN.search(self.content)
+        documentation = self._take_region(self.DOCUMENTATION_REGION_NAME)
 
-        if not match:
+        if documentation is None:
             return None
 
-                                           
-        documentation = match.group(1).strip()
-
-                                                                     
-        self.content = self.content[:match.start()] + self.content[match.end():]
-
         print(f"  ✓ Витягнуто регіон Документация ({len(documentation)} символів)")
 
         return documentation
 
     def extract_object_module_region(self) -> Optional[str]:
                    
-        match = self.OBJECT_MODULE_REGION_PATTERN.search(self.content)
+        object_module_code = self._take_region(self.OBJECT_MODULE_REGION_NAME)
 
-        if not match:
+        if object_module_code is None:
             return None
 
-                                           
-        object_module_code = match.group(1).strip()
-
-                                                                     
-        self.content = self.content[:match.start()] + self.content[match.end():]
-
         print(f"  ✓ Витягнуто регіон МодульОбъекта ({len(object_module_code)} символів)")
 
         return object_module_code
 
-    def extract_module_variables(self) -> Optional[str]:
-                   
-                                                    
-        first_proc_match = self.PROCEDURE_PATTERN.search(self.content)
+    def _variable_block(self, var, floor: int) -> Tuple[int, int]:
+        content = self.content
+        module = self._scan()
+        start = module.line_start(var.keyword_start)
 
-        if first_proc_match:
-                                                                      
-            preamble = self.content[:first_proc_match.start()]
-        else:
-                                                                          
-            preamble = self.content
+        if start > floor:
+            previous = module.line_start(start - 1)
+            if previous >= floor and self.DIRECTIVE_LINE.fullmatch(content, previous, start - 1):
+                start = previous
 
-                                                   
-        var_matches = list(self.MODULE_VARIABLE_PATTERN.finditer(preamble))
+        while start > floor:
+            previous = module.line_start(start - 1)
+            if previous < floor or not self.COMMENT_LINE.fullmatch(content, previous, start - 1):
+                break
+            start = previous
 
-        if not var_matches:
-            return None
+        end = var.end
+        trailing = self.COMMENT_LINE.match(content, end)
+        if trailing and "\n" not in content[end:trailing.start()]:
+            end = trailing.end()
+        return start, end
 
-                                             
-        var_declarations = []
-        for match in var_matches:
-            var_decl = match.group(1).strip()
-            if var_decl:
-                var_declarations.append(var_decl)
+    def extract_module_variables(self) -> Optional[str]:
+                   
+                                                    
+        procedures = self._procedures()
+        preamble_end = procedures[0].start if procedures else len(self.content)
+
+        blocks = []
+        floor = 0
+        for var in self._scan().variables:
+            if var.start >= preamble_end or self._is_consumed(var.start, var.end):
+                continue
+            start, end = self._variable_block(var, floor)
+            blocks.append((start, end))
+            floor = end
+
+        var_declarations = [
+            declaration for declaration in (self.content[start:end].strip() for start, end in blocks)
+            if declaration
+        ]
 
         if not var_declarations:
             return None
 
-                                                     
-                                             
-        modified_preamble = preamble
-        for match in reversed(var_matches):                                     
-            modified_preamble = modified_preamble[:match.start()] + modified_preamble[match.end():]
-
-                                                    
-        if first_proc_match:
-            self.content = modified_preamble + self.content[first_proc_match.start():]
-        else:
-            self.content = modified_preamble
+        self._consumed.extend(blocks)
 
                                
         module_vars = '\n'.join(var_declarations)
@@ -172,13 +164,14 @@ class BSLSplitter:
         procedures = {}
 
                                        
-        for match in self.PROCEDURE_PATTERN.finditer(self.content):
-            directive = match.group(1)                       
-            proc_type = match.group(2)                         
-            proc_name = match.group(3)         
-            params = match.group(4)                
-            body = match.group(5)             
-            end_tag = match.group(6)                                     
+        content = self.content
+        for proc in self._procedures():
+            directive = "\n".join(content[d.start:d.end] for d in proc.directives) or None
+            proc_type = proc.keyword
+            proc_name = proc.name
+            params = content[proc.params_start:proc.params_end]
+            body = content[proc.params_end + 1:proc.body_end]
+            end_tag = proc.end_keyword
 
                                            
             full_code = self._assemble_procedure(
@@ -261,7 +254,7 @@ class BSLSplitter:
 
                                           
         try:
-            content = bsl_file.read_text(encoding=ENCODING_UTF8_BOM)
+            content = decode_bsl(bsl_file.read_bytes())
             if not content.strip():
                 return False, f"Файл порожній: {bsl_file}"
         except Exception as e:
@@ -31,12 +31,15 @@ class BSLUpdate:
     procedure_name: str
     old_code: Optional[str] = None
     new_code: Optional[str] = None
+    old_procedure_name: Optional[str] = None
 
     def __str__(self) -> str:
         if self.update_type == "add":
             return f"BSL: Add procedure '{self.procedure_name}'"
         elif self.update_type == "delete":
             return f"BSL: Delete procedure '{self.procedure_name}'"
+        elif self.update_type == "rename":
+            return f"BSL: Rename procedure '{self.old_procedure_name}' → '{self.procedure_name}'"
         else:
             return f"BSL: Modify procedure '{self.procedure_name}'"
 
@@ -67,10 +70,10 @@ class StructuralUpdate:
 class ChangeMapper:
            
 
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, config: Optional[dict] = None):
                    
         self.config_path = config_path
-        self.config = self._load_config(config_path)
+        self.config = config if config is not None else self._load_config(config_path)
 
     def _load_config(self, config_path: str) -> dict:
                                     
@@ -162,6 +165,15 @@ class ChangeMapper:
                 new_code=change.new_code
             )
 
+        elif change.change_type == BSLChangeType.PROCEDURE_RENAMED:
+            return BSLUpdate(
+                update_type="rename",
+                procedure_name=change.procedure_name,
+                old_code=change.old_code,
+                new_code=change.new_code,
+                old_procedure_name=change.old_procedure_name
+            )
+
         return None
 
                                                                  
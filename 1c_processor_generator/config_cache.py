@@ -0,0 +1,107 @@
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+CONFIG_CACHE_VERSION = 1
+CONFIG_CACHE_SUFFIX = ".config.pickle"
+
+
+def user_cache_dir(name: str) -> Path:
+    from . import __version__
+
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "1c_processor_generator" / name / __version__
+
+
+def yaml_loader(fast: bool = False):
+    import yaml
+
+    if fast:
+        return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.SafeLoader
+
+
+def load_yaml_bytes(data: bytes, fast: bool = False):
+    import yaml
+
+    return yaml.load(data.decode("utf-8"), Loader=yaml_loader(fast))
+
+
+def load_yaml_bytes_fast(data: bytes):
+    return load_yaml_bytes(data, fast=True)
+
+
+def load_yaml_file(path: Path, fast: bool = False):
+    return load_yaml_bytes(Path(path).read_bytes(), fast)
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class ConfigCache:
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else user_cache_dir("config")
+
+    def _entry_path(self, yaml_path: Path, root_hash: str) -> Path:
+        from . import __version__
+
+        key = hashlib.sha256(
+            f"{CONFIG_CACHE_VERSION}\0{__version__}\0{Path(yaml_path).resolve()}\0{root_hash}".encode("utf-8")
+        ).hexdigest()
+        return self.cache_dir / f"{key}{CONFIG_CACHE_SUFFIX}"
+
+    def load(self, yaml_path: Path, root_hash: str) -> Optional[Dict]:
+        entry_path = self._entry_path(yaml_path, root_hash)
+        try:
+            with open(entry_path, "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get("root_hash") != root_hash:
+            return None
+
+        for include_path, expected in entry.get("include_hashes", {}).items():
+            try:
+                if content_hash(Path(include_path).read_bytes()) != expected:
+                    return None
+            except OSError:
+                return None
+        return entry
+
+    def save(
+        self,
+        yaml_path: Path,
+        root_hash: str,
+        config: Dict,
+        warnings: List[str],
+        includes: Dict[str, Dict],
+        include_hashes: Dict[str, str],
+    ) -> None:
+        entry = {
+            "root_hash": root_hash,
+            "config": config,
+            "warnings": warnings,
+            "includes": includes,
+            "include_hashes": include_hashes,
+        }
+        entry_path = self._entry_path(yaml_path, root_hash)
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except (OSError, pickle.PicklingError):
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
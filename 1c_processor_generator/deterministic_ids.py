@@ -0,0 +1,233 @@
+import hashlib
+import json
+import uuid
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+DEFAULT_UUID_NAMESPACE = uuid.UUID("6f1c0a52-9d3e-5b7a-8c41-1c0de9e7a001")
+
+MD_NS = "{http://v8.1c.ru/8.3/MDClasses}"
+XR_NS = "{http://v8.1c.ru/8.3/xcf/readable}"
+
+_GENERATED_TYPE_FIELDS = {
+    "Object": ("type_id", "value_id"),
+    "TabularSection": ("type_id", "value_id"),
+    "TabularSectionRow": ("row_type_id", "row_value_id"),
+}
+
+
+def resolve_namespace(namespace: Union[bool, str, uuid.UUID, None] = None) -> uuid.UUID:
+    if namespace is None or namespace is True:
+        return DEFAULT_UUID_NAMESPACE
+    if isinstance(namespace, uuid.UUID):
+        return namespace
+    try:
+        return uuid.UUID(str(namespace))
+    except ValueError:
+        return uuid.uuid5(DEFAULT_UUID_NAMESPACE, str(namespace))
+
+
+def processor_namespace(processor, namespace: Union[bool, str, uuid.UUID, None] = None) -> uuid.UUID:
+    return uuid.uuid5(resolve_namespace(namespace), processor.name)
+
+
+def stable_uuid(namespace: uuid.UUID, path: str) -> str:
+    return str(uuid.uuid5(namespace, path))
+
+
+def _label(item: Any, index: int) -> str:
+    label = getattr(item, "name", None)
+    if label is None or not isinstance(label, str):
+        label = getattr(item, "id", None)
+    return str(label) if label is not None and label != "" else str(index)
+
+
+def iter_uuid_fields(processor) -> Iterator[Tuple[str, Any, str]]:
+    seen = set()
+    stack = [("", processor)]
+    while stack:
+        path, obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+
+        for name in getattr(type(obj), "__lazy_uuids__", ()):
+            yield f"{path}#{name}", obj, name
+
+        children = []
+        for f in fields(obj):
+            value = getattr(obj, f.name, None) if f.name not in getattr(type(obj), "__lazy_uuids__", ()) else None
+            prefix = f"{path}/{f.name}" if path else f.name
+            if isinstance(value, (list, tuple)):
+                labels: Dict[str, int] = {}
+                for index, item in enumerate(value):
+                    if not is_dataclass(item) or isinstance(item, type):
+                        continue
+                    label = _label(item, index)
+                    occurrence = labels.get(label, 0)
+                    labels[label] = occurrence + 1
+                    if occurrence:
+                        label = f"{label}~{occurrence}"
+                    children.append((f"{prefix}:{label}", item))
+            elif is_dataclass(value) and not isinstance(value, type):
+                children.append((prefix, value))
+        stack.extend(reversed(children))
+
+
+def collect_uuids(processor) -> Dict[str, str]:
+    return {path: getattr(obj, name) for path, obj, name in iter_uuid_fields(processor)}
+
+
+def assign_uuids(processor, namespace: Optional[uuid.UUID] = None, pinned: Optional[Dict[str, str]] = None) -> Tuple[int, int]:
+    pinned = pinned or {}
+    derived = reused = 0
+    for path, obj, name in iter_uuid_fields(processor):
+        value = pinned.get(path)
+        if value is not None:
+            reused += 1
+        elif namespace is not None:
+            value = stable_uuid(namespace, path)
+            derived += 1
+        else:
+            continue
+        setattr(obj, name, value)
+    return derived, reused
+
+
+def uuid_policy(namespace: Optional[uuid.UUID], pinned: Optional[Dict[str, str]]) -> Optional[str]:
+    if namespace is None and not pinned:
+        return None
+    pins = hashlib.sha256(json.dumps(pinned or {}, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+    return f"{namespace or 'random'}+pins:{pins}"
+
+
+def _text(element, tag: str) -> Optional[str]:
+    child = element.find(tag)
+    return child.text.strip() if child is not None and child.text else None
+
+
+def _internal_info_ids(element, prefix: str, pins: Dict[str, str]) -> None:
+    info = element.find(f"{MD_NS}InternalInfo")
+    if info is None:
+        return
+    object_id = _text(info, f"{XR_NS}ContainedObject/{XR_NS}ObjectId")
+    if object_id and not prefix:
+        pins["#object_id"] = object_id
+    for generated in info.findall(f"{XR_NS}GeneratedType"):
+        names = _GENERATED_TYPE_FIELDS.get(generated.get("category", ""))
+        if not names:
+            continue
+        type_id = _text(generated, f"{XR_NS}TypeId")
+        value_id = _text(generated, f"{XR_NS}ValueId")
+        if type_id:
+            pins[f"{prefix}#{names[0]}"] = type_id
+        if value_id:
+            pins[f"{prefix}#{names[1]}"] = value_id
+
+
+def _child_metadata_uuid(path: Path, tag: str) -> Optional[str]:
+    import xml.etree.ElementTree as ET
+
+    try:
+        element = ET.parse(path).getroot().find(f"{MD_NS}{tag}")
+    except (OSError, ET.ParseError):
+        return None
+    return element.get("uuid") if element is not None else None
+
+
+def pinned_uuids_from_xml(xml_path: Path) -> Dict[str, str]:
+    import xml.etree.ElementTree as ET
+
+    try:
+        root = ET.parse(xml_path).getroot().find(f"{MD_NS}ExternalDataProcessor")
+    except (OSError, ET.ParseError) as e:
+        print(f"⚠️  Не вдалося прочитати UUID з {xml_path}: {e}")
+        return {}
+    if root is None:
+        return {}
+
+    pins: Dict[str, str] = {}
+    if root.get("uuid"):
+        pins["#main_uuid"] = root.get("uuid")
+    _internal_info_ids(root, "", pins)
+
+    processor_name = _text(root, f"{MD_NS}Properties/{MD_NS}Name")
+    children = root.find(f"{MD_NS}ChildObjects")
+    if children is None:
+        return pins
+
+    for attribute in children.findall(f"{MD_NS}Attribute"):
+        name = _text(attribute, f"{MD_NS}Properties/{MD_NS}Name")
+        if name and attribute.get("uuid"):
+            pins[f"attributes:{name}#uuid"] = attribute.get("uuid")
+
+    for section in children.findall(f"{MD_NS}TabularSection"):
+        name = _text(section, f"{MD_NS}Properties/{MD_NS}Name")
+        if not name:
+            continue
+        prefix = f"tabular_sections:{name}"
+        if section.get("uuid"):
+            pins[f"{prefix}#uuid"] = section.get("uuid")
+        _internal_info_ids(section, prefix, pins)
+        for column in section.findall(f"{MD_NS}ChildObjects/{MD_NS}Attribute"):
+            column_name = _text(column, f"{MD_NS}Properties/{MD_NS}Name")
+            if column_name and column.get("uuid"):
+                pins[f"{prefix}/columns:{column_name}#uuid"] = column.get("uuid")
+
+    processor_dir = Path(xml_path).parent / (processor_name or Path(xml_path).stem)
+    for tag, folder, field_prefix in (("Form", "Forms", "forms"), ("Template", "Templates", "templates")):
+        for child in children.findall(f"{MD_NS}{tag}"):
+            name = (child.text or "").strip()
+            if not name:
+                continue
+            child_uuid = _child_metadata_uuid(processor_dir / folder / f"{name}.xml", tag)
+            if child_uuid:
+                pins[f"{field_prefix}:{name}#uuid"] = child_uuid
+    return pins
+
+
+def load_pinned_uuids(source: Union[str, Path]) -> Dict[str, str]:
+    source = Path(source)
+    if source.is_dir():
+        candidates = [source / "original.xml", *sorted(source.glob("*.xml"))]
+        source = next((c for c in candidates if c.is_file()), source)
+
+    if source.suffix == ".bin":
+        from .model_snapshot import read_snapshot
+
+        processor = read_snapshot(source)
+        if processor is None:
+            print(f"⚠️  Snapshot моделі недоступний або застарів: {source}")
+            return {}
+        return collect_uuids(processor)
+
+    if source.suffix == ".json":
+        try:
+            with open(source, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Не вдалося прочитати карту UUID {source}: {e}")
+            return {}
+        return {str(k): str(v) for k, v in data.items()} if isinstance(data, dict) else {}
+
+    if source.suffix == ".xml":
+        return pinned_uuids_from_xml(source)
+
+    print(f"⚠️  Невідоме джерело UUID для закріплення: {source}")
+    return {}
+
+
+def apply_uuid_policy(
+    processor,
+    deterministic: Union[bool, str, uuid.UUID, None] = None,
+    pin_from: Union[str, Path, None] = None,
+) -> None:
+    namespace = processor_namespace(processor, deterministic) if deterministic else None
+    pinned = load_pinned_uuids(pin_from) if pin_from else {}
+    derived, reused = assign_uuids(processor, namespace, pinned)
+    processor.uuid_policy = uuid_policy(namespace, pinned)
+    if namespace is not None:
+        print(f"🔒 Детерміновані UUID: {derived} виведено, {reused} закріплено (namespace {namespace})")
+    elif pinned:
+        print(f"🔒 Закріплено UUID з {pin_from}: {reused}")
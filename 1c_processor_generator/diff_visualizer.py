@@ -101,7 +101,7 @@ class DiffVisualizer:
             lines.append("\n[-] Procedure to be deleted:")
             lines.extend(self._format_bsl_code(old_code, prefix="  - ", start_line=1))
 
-        elif operation == "modify" and old_code and new_code:
+        elif operation in ("modify", "rename") and old_code and new_code:
             lines.append("\n[~] Procedure modifications:")
             diff_lines = self._compute_line_diff(old_code, new_code)
             lines.extend(self._format_diff_lines(diff_lines))
@@ -0,0 +1,149 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .id_allocator import ElementIDMap
+
+ELEMENT_IDS_FILE_NAME = ".element_ids.json"
+ELEMENT_IDS_VERSION = 1
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _element_id(element) -> Optional[int]:
+    value = element.get("id")
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _owned_ids(element, owned: List[int]) -> None:
+    for child in element:
+        if _local_name(child.tag) == "ChildItems":
+            continue
+        child_id = _element_id(child)
+        if child_id is not None:
+            owned.append(child_id)
+        _owned_ids(child, owned)
+
+
+def _column_name(table: str, name: str) -> str:
+    return name[len(table):] if name.startswith(table) and len(name) > len(table) else name
+
+
+def _collect_items(
+    container,
+    ids: Dict[str, Tuple[int, int]],
+    occupied: List[int],
+    aliases: Dict[str, str],
+    table: Optional[str] = None,
+) -> None:
+    for item in container:
+        item_id = _element_id(item)
+        name = item.get("name")
+        tag = _local_name(item.tag)
+        owned: List[int] = []
+        _owned_ids(item, owned)
+        if item_id is not None:
+            occupied.append(item_id)
+            occupied.extend(owned)
+            if name and item_id >= 0:
+                size = max([item_id, *(value for value in owned if value > item_id)]) - item_id + 1
+                key = f"{tag}:{name}"
+                ids[key] = (item_id, size)
+                if table is not None:
+                    aliases.setdefault(f"TableColumn:{_column_name(table, name)}", key)
+        for child in item:
+            if _local_name(child.tag) == "ChildItems":
+                _collect_items(child, ids, occupied, aliases, name if tag == "Table" else None)
+
+
+def element_ids_from_form_xml(path: Path) -> Optional[ElementIDMap]:
+    import xml.etree.ElementTree as ET
+
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError):
+        return None
+
+    ids: Dict[str, Tuple[int, int]] = {}
+    occupied: List[int] = []
+    aliases: Dict[str, str] = {}
+    for section in root:
+        name = _local_name(section.tag)
+        if name == "ChildItems":
+            _collect_items(section, ids, occupied, aliases)
+        elif name == "AutoCommandBar":
+            _owned_ids(section, occupied)
+            for child in section:
+                if _local_name(child.tag) == "ChildItems":
+                    _collect_items(child, ids, occupied, aliases)
+    return ElementIDMap(ids, occupied=(value for value in occupied if value >= 0), aliases=aliases)
+
+
+class ElementIDStore:
+
+    def __init__(self, processor_root: Path, processor_dir: Path, snapshot_dir: Optional[Path] = None):
+        self.path = Path(processor_root) / ELEMENT_IDS_FILE_NAME
+        self.processor_dir = Path(processor_dir)
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir else None
+        self.forms: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, processor_root: Path, processor_dir: Path, snapshot_dir: Optional[Path] = None) -> "ElementIDStore":
+        store = cls(processor_root, processor_dir, snapshot_dir)
+        try:
+            with open(store.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return store
+        if isinstance(data, dict) and data.get("version") == ELEMENT_IDS_VERSION:
+            store.forms = data.get("forms") or {}
+        return store
+
+    def _form_xml_candidates(self, form_name: str) -> List[Path]:
+        candidates = [self.processor_dir / "Forms" / form_name / "Ext" / "Form.xml"]
+        if self.snapshot_dir is not None:
+            candidates.append(self.snapshot_dir / "Forms" / form_name / "Ext" / "Form.xml")
+        return candidates
+
+    def id_map(self, form_name: str) -> ElementIDMap:
+        entry = self.forms.get(form_name)
+        if entry:
+            ids = {key: (int(value[0]), int(value[1])) for key, value in (entry.get("ids") or {}).items()}
+            return ElementIDMap(ids, next_id=int(entry.get("next_id", 1)))
+
+        for candidate in self._form_xml_candidates(form_name):
+            if candidate.exists():
+                id_map = element_ids_from_form_xml(candidate)
+                if id_map is not None:
+                    return id_map
+        return ElementIDMap()
+
+    def update(self, form_name: str, id_map: ElementIDMap) -> None:
+        entry = {
+            "next_id": id_map.next_id,
+            "ids": {key: list(value) for key, value in sorted(id_map.allocated.items(), key=lambda item: item[1])},
+        }
+        with self._lock:
+            self.forms[form_name] = entry
+
+    def save(self, form_names: Optional[List[str]] = None) -> None:
+        forms = self.forms
+        if form_names is not None:
+            forms = {name: forms[name] for name in form_names if name in forms}
+        payload = {"version": ELEMENT_IDS_VERSION, "forms": forms}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️  Не вдалося зберегти карту ID елементів {self.path}: {e}")
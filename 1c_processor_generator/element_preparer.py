@@ -8,9 +8,9 @@ from .pro._ep import ElementPreparerImpl
 class ElementPreparer:
            
 
-    def __init__(self, processor):
+    def __init__(self, processor, allocator_cls: type = IDAllocator):
                                          
-        self._impl = ElementPreparerImpl(processor, IDAllocator)
+        self._impl = ElementPreparerImpl(processor, allocator_cls)
         self._processor = processor
 
     @property
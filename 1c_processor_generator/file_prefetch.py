@@ -0,0 +1,96 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Iterable, Optional
+
+DEFAULT_PREFETCH_WORKERS = 8
+
+
+def _read_bytes(path: Path) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def decode_text(data: bytes, encoding: str = "utf-8") -> str:
+    return data.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+
+
+class InputRecorder:
+
+    def __init__(self):
+        self.paths: Dict[str, Path] = {}
+        self._lock = threading.Lock()
+
+    def record(self, path: Path) -> Path:
+        path = Path(path)
+        try:
+            key = path.resolve().as_posix()
+        except OSError:
+            key = path.absolute().as_posix()
+        with self._lock:
+            self.paths.setdefault(key, path)
+        return path
+
+
+class FilePrefetcher:
+
+    def __init__(self, max_workers: int = DEFAULT_PREFETCH_WORKERS, cache=None, inputs: Optional[InputRecorder] = None):
+        self.max_workers = max_workers
+        self.inputs = inputs
+        self._read = cache.read_bytes if cache is not None else _read_bytes
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        try:
+            return str(Path(path).resolve())
+        except OSError:
+            return str(Path(path).absolute())
+
+    def _submit(self, key: Hashable, func: Callable, *args) -> None:
+        with self._lock:
+            if key in self._futures:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="prefetch"
+                )
+            self._futures[key] = self._executor.submit(func, *args)
+
+    def prefetch(self, paths: Iterable[Path]) -> int:
+        submitted = 0
+        for path in paths:
+            key = self._key(path)
+            if key not in self._futures:
+                self._submit(key, self._read, Path(path))
+                submitted += 1
+        return submitted
+
+    def prefetch_call(self, key: Hashable, func: Callable, *args) -> None:
+        self._submit(("call", key), func, *args)
+
+    def read_bytes(self, path: Path) -> bytes:
+        if self.inputs is not None:
+            self.inputs.record(path)
+        future = self._futures.get(self._key(path))
+        if future is None:
+            return self._read(Path(path))
+        return future.result()
+
+    def read_text(self, path: Path, encoding: str = "utf-8") -> str:
+        return decode_text(self.read_bytes(path), encoding)
+
+    def call(self, key: Hashable, func: Callable, *args):
+        future = self._futures.get(("call", key))
+        if future is None:
+            return func(*args)
+        return future.result()
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._futures.clear()
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,27 @@
+from typing import Dict, Iterable, List
+
+
+def _first_by_name(items: Iterable) -> Dict[str, object]:
+    result = {}
+    for item in items or []:
+        result.setdefault(item.name, item)
+    return result
+
+
+class FormIndex:
+
+    def __init__(self, form):
+        self.form = form
+        self.form_attributes = _first_by_name(form.form_attributes)
+
+        self.dynamic_list_tables: Dict[str, List] = {}
+        for elem in form.elements:
+            if (
+                elem.element_type == "Table"
+                and elem.properties.get("is_dynamic_list", False)
+                and elem.tabular_section
+            ):
+                self.dynamic_list_tables.setdefault(elem.tabular_section, []).append(elem)
+
+    def has_dynamic_list_table(self, list_name: str) -> bool:
+        return list_name in self.dynamic_list_tables
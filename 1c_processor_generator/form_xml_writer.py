@@ -0,0 +1,58 @@
+import re
+from typing import Iterable, Iterator
+
+
+FORM_XML_CHUNK_SIZE = 64 * 1024
+
+_TAG_BREAK_PATTERN = re.compile(r'(>)(\t|<)')
+_BLANK_LINES_PATTERN = re.compile(r'\n\n\n+')
+
+
+def normalize_form_xml(content: str) -> str:
+    content = _TAG_BREAK_PATTERN.sub(r'\1\n\2', content)
+    return _BLANK_LINES_PATTERN.sub('\n', content)
+
+
+def _split_safe(text: str):
+    cut = len(text)
+    while cut and text[cut - 1] == "\n":
+        cut -= 1
+    if cut == len(text) and cut and text[cut - 1] == ">":
+        cut -= 1
+    return text[:cut], text[cut:]
+
+
+def iter_normalized_form_xml(chunks: Iterable[str], chunk_size: int = FORM_XML_CHUNK_SIZE) -> Iterator[str]:
+    buffer = []
+    buffered = 0
+    pending = ""
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered < chunk_size:
+            continue
+
+        head, pending = _split_safe(pending + "".join(buffer))
+        buffer.clear()
+        buffered = 0
+        if head:
+            yield normalize_form_xml(head)
+
+    tail = pending + "".join(buffer)
+    if tail:
+        yield normalize_form_xml(tail)
+
+
+class CharCounter:
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = chunks
+        self.count = 0
+
+    def __iter__(self) -> Iterator[str]:
+        for chunk in self._chunks:
+            self.count += len(chunk)
+            yield chunk
@@ -0,0 +1,49 @@
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from .form_index import FormIndex
+
+
+class GenerationArtifacts:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._form_module_code: Dict[str, str] = {}
+        self._object_module_code: Optional[str] = None
+        self._form_outputs: Dict[str, Dict[str, Path]] = {}
+        self._form_indexes: Dict[int, FormIndex] = {}
+
+    def form_index(self, form) -> FormIndex:
+        index = self._form_indexes.get(id(form))
+        if index is None or index.form is not form:
+            index = FormIndex(form)
+            with self._lock:
+                self._form_indexes[id(form)] = index
+        return index
+
+    def form_module_code(self, form, factory: Callable) -> str:
+        code = self._form_module_code.get(form.name)
+        if code is None:
+            code = factory(form)
+            with self._lock:
+                code = self._form_module_code.setdefault(form.name, code)
+        return code
+
+    def object_module_code(self, factory: Callable) -> str:
+        if self._object_module_code is None:
+            self._object_module_code = factory()
+        return self._object_module_code
+
+    def record_form_output(self, form_name: str, kind: str, path: Path) -> None:
+        with self._lock:
+            self._form_outputs.setdefault(form_name, {})[kind] = Path(path)
+
+    def form_output(self, form_name: str, kind: str) -> Optional[Path]:
+        return self._form_outputs.get(form_name, {}).get(kind)
+
+    def combined_form_module_code(self, forms, factory: Callable) -> str:
+        combined_bsl = ""
+        for form in forms:
+            combined_bsl += self.form_module_code(form, factory) + "\n\n"
+        return combined_bsl.strip()
@@ -0,0 +1,190 @@
+import codecs
+import hashlib
+import json
+import os
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+
+MANIFEST_FILE_NAME = ".generation_manifest.json"
+MANIFEST_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def _volatile_fields(cls) -> frozenset:
+    from .models import LAZY_UUID
+
+    return frozenset(
+        f.name for f in fields(cls)
+        if f.metadata.get(LAZY_UUID)
+    )
+
+
+def canonicalize(obj: Any, _seen: Optional[set] = None) -> Any:
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, bytes):
+        return {"__bytes__": hashlib.sha256(obj).hexdigest()}
+    if isinstance(obj, Path):
+        return obj.as_posix()
+    if isinstance(obj, dict):
+        return {str(k): canonicalize(v, _seen) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [canonicalize(v, _seen) for v in obj]
+    if isinstance(obj, (set, frozenset)):
+        return sorted((canonicalize(v, _seen) for v in obj), key=repr)
+
+    _seen = _seen if _seen is not None else set()
+    if id(obj) in _seen:
+        return {"__ref__": type(obj).__name__}
+    _seen.add(id(obj))
+    try:
+        if is_dataclass(obj):
+            skip = _volatile_fields(type(obj))
+            values = getattr(obj, "__dict__", None)
+            if values is None:
+                values = {f.name: getattr(obj, f.name) for f in fields(obj) if f.name not in skip}
+            return {
+                "__type__": type(obj).__name__,
+                **{k: canonicalize(v, _seen) for k, v in values.items() if k not in skip},
+            }
+        if hasattr(obj, "__dict__"):
+            return {
+                "__type__": type(obj).__name__,
+                **{k: canonicalize(v, _seen) for k, v in vars(obj).items()},
+            }
+        return repr(obj)
+    finally:
+        _seen.discard(id(obj))
+
+
+def fingerprint(*parts: Any) -> str:
+    payload = json.dumps(canonicalize(list(parts)), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path: Path) -> Optional[str]:
+    try:
+        return hash_bytes(Path(path).read_bytes())
+    except OSError:
+        return None
+
+
+def encode_text(content: str, encoding: str) -> bytes:
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    return content.encode(encoding)
+
+
+def encode_chunks(chunks: Iterable[str], encoding: str) -> Iterator[bytes]:
+    encoder = codecs.getincrementalencoder(encoding)()
+    for chunk in chunks:
+        if os.linesep != "\n":
+            chunk = chunk.replace("\n", os.linesep)
+        data = encoder.encode(chunk)
+        if data:
+            yield data
+    data = encoder.encode("", final=True)
+    if data:
+        yield data
+
+
+class GenerationManifest:
+
+    def __init__(self, root: Path, generator_version: str):
+        self.root = Path(root)
+        self.generator_version = generator_version
+        self.previous: Dict[str, Dict] = {}
+        self.artifacts: Dict[str, Dict] = {}
+
+    @property
+    def path(self) -> Path:
+        return self.root / MANIFEST_FILE_NAME
+
+    @classmethod
+    def load(cls, root: Path, generator_version: str) -> "GenerationManifest":
+        manifest = cls(root, generator_version)
+        try:
+            data = json.loads(manifest.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return manifest
+
+        if (
+            data.get("manifest_version") == MANIFEST_VERSION
+            and data.get("generator_version") == generator_version
+        ):
+            manifest.previous = data.get("artifacts", {})
+        return manifest
+
+    def is_up_to_date(self, key: str, inputs: str) -> bool:
+        entry = self.previous.get(key)
+        if not entry or entry.get("inputs") != inputs:
+            return False
+        outputs = entry.get("outputs", {})
+        if not outputs:
+            return False
+        return all(
+            file_hash(self.root / rel_path) == digest
+            for rel_path, digest in outputs.items()
+        )
+
+    def keep(self, key: str) -> None:
+        self.artifacts[key] = self.previous[key]
+
+    def begin(self, key: str, inputs: str) -> None:
+        self.artifacts[key] = {"inputs": inputs, "outputs": {}}
+
+    def write(self, key: str, path: Path, data: bytes, force: bool = False) -> bool:
+        path = Path(path)
+        digest = hash_bytes(data)
+        written = force or file_hash(path) != digest
+        if written:
+            path.write_bytes(data)
+
+        self._record(key, path, digest)
+        return written
+
+    def write_stream(self, key: str, path: Path, chunks: Iterable[bytes], force: bool = False) -> bool:
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        hasher = hashlib.sha256()
+        try:
+            with open(tmp_path, "wb") as f:
+                for data in chunks:
+                    hasher.update(data)
+                    f.write(data)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        digest = hasher.hexdigest()
+
+        written = force or file_hash(path) != digest
+        if written:
+            os.replace(tmp_path, path)
+        else:
+            tmp_path.unlink()
+
+        self._record(key, path, digest)
+        return written
+
+    def _record(self, key: str, path: Path, digest: str) -> None:
+        try:
+            rel_path = path.resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            rel_path = path.as_posix()
+        self.artifacts.setdefault(key, {"inputs": None, "outputs": {}})["outputs"][rel_path] = digest
+
+    def save(self) -> None:
+        data = {
+            "manifest_version": MANIFEST_VERSION,
+            "generator_version": self.generator_version,
+            "artifacts": {key: self.artifacts[key] for key in sorted(self.artifacts)},
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -2,9 +2,11 @@
 
 import os
 import shutil
+import threading
+from contextlib import nullcontext
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, BaseLoader, TemplateNotFound
-from typing import Optional
+from jinja2 import Environment, FileSystemLoader, BaseLoader, TemplateNotFound, FileSystemBytecodeCache
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from .models import Processor
 from .constants import (
@@ -25,8 +27,12 @@ from .pro._gc import get_generation_context, finalize_module
 from .validators import ProcessorValidator
 from .assertion_helper import get_test_infrastructure_bsl, should_add_test_infrastructure
 from .post_validator import PostGenerationValidator
-from .id_allocator import IDAllocator
+from .id_allocator import IDAllocator, StableIDAllocator
 from .element_preparer import ElementPreparer
+from .form_xml_writer import iter_normalized_form_xml, CharCounter
+from .generation_artifacts import GenerationArtifacts
+from .output_sink import OutputSink, MemorySink, create_archive_sink
+from .profiling import Profiler, get_profiler, profile as profile_session, span
 
 
 class _EmbeddedTemplateLoader(BaseLoader):
@@ -46,6 +52,45 @@ class _EmbeddedTemplateLoader(BaseLoader):
         return self._file_loader.get_source(environment, template)
 
 
+_shared_env: Optional[Environment] = None
+_shared_env_lock = threading.Lock()
+
+
+def _get_bytecode_cache_dir() -> Path:
+    from .config_cache import user_cache_dir
+
+    return user_cache_dir("jinja")
+
+
+def _create_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    if os.environ.get("PROCESSOR_GENERATOR_NO_BYTECODE_CACHE"):
+        return None
+    try:
+        cache_dir = _get_bytecode_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return FileSystemBytecodeCache(str(cache_dir))
+    except OSError:
+        return None
+
+
+def get_shared_environment() -> Environment:
+    global _shared_env
+
+    if _shared_env is None:
+        with _shared_env_lock:
+            if _shared_env is None:
+                template_dir = Path(__file__).parent / "templates"
+                env = Environment(
+                    loader=_EmbeddedTemplateLoader(template_dir),
+                    trim_blocks=True,
+                    lstrip_blocks=True,
+                    bytecode_cache=_create_bytecode_cache(),
+                )
+                env.filters['x'] = ProcessorGenerator._xml_escape
+                _shared_env = env
+    return _shared_env
+
+
 class ProcessorGenerator:
                                         
 
@@ -57,15 +102,18 @@ class ProcessorGenerator:
         self._gen_ctx = get_generation_context()
 
                                                                                  
-        template_dir = Path(__file__).parent / "templates"
-        self.env = Environment(
-            loader=_EmbeddedTemplateLoader(template_dir),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-                                                                             
-                                                                
-        self.env.filters['x'] = self._xml_escape
+        self.env = get_shared_environment()
+
+        self._manifest = None
+        self._fingerprints: Dict[str, str] = {}
+        self._force = False
+        self.artifacts = GenerationArtifacts()
+        self._sink = None
+        self._element_ids = None
+        self._sink_root: Optional[Path] = None
+        self._sink_lock = threading.Lock()
+        self._buffer_streams = False
+        self.profile: Optional[Profiler] = None
 
     @staticmethod
     def _xml_escape(value):
@@ -105,6 +153,11 @@ class ProcessorGenerator:
         validator = ProcessorValidator(self.processor)
         is_valid, errors, warnings = validator.validate()
 
+        if self.profile is not None:
+            print(f"⏱️  Найповільніші правила валідації ({validator.rules.nodes} елементів):")
+            for line in validator.rule_report():
+                print(f"   {line}")
+
         if warnings:
             print("⚠️  Попередження:")
             for warning in warnings:
@@ -704,34 +757,40 @@ class ProcessorGenerator:
                     try:
                                                                    
                         items_dir = form_ext_dir / "Items" / elem_name
-                        items_dir.mkdir(parents=True, exist_ok=True)
+                        if self._sink is None:
+                            items_dir.mkdir(parents=True, exist_ok=True)
 
-                                               
                         output_png = items_dir / "Picture.png"
 
-                                                                                               
-                                                                                        
                         width = elem_properties.get('svg_width') or elem_properties.get('width')
                         height = elem_properties.get('svg_height') or elem_properties.get('height')
 
-                                               
                         logger.debug(f"{'  ' * level}   Converting: {svg_path} → {output_png}")
-                        converter.convert_svg_to_png(
-                            svg_path=str(svg_path),
-                            output_path=str(output_png),
-                            width=width,
-                            height=height,
-                            dpi=96
-                        )
-
-                                                               
-                        try:
-                            new_size = converter.optimize_size(str(output_png), max_size_kb=100)
-                            logger.debug(
-                                f"{'  ' * level}   PNG size: {new_size / 1024:.1f} KB"
+                        if self._sink is not None:
+                            png_data = converter.convert_svg_to_png_bytes(
+                                svg_path=str(svg_path),
+                                width=width,
+                                height=height,
+                                dpi=96,
+                                max_size_kb=100
+                            )
+                            self._write_binary_output(output_png, png_data)
+                        else:
+                            converter.convert_svg_to_png(
+                                svg_path=str(svg_path),
+                                output_path=str(output_png),
+                                width=width,
+                                height=height,
+                                dpi=96
                             )
-                        except Exception as e:
-                            logger.debug(f"{'  ' * level}   PNG optimization skipped: {e}")
+
+                            try:
+                                new_size = converter.optimize_size(str(output_png), max_size_kb=100)
+                                logger.debug(
+                                    f"{'  ' * level}   PNG size: {new_size / 1024:.1f} KB"
+                                )
+                            except Exception as e:
+                                logger.debug(f"{'  ' * level}   PNG optimization skipped: {e}")
 
                                                                                 
                         del elem_properties['svg_source']
@@ -918,296 +977,520 @@ class ProcessorGenerator:
 
         return True
 
-    def generate(self, output_dir: str, dry_run: bool = False, save_snapshot: bool = True) -> Optional[Path]:
-                   
-                   
-        if not self.validate():
-            return None
+    def _render_form(self, form, processor_dir: Path, dry_run: bool) -> List[Tuple[Path, Union[str, Iterable[str]]]]:
+        form_name = form.name
 
-        if dry_run:
-            print("\n🔍 DRY RUN MODE - файли не будуть створені\n")
+                                            
+        forms_dir_for_form = processor_dir / "Forms" / form_name
+        form_ext_dir_for_form = forms_dir_for_form / "Ext" / "Form"
 
-        output_path = Path(output_dir)
-        processor_name = self.processor.name
+        if not dry_run:
+            if self._sink is None:
+                forms_dir_for_form.mkdir(parents=True, exist_ok=True)
+                form_ext_dir_for_form.mkdir(parents=True, exist_ok=True)
 
-                                                               
-        processor_root = output_path / processor_name
+                                                                            
+                                                                                                   
+            config_dir = Path(self.processor.config_dir) if hasattr(self.processor, 'config_dir') and self.processor.config_dir else None
+            with span("form.pictures"):
+                self._generate_local_pictures(form, form_ext_dir_for_form, config_dir)
 
-        if not dry_run:
-            processor_root.mkdir(parents=True, exist_ok=True)
+                                                                              
+        with span("form.prepare_elements"):
+            id_map = self._element_ids.id_map(form_name) if self._element_ids is not None else None
+            allocator_cls = StableIDAllocator.bind(id_map) if id_map is not None else IDAllocator
+            preparer = ElementPreparer(self.processor, allocator_cls=allocator_cls)
+            form_elements, next_id = preparer.prepare_form_elements(form)
+                                                   
+            auto_command_bar_elements, _ = preparer.prepare_auto_command_bar(form, next_id)
+            if id_map is not None:
+                self._element_ids.update(form_name, id_map)
 
-                                      
-        processor_dir = processor_root / processor_name
-        ext_dir = processor_dir / "Ext"
+                                
+        with span("form.module_code"):
+            form_module_code = self.artifacts.form_module_code(form, self._generate_form_module_code)
 
-        if not dry_run:
-            for dir_path in [processor_dir, ext_dir]:
-                dir_path.mkdir(parents=True, exist_ok=True)
+                                            
+        commands = []
+        for idx, cmd in enumerate(form.commands, start=1):
+            cmd_data = {
+                "id": idx,
+                "name": cmd.name,
+                "title_ru": cmd.title_ru,
+                "title_uk": cmd.title_uk,
+                "action": cmd.action,
+                "tooltip_ru": cmd.tooltip_ru,
+                "tooltip_uk": cmd.tooltip_uk,
+                "picture": cmd.picture,
+                "shortcut": cmd.shortcut,
+            }
+            commands.append(cmd_data)
 
-        print(f"📁 {'[DRY RUN] Структура папок:' if dry_run else 'Створення структури папок:'} {processor_root}")
+                                              
+        value_table_attributes = []
+        next_attr_id = 2                    
+        for vt_attr in form.value_table_attributes:
+                                     
+            columns_with_id = []
+            for idx, col in enumerate(vt_attr.columns, start=1):
+                col_data = {
+                    "id": idx,
+                    "name": col.name,
+                    "type": col.type,
+                    "synonym_ru": col.synonym_ru,
+                    "synonym_uk": col.synonym_uk,
+                    "length": col.length,
+                    "digits": col.digits,
+                    "fraction_digits": col.fraction_digits,
+                }
+                columns_with_id.append(col_data)
+
+            vt_data = {
+                "id": next_attr_id,
+                "name": vt_attr.name,
+                "title_ru": vt_attr.title_ru,
+                "title_uk": vt_attr.title_uk,
+                "columns": columns_with_id,
+            }
+            value_table_attributes.append(vt_data)
+            next_attr_id += 1
 
-                                                          
-        print(f"📝 {'[DRY RUN] Генерація' if dry_run else 'Генерація'} головного XML файлу...")
-        template = self.env.get_template("processor.xml.j2")
-        content = template.render(
+                                                        
+        value_tree_attributes = []
+        for vt_attr in form.value_tree_attributes:
+                                     
+            columns_with_id = []
+            for idx, col in enumerate(vt_attr.columns, start=1):
+                col_data = {
+                    "id": idx,
+                    "name": col.name,
+                    "type": col.type,
+                    "synonym_ru": col.synonym_ru,
+                    "synonym_uk": col.synonym_uk,
+                    "synonym_en": col.synonym_en,
+                    "length": col.length,
+                    "digits": col.digits,
+                    "fraction_digits": col.fraction_digits,
+                }
+                columns_with_id.append(col_data)
+
+            vt_data = {
+                "id": next_attr_id,
+                "name": vt_attr.name,
+                "title_ru": vt_attr.title_ru,
+                "title_uk": vt_attr.title_uk,
+                "title_en": vt_attr.title_en,
+                "columns": columns_with_id,
+            }
+            value_tree_attributes.append(vt_data)
+            next_attr_id += 1
+
+                                                            
+        form_attributes_list = []
+        for fa_attr in form.form_attributes:
+            from .constants import TYPE_MAPPING
+
+                                                                              
+            xml_type = TYPE_MAPPING.get(fa_attr.type, fa_attr.type)
+
+            fa_data = {
+                "id": next_attr_id,
+                "name": fa_attr.name,
+                "type": fa_attr.type,                                             
+                "xml_type": xml_type,                                                  
+                "title_ru": fa_attr.title_ru,
+                "title_uk": fa_attr.title_uk,
+                "title_en": fa_attr.title_en,
+            }
+
+                                                  
+            if fa_attr.type == "planner":
+                fa_data["time_scale"] = fa_attr.time_scale or "Hour"
+                fa_data["time_scale_interval"] = fa_attr.time_scale_interval
+                fa_data["time_scale_format"] = fa_attr.time_scale_format or 'DF="HH:mm"'
+                fa_data["display_current_date"] = fa_attr.display_current_date
+                fa_data["show_weekends"] = fa_attr.show_weekends
+
+            form_attributes_list.append(fa_data)
+            next_attr_id += 1
+
+                                               
+        form_index = self.artifacts.form_index(form)
+        dynamic_list_attributes = []
+        for dl_attr in form.dynamic_list_attributes:
+                                                                   
+            has_table = form_index.has_dynamic_list_table(dl_attr.name)
+
+            dl_data = {
+                "id": next_attr_id,
+                "name": dl_attr.name,
+                "title_ru": dl_attr.title_ru,
+                "title_uk": dl_attr.title_uk,
+                "manual_query": dl_attr.manual_query,
+                "main_table": dl_attr.main_table,
+                "query_text": dl_attr.query_text,
+                "key_fields": dl_attr.key_fields,
+                "use_always_fields": dl_attr.use_always_fields if has_table else [],
+                "functional_options": dl_attr.functional_options,
+                "auto_save_user_settings": dl_attr.auto_save_user_settings,
+                "main_attribute": dl_attr.main_attribute,
+                "dynamic_data_read": bool(dl_attr.main_table),
+                                                                   
+                "filter_setting_id": dl_attr.filter_setting_id,
+                "order_setting_id": dl_attr.order_setting_id,
+                "appearance_setting_id": dl_attr.appearance_setting_id,
+                "items_setting_id": dl_attr.items_setting_id,
+            }
+            dynamic_list_attributes.append(dl_data)
+            next_attr_id += 1
+
+                                               
+        command_pictures = {cmd["name"]: cmd.get("picture") for cmd in commands if cmd.get("picture")}
+
+                                              
+        with span("form.render_meta"):
+            template = self.env.get_template("form_meta.xml.j2")
+            content = template.render(
+                processor=self.processor,
+                namespaces=self._render_namespaces(XML_NAMESPACES),
+                version=self.processor.platform_version,
+                form=form,
+            )
+
+        forms_root_dir = processor_dir / "Forms"
+        form_meta_xml = forms_root_dir / f"{form_name}.xml"
+        outputs = [(form_meta_xml, content)]
+
+                                              
+        template = self.env.get_template("form.xml.j2")
+        chunks = template.generate(
             processor=self.processor,
-            namespaces=self._render_namespaces(XML_NAMESPACES),
+            commands=commands,
+            command_pictures=command_pictures,
+            form_elements=form_elements,
+            auto_command_bar_elements=auto_command_bar_elements,
+            form_attributes=form_attributes_list,
+            value_table_attributes=value_table_attributes,
+            value_tree_attributes=value_tree_attributes,            
+            dynamic_list_attributes=dynamic_list_attributes,
+            namespaces=self._render_namespaces(FORM_XML_NAMESPACES),
             version=self.processor.platform_version,
-            class_id=CLASS_ID_EXTERNAL_DATA_PROCESSOR,
+            form=form,
         )
 
-        main_xml = processor_root / f"{processor_name}.xml"
-        if not dry_run:
-                                                              
-            main_xml.write_text(content, encoding=ENCODING_UTF8_BOM)
-        print(f"   {'📄' if dry_run else '✅'} {main_xml} ({len(content)} bytes)")
+        form_xml = form_ext_dir_for_form.parent / "Form.xml"
+        outputs.append((form_xml, iter_normalized_form_xml(chunks)))
 
-                             
-        print(f"📝 {'[DRY RUN] Генерація' if dry_run else 'Генерація'} модуля об'єкта...")
-        object_module = ext_dir / "ObjectModule.bsl"
-                                                                     
-        if self.processor.object_module_bsl:
-            object_module_code = self.processor.object_module_bsl
-        else:
-            object_module_code = self._generate_object_module_code()
-        if not dry_run:
-            object_module.write_text(object_module_code, encoding=ENCODING_UTF8_BOM)
-        print(f"   {'📄' if dry_run else '✅'} {object_module} ({len(object_module_code)} bytes)")
+                                             
+        form_module = form_ext_dir_for_form / "Module.bsl"
+        outputs.append((form_module, form_module_code))
+
+        for kind, (path, _) in zip(("form_meta", "form_xml", "module"), outputs):
+            self.artifacts.record_form_output(form_name, kind, path)
+        return outputs
+
+    def _generate_form(self, form, processor_dir: Path, dry_run: bool) -> List[str]:
+        with span(f"form:{form.name}", category="form"):
+            outputs = self._render_form(form, processor_dir, dry_run)
+            return self._write_form_outputs(f"form:{form.name}", outputs, dry_run)
+
+    def _write_form_outputs(self, artifact_key: str, outputs, dry_run: bool) -> List[str]:
+        report = []
+        for path, content in outputs:
+            if isinstance(content, str):
+                if not dry_run:
+                    with span("form.write", file=path.name):
+                        self._write_output(artifact_key, path, content)
+                size = len(content)
+            else:
+                counter = CharCounter(content)
+                with span("form.render_stream", file=path.name):
+                    if dry_run:
+                        for _ in counter:
+                            pass
+                    else:
+                        self._write_stream_output(artifact_key, path, counter)
+                size = counter.count
+            report.append(f"   {'📄' if dry_run else '✅'} {path} ({size} bytes)")
+        return report
+
+    def _sink_path(self, path: Path) -> str:
+        return Path(os.path.relpath(path, self._sink_root)).as_posix()
+
+    def _write_binary_output(self, path: Path, data: bytes) -> None:
+        with self._sink_lock:
+            self._sink.write_bytes(self._sink_path(path), data)
+
+    def _write_stream_output(self, artifact_key: str, path: Path, chunks: Iterable[str], encoding: str = ENCODING_UTF8_BOM) -> None:
+        if self._sink is not None:
+            from .generation_manifest import encode_chunks
+
+            data = encode_chunks(chunks, encoding)
+            if self._buffer_streams:
+                data = [b"".join(data)]
+            with self._sink_lock:
+                self._sink.write_stream(self._sink_path(path), data)
+            return
+
+        if self._manifest is None:
+            with open(path, "w", encoding=encoding) as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            return
+
+        from .generation_manifest import encode_chunks
+        self._manifest.write_stream(artifact_key, path, encode_chunks(chunks, encoding), force=self._force)
+
+    def _write_output(self, artifact_key: str, path: Path, content: str, encoding: str = ENCODING_UTF8_BOM) -> None:
+        if self._sink is not None:
+            from .generation_manifest import encode_text
+            self._write_binary_output(path, encode_text(content, encoding))
+            return
+
+        if self._manifest is None:
+            path.write_text(content, encoding=encoding)
+            return
+
+        from .generation_manifest import encode_text
+        self._manifest.write(artifact_key, path, encode_text(content, encoding), force=self._force)
+
+    def _write_template_output(self, template, path: Path, content: str, encoding: str) -> None:
+        self._write_output(f"template:{template.name}", path, content, encoding)
+
+    def _compute_input_fingerprints(self, generator_version: str, stable_ids: bool = False) -> Dict[str, str]:
+        from .generation_manifest import canonicalize, fingerprint, file_hash
+
+        processor = self.processor
+        shared = canonicalize(processor)
+        shared.pop("forms", None)
+        shared.pop("templates", None)
+        form_names = [form.name for form in processor.forms]
+        templates = canonicalize(processor.templates)
+        id_allocator = (StableIDAllocator if stable_ids else IDAllocator).__name__
+
+        config_dir = Path(processor.config_dir) if getattr(processor, 'config_dir', None) else None
+
+        def svg_hashes(elements, result):
+            for elem in elements:
+                props = elem.properties or {}
+                svg_source = props.get('svg_source')
+                if svg_source:
+                    svg_path = Path(svg_source)
+                    if not svg_path.is_absolute() and config_dir:
+                        svg_path = config_dir / svg_source
+                    result[str(svg_source)] = file_hash(svg_path)
+                svg_hashes(elem.child_items or props.get('child_items') or [], result)
+            return result
 
-                                       
-        forms_to_generate = self.processor.forms
+        fingerprints = {
+            "processor": fingerprint(generator_version, shared, form_names, templates),
+        }
+        for form in processor.forms:
+            fingerprints[f"form:{form.name}"] = fingerprint(
+                generator_version, shared, form_names, templates, form, svg_hashes(form.elements, {}),
+                id_allocator,
+            )
+        for template in processor.templates:
+            fingerprints[f"template:{template.name}"] = fingerprint(
+                generator_version, processor.platform_version, template,
+            )
+        return fingerprints
 
-        if forms_to_generate:
-            for form in forms_to_generate:
-                form_name = form.name
-                print(f"\n📝 Генерація форми '{form_name}'...")
+    def _artifact_up_to_date(self, artifact_key: str) -> bool:
+        if self._manifest is None:
+            return False
 
-                                                    
-                forms_dir_for_form = processor_dir / "Forms" / form_name
-                form_ext_dir_for_form = forms_dir_for_form / "Ext" / "Form"
+        inputs = self._fingerprints[artifact_key]
+        if not self._force and self._manifest.is_up_to_date(artifact_key, inputs):
+            self._manifest.keep(artifact_key)
+            return True
 
-                if not dry_run:
-                    forms_dir_for_form.mkdir(parents=True, exist_ok=True)
-                    form_ext_dir_for_form.mkdir(parents=True, exist_ok=True)
+        self._manifest.begin(artifact_key, inputs)
+        return False
 
-                                                                                    
-                                                                                                           
-                    config_dir = Path(self.processor.config_dir) if hasattr(self.processor, 'config_dir') and self.processor.config_dir else None
-                    self._generate_local_pictures(form, form_ext_dir_for_form, config_dir)
+    def generate(
+        self,
+        output_dir: str,
+        dry_run: bool = False,
+        save_snapshot: bool = True,
+        jobs: int = 1,
+        force: bool = False,
+        sink: Optional[OutputSink] = None,
+        stable_ids: bool = False,
+        profile: bool = False,
+    ) -> Optional[Path]:
+                   
+        session = profile_session() if profile and get_profiler() is None else nullcontext()
+        with session:
+            self.profile = get_profiler()
+            with span("generate", processor=self.processor.name):
+                return self._generate(output_dir, dry_run, save_snapshot, jobs, force, sink, stable_ids)
 
-                                                                                      
-                preparer = ElementPreparer(self.processor)
-                form_elements, next_id = preparer.prepare_form_elements(form)
-                                                       
-                auto_command_bar_elements, _ = preparer.prepare_auto_command_bar(form, next_id)
+    def generate_profiled(self, output_dir: str, **kwargs) -> Tuple[Optional[Path], Profiler]:
+        processor_root = self.generate(output_dir, profile=True, **kwargs)
+        return processor_root, self.profile
 
-                                        
-                form_module_code = self._generate_form_module_code(form)
+    def _generate(
+        self,
+        output_dir: str,
+        dry_run: bool,
+        save_snapshot: bool,
+        jobs: int,
+        force: bool,
+        sink: Optional[OutputSink],
+        stable_ids: bool = False,
+    ) -> Optional[Path]:
+                   
+        with span("validate"):
+            is_valid = self.validate()
+        if not is_valid:
+            return None
 
-                                                    
-                commands = []
-                for idx, cmd in enumerate(form.commands, start=1):
-                    cmd_data = {
-                        "id": idx,
-                        "name": cmd.name,
-                        "title_ru": cmd.title_ru,
-                        "title_uk": cmd.title_uk,
-                        "action": cmd.action,
-                        "tooltip_ru": cmd.tooltip_ru,
-                        "tooltip_uk": cmd.tooltip_uk,
-                        "picture": cmd.picture,
-                        "shortcut": cmd.shortcut,
-                    }
-                    commands.append(cmd_data)
-
-                                                      
-                value_table_attributes = []
-                next_attr_id = 2                    
-                for vt_attr in form.value_table_attributes:
-                                             
-                    columns_with_id = []
-                    for idx, col in enumerate(vt_attr.columns, start=1):
-                        col_data = {
-                            "id": idx,
-                            "name": col.name,
-                            "type": col.type,
-                            "synonym_ru": col.synonym_ru,
-                            "synonym_uk": col.synonym_uk,
-                            "length": col.length,
-                            "digits": col.digits,
-                            "fraction_digits": col.fraction_digits,
-                        }
-                        columns_with_id.append(col_data)
-
-                    vt_data = {
-                        "id": next_attr_id,
-                        "name": vt_attr.name,
-                        "title_ru": vt_attr.title_ru,
-                        "title_uk": vt_attr.title_uk,
-                        "columns": columns_with_id,
-                    }
-                    value_table_attributes.append(vt_data)
-                    next_attr_id += 1
+        self._sink = sink if not dry_run else None
+        self._sink_root = Path(output_dir)
+        write_to_disk = not dry_run and self._sink is None
 
-                                                                
-                value_tree_attributes = []
-                for vt_attr in form.value_tree_attributes:
-                                             
-                    columns_with_id = []
-                    for idx, col in enumerate(vt_attr.columns, start=1):
-                        col_data = {
-                            "id": idx,
-                            "name": col.name,
-                            "type": col.type,
-                            "synonym_ru": col.synonym_ru,
-                            "synonym_uk": col.synonym_uk,
-                            "synonym_en": col.synonym_en,
-                            "length": col.length,
-                            "digits": col.digits,
-                            "fraction_digits": col.fraction_digits,
-                        }
-                        columns_with_id.append(col_data)
-
-                    vt_data = {
-                        "id": next_attr_id,
-                        "name": vt_attr.name,
-                        "title_ru": vt_attr.title_ru,
-                        "title_uk": vt_attr.title_uk,
-                        "title_en": vt_attr.title_en,
-                        "columns": columns_with_id,
-                    }
-                    value_tree_attributes.append(vt_data)
-                    next_attr_id += 1
+        if dry_run:
+            print("\n🔍 DRY RUN MODE - файли не будуть створені\n")
 
-                                                                    
-                form_attributes_list = []
-                for fa_attr in form.form_attributes:
-                    from .constants import TYPE_MAPPING
+        output_path = Path(output_dir)
+        processor_name = self.processor.name
 
-                                                                                      
-                    xml_type = TYPE_MAPPING.get(fa_attr.type, fa_attr.type)
-
-                    fa_data = {
-                        "id": next_attr_id,
-                        "name": fa_attr.name,
-                        "type": fa_attr.type,                                             
-                        "xml_type": xml_type,                                                  
-                        "title_ru": fa_attr.title_ru,
-                        "title_uk": fa_attr.title_uk,
-                        "title_en": fa_attr.title_en,
-                    }
+                                                               
+        processor_root = output_path / processor_name
 
-                                                          
-                    if fa_attr.type == "planner":
-                        fa_data["time_scale"] = fa_attr.time_scale or "Hour"
-                        fa_data["time_scale_interval"] = fa_attr.time_scale_interval
-                        fa_data["time_scale_format"] = fa_attr.time_scale_format or 'DF="HH:mm"'
-                        fa_data["display_current_date"] = fa_attr.display_current_date
-                        fa_data["show_weekends"] = fa_attr.show_weekends
+        if write_to_disk:
+            processor_root.mkdir(parents=True, exist_ok=True)
 
-                    form_attributes_list.append(fa_data)
-                    next_attr_id += 1
+                                      
+        processor_dir = processor_root / processor_name
+        ext_dir = processor_dir / "Ext"
 
-                                                       
-                dynamic_list_attributes = []
-                for dl_attr in form.dynamic_list_attributes:
-                                                                           
-                    has_table = any(
-                        elem.element_type == "Table"
-                        and elem.properties.get("is_dynamic_list", False)
-                        and elem.tabular_section == dl_attr.name
-                        for elem in form.elements
-                    )
+        if write_to_disk:
+            for dir_path in [processor_dir, ext_dir]:
+                dir_path.mkdir(parents=True, exist_ok=True)
 
-                    dl_data = {
-                        "id": next_attr_id,
-                        "name": dl_attr.name,
-                        "title_ru": dl_attr.title_ru,
-                        "title_uk": dl_attr.title_uk,
-                        "manual_query": dl_attr.manual_query,
-                        "main_table": dl_attr.main_table,
-                        "query_text": dl_attr.query_text,
-                        "key_fields": dl_attr.key_fields,
-                        "use_always_fields": dl_attr.use_always_fields if has_table else [],
-                        "functional_options": dl_attr.functional_options,
-                        "auto_save_user_settings": dl_attr.auto_save_user_settings,
-                        "main_attribute": dl_attr.main_attribute,
-                        "dynamic_data_read": bool(dl_attr.main_table),
-                                                                           
-                        "filter_setting_id": dl_attr.filter_setting_id,
-                        "order_setting_id": dl_attr.order_setting_id,
-                        "appearance_setting_id": dl_attr.appearance_setting_id,
-                        "items_setting_id": dl_attr.items_setting_id,
-                    }
-                    dynamic_list_attributes.append(dl_data)
-                    next_attr_id += 1
+        print(f"📁 {'[DRY RUN] Структура папок:' if dry_run else 'Створення структури папок:'} {processor_root}")
 
-                                                       
-                command_pictures = {cmd["name"]: cmd.get("picture") for cmd in commands if cmd.get("picture")}
+        self._force = force
+        self._manifest = None
+        self.artifacts = GenerationArtifacts()
+        self._fingerprints = {}
+        if write_to_disk:
+            from . import __version__
+            from .generation_manifest import GenerationManifest
+
+            with span("manifest.load"):
+                self._manifest = GenerationManifest.load(processor_root, __version__)
+                self._fingerprints = self._compute_input_fingerprints(__version__, stable_ids)
+
+        self._element_ids = None
+        if stable_ids:
+            from .element_id_store import ElementIDStore
 
-                                                      
-                template = self.env.get_template("form_meta.xml.j2")
+            self._element_ids = ElementIDStore.load(
+                processor_root, processor_dir, output_path / "_snapshot" / processor_name
+            )
+
+        main_xml = processor_root / f"{processor_name}.xml"
+        object_module = ext_dir / "ObjectModule.bsl"
+        skipped_artifacts = 0
+
+        if self._artifact_up_to_date("processor"):
+            skipped_artifacts += 1
+            print(f"⏭️  Головний XML та модуль об'єкта без змін - пропущено")
+        else:
+            with span("processor"):
+                                                              
+                print(f"📝 {'[DRY RUN] Генерація' if dry_run else 'Генерація'} головного XML файлу...")
+                template = self.env.get_template("processor.xml.j2")
                 content = template.render(
                     processor=self.processor,
                     namespaces=self._render_namespaces(XML_NAMESPACES),
                     version=self.processor.platform_version,
-                    form=form,
+                    class_id=CLASS_ID_EXTERNAL_DATA_PROCESSOR,
                 )
 
-                forms_root_dir = processor_dir / "Forms"
-                form_meta_xml = forms_root_dir / f"{form_name}.xml"
                 if not dry_run:
-                                                                      
-                    form_meta_xml.write_text(content, encoding=ENCODING_UTF8_BOM)
-                print(f"   {'📄' if dry_run else '✅'} {form_meta_xml} ({len(content)} bytes)")
+                                                                  
+                    self._write_output("processor", main_xml, content)
+                print(f"   {'📄' if dry_run else '✅'} {main_xml} ({len(content)} bytes)")
 
-                                                      
-                template = self.env.get_template("form.xml.j2")
-                content = template.render(
-                    processor=self.processor,
-                    commands=commands,
-                    command_pictures=command_pictures,
-                    form_elements=form_elements,
-                    auto_command_bar_elements=auto_command_bar_elements,
-                    form_attributes=form_attributes_list,
-                    value_table_attributes=value_table_attributes,
-                    value_tree_attributes=value_tree_attributes,            
-                    dynamic_list_attributes=dynamic_list_attributes,
-                    namespaces=self._render_namespaces(FORM_XML_NAMESPACES),
-                    version=self.processor.platform_version,
-                    form=form,
-                )
+                                 
+                print(f"📝 {'[DRY RUN] Генерація' if dry_run else 'Генерація'} модуля об'єкта...")
+                                                                         
+                if self.processor.object_module_bsl:
+                    object_module_code = self.processor.object_module_bsl
+                else:
+                    object_module_code = self.artifacts.object_module_code(self._generate_object_module_code)
+                if not dry_run:
+                    self._write_output("processor", object_module, object_module_code)
+                print(f"   {'📄' if dry_run else '✅'} {object_module} ({len(object_module_code)} bytes)")
 
-                                                               
-                import re
-                                                                                               
-                content = re.sub(r'(>)(\t|<)', r'\1\n\2', content)
-                                                                            
-                content = re.sub(r'\n\n\n+', '\n', content)
+                                       
+        forms_to_generate = self.processor.forms
 
-                form_xml = form_ext_dir_for_form.parent / "Form.xml"
-                if not dry_run:
-                                                                      
-                    form_xml.write_text(content, encoding=ENCODING_UTF8_BOM)
-                print(f"   {'📄' if dry_run else '✅'} {form_xml} ({len(content)} bytes)")
+        if forms_to_generate:
+            pending_forms = [
+                form for form in forms_to_generate
+                if not self._artifact_up_to_date(f"form:{form.name}")
+            ]
+            pending_names = {form.name for form in pending_forms}
+
+            form_reports = {}
+            workers = min(max(1, int(jobs or 1)), len(pending_forms))
+            self._buffer_streams = workers > 1
+            if workers > 1:
+                from concurrent.futures import ThreadPoolExecutor
+
+                print(f"\n⚡ Паралельний рендеринг форм: {workers} потоків")
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    form_reports = dict(zip(
+                        (form.name for form in pending_forms),
+                        executor.map(lambda f: self._generate_form(f, processor_dir, dry_run), pending_forms),
+                    ))
 
-                                                     
-                form_module = form_ext_dir_for_form / "Module.bsl"
-                if not dry_run:
-                    form_module.write_text(form_module_code, encoding=ENCODING_UTF8_BOM)
-                print(f"   {'📄' if dry_run else '✅'} {form_module} ({len(form_module_code)} bytes)")
+            for form in forms_to_generate:
+                if form.name not in pending_names:
+                    skipped_artifacts += 1
+                    print(f"\n⏭️  Форма '{form.name}' без змін - пропущено")
+                    continue
+
+                print(f"\n📝 Генерація форми '{form.name}'...")
+                report = form_reports.get(form.name) or self._generate_form(form, processor_dir, dry_run)
+                for line in report:
+                    print(line)
 
                                                                        
         if self.processor.templates:
             from .template_xml_generator import generate_all_templates
-            generate_all_templates(
-                templates=self.processor.templates,
-                processor_dir=processor_dir,
-                env=self.env,
-                namespaces=self._render_namespaces(XML_NAMESPACES),
-                platform_version=self.processor.platform_version,
-                dry_run=dry_run
-            )
+
+            templates_to_generate = []
+            for template in self.processor.templates:
+                if self._artifact_up_to_date(f"template:{template.name}"):
+                    skipped_artifacts += 1
+                    print(f"⏭️  Макет '{template.name}' без змін - пропущено")
+                else:
+                    templates_to_generate.append(template)
+
+            with span("templates"):
+                generate_all_templates(
+                    templates=templates_to_generate,
+                    processor_dir=processor_dir,
+                    env=self.env,
+                    namespaces=self._render_namespaces(XML_NAMESPACES),
+                    platform_version=self.processor.platform_version,
+                    dry_run=dry_run,
+                    writer=self._write_template_output if self._manifest is not None or self._sink is not None else None,
+                    create_dirs=self._sink is None,
+                )
+
+        if self._manifest is not None:
+            with span("manifest.save"):
+                self._manifest.save()
+
+        if self._element_ids is not None and write_to_disk:
+            self._element_ids.save([form.name for form in forms_to_generate])
 
         if dry_run:
             print(f"\n✅ DRY RUN завершено успішно!")
@@ -1219,13 +1502,22 @@ class ProcessorGenerator:
         else:
             print(f"\n🎉 Обробка '{processor_name}' успішно згенерована!")
             print(f"📊 Згенеровано форм: {len(forms_to_generate)}")
-            print(f"📂 Розташування: {processor_root}")
-            print(f"\n💡 Відкрийте в 1C: Файл → Відкрити → {processor_root / main_xml.name}")
+            if skipped_artifacts:
+                print(f"⏭️  Пропущено без змін: {skipped_artifacts} (використовуйте --force для повної регенерації)")
+            if self._sink is not None:
+                print(f"📦 Вивід: {type(self._sink).__name__} (без запису на диск)")
+            else:
+                print(f"📂 Розташування: {processor_root}")
+                print(f"\n💡 Відкрийте в 1C: Файл → Відкрити → {processor_root / main_xml.name}")
 
                                                    
-            if forms_to_generate:                                 
-                post_validator = PostGenerationValidator(self.processor, output_path)
-                validation_passed = post_validator.validate_generation(verbose=True)
+            reader = self._sink_reader()
+            if forms_to_generate and (self._sink is None or reader is not None):
+                with span("post_validation"):
+                    post_validator = PostGenerationValidator(
+                        self.processor, output_path, artifacts=self.artifacts, reader=reader
+                    )
+                    validation_passed = post_validator.validate_generation(verbose=True)
 
                 if not validation_passed:
                     print("\n⚠️  WARNING: Post-generation validation detected issues.")
@@ -1233,20 +1525,40 @@ class ProcessorGenerator:
                     print("    Please review the validation report above.")
 
                                                     
-            if save_snapshot and forms_to_generate:
+            if save_snapshot and forms_to_generate and self._sink is None:
                                                           
-                combined_bsl = ""
-                for form in forms_to_generate:
-                    form_module_code = self._generate_form_module_code(form)
-                    combined_bsl += form_module_code + "\n\n"
-
-                self._save_snapshot(
-                    output_dir=output_path,
-                    main_xml_path=main_xml,
-                    form_module_code=combined_bsl.strip()
-                )
+                with span("snapshot"):
+                    combined_bsl = self.artifacts.combined_form_module_code(
+                        forms_to_generate, self._generate_form_module_code
+                    )
+
+                    self._save_snapshot(
+                        output_dir=output_path,
+                        main_xml_path=main_xml,
+                        form_module_code=combined_bsl
+                    )
+
+        return processor_root
+
+    def _sink_reader(self):
+        if self._sink is None or not hasattr(self._sink, "read_bytes"):
+            return None
+
+        def read(path: Path) -> Optional[str]:
+            data = self._sink.read_bytes(self._sink_path(path))
+            return data.decode("utf-8") if data is not None else None
+
+        return read
+
+    def generate_to_memory(self, jobs: int = 1) -> Optional[Dict[str, bytes]]:
+        sink = MemorySink()
+        if self.generate("", save_snapshot=False, jobs=jobs, sink=sink) is None:
+            return None
+        return sink.files
 
-        return processor_root                                              
+    def generate_to_archive(self, target, archive_format: Optional[str] = None, jobs: int = 1) -> Optional[Path]:
+        with create_archive_sink(target, archive_format) as sink:
+            return self.generate("", save_snapshot=False, jobs=jobs, sink=sink)
 
 
 def create_minimal_processor(name: str, platform_version: str = "2.11") -> Processor:
@@ -1,14 +1,23 @@
    
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import ClassVar, Dict, Iterable, Optional, Set, Tuple
 
-                                                   
-from .pro._gc import get_generation_context
+_gen_ctx: Optional[Dict] = None
 
-                                               
-_gen_ctx = get_generation_context()
-ELEMENT_ID_INCREMENTS = _gen_ctx["element_id_increments"]
+
+def _generation_context() -> Dict:
+    global _gen_ctx
+    if _gen_ctx is None:
+        from .pro._gc import get_generation_context
+        _gen_ctx = get_generation_context()
+    return _gen_ctx
+
+
+def __getattr__(name: str):
+    if name == "ELEMENT_ID_INCREMENTS":
+        return _generation_context()["element_id_increments"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass
@@ -27,7 +36,7 @@ class IDAllocator:
     def allocate(self, element_type: str, element_name: Optional[str] = None) -> int:
                    
         allocated_id = self._current_id
-        increment = ELEMENT_ID_INCREMENTS.get(element_type, 3)              
+        increment = _generation_context()["element_id_increments"].get(element_type, 3)              
         self._current_id += increment
 
                                          
@@ -77,6 +86,122 @@ class IDAllocator:
         return f"IDAllocator(current={self._current_id}, allocations={len(self._allocations)})"
 
 
+class ElementIDMap:
+
+    def __init__(
+        self,
+        ids: Optional[Dict[str, Tuple[int, int]]] = None,
+        next_id: int = 1,
+        occupied: Optional[Iterable[int]] = None,
+        aliases: Optional[Dict[str, str]] = None,
+    ):
+        self.previous: Dict[str, Tuple[int, int]] = dict(ids or {})
+        self.aliases: Dict[str, str] = dict(aliases or {})
+        self.allocated: Dict[str, Tuple[int, int]] = {}
+        self.reused = 0
+        self._used: Set[int] = set()
+        self._owned: Dict[int, str] = {}
+        self._occurrences: Dict[str, int] = {}
+        self._last_key = ""
+        self._reserve_ordinal = 0
+
+        for key, (start, size) in self.previous.items():
+            for value in range(start, start + size):
+                self._owned[value] = key
+        for value in occupied or ():
+            self._owned.setdefault(value, "")
+        self.next_id = max([next_id, *(value + 1 for value in self._owned)])
+
+    def key(self, element_type: str, element_name: Optional[str]) -> Optional[str]:
+        if not element_name:
+            return None
+        key = f"{element_type}:{element_name}"
+        occurrence = self._occurrences.get(key, 0)
+        self._occurrences[key] = occurrence + 1
+        key = f"{key}#{occurrence}" if occurrence else key
+        self._last_key = key
+        self._reserve_ordinal = 0
+        return key
+
+    def reserve_key(self) -> str:
+        self._reserve_ordinal += 1
+        return f"reserve:{self._last_key}#{self._reserve_ordinal}"
+
+    def reuse(self, key: Optional[str], increment: int) -> Optional[int]:
+        if not key:
+            return None
+        if key not in self.previous:
+            key = self.aliases.get(key)
+        previous = self.previous.get(key) if key else None
+        if previous is None:
+            return None
+        start = previous[0]
+        for value in range(start, start + increment):
+            if value in self._used or self._owned.get(value, key) != key:
+                return None
+        return start
+
+    def record(self, key: Optional[str], start: int, increment: int, fresh: bool) -> None:
+        self._used.update(range(start, start + increment))
+        self.next_id = max(self.next_id, start + increment)
+        if not fresh:
+            self.reused += 1
+        if key:
+            self.allocated[key] = (start, increment)
+
+    def fresh_start(self, current: int, count: int = 1) -> int:
+        start = max(current, self.next_id)
+        while any(value in self._used for value in range(start, start + count)):
+            start += 1
+        return start
+
+
+@dataclass
+class StableIDAllocator(IDAllocator):
+
+    _id_map: ClassVar[Optional[ElementIDMap]] = None
+
+    @classmethod
+    def bind(cls, id_map: ElementIDMap) -> type:
+        return type(cls.__name__, (cls,), {"_id_map": id_map})
+
+    def __post_init__(self):
+        super().__post_init__()
+        if self._id_map is not None:
+            self._current_id = max(self._current_id, self._id_map.next_id)
+
+    def _take(self, key: Optional[str], count: int) -> int:
+        id_map = self._id_map
+        start_id = id_map.reuse(key, count)
+        fresh = start_id is None
+        if fresh:
+            start_id = id_map.fresh_start(self._current_id, count)
+            self._current_id = start_id + count
+        id_map.record(key, start_id, count, fresh)
+        return start_id
+
+    def allocate(self, element_type: str, element_name: Optional[str] = None) -> int:
+        id_map = self._id_map
+        if id_map is None:
+            return super().allocate(element_type, element_name)
+
+        increment = _generation_context()["element_id_increments"].get(element_type, 3)
+        allocated_id = self._take(id_map.key(element_type, element_name), increment)
+
+        if self._debug:
+            self._allocations[f"{element_type}:{element_name or 'unnamed'}@{allocated_id}"] = increment
+
+        return allocated_id
+
+    def skip(self, count: int) -> None:
+        self.reserve(count)
+
+    def reserve(self, count: int) -> int:
+        if self._id_map is None:
+            return super().reserve(count)
+        return self._take(self._id_map.reserve_key(), count)
+
+
 def create_allocator(start_id: int = 1, debug: bool = False) -> IDAllocator:
            
     return IDAllocator(_start_id=start_id, _debug=debug)
@@ -0,0 +1,113 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_PARSED = 256
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def clone_structure(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: clone_structure(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [clone_structure(v) for v in value]
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+class IncludeCache:
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, max_parsed: int = DEFAULT_MAX_PARSED):
+        self.max_bytes = max_bytes
+        self.max_parsed = max_parsed
+        self._files: "OrderedDict[str, Tuple[Tuple[int, int, int, int], str, int, bytes]]" = OrderedDict()
+        self._parsed: "OrderedDict[Tuple[str, str, str], Any]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.parse_hits = 0
+        self.parse_misses = 0
+
+    @staticmethod
+    def _path_key(path: Path) -> str:
+        return os.path.abspath(path)
+
+    def read_bytes(self, path: Path) -> bytes:
+        path_key = self._path_key(path)
+        stat = os.stat(path_key)
+        stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)
+        changed_ns = max(stat.st_mtime_ns, stat.st_ctime_ns)
+
+        with self._lock:
+            entry = self._files.get(path_key)
+            if entry is not None and entry[0] == stamp and entry[2] - changed_ns > RACY_WINDOW_NS:
+                self._files.move_to_end(path_key)
+                self.hits += 1
+                return entry[3]
+
+        read_ns = time.time_ns()
+        with open(path_key, "rb") as f:
+            data = f.read()
+        if len(data) != stat.st_size:
+            return data
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            previous = self._files.pop(path_key, None)
+            if previous is not None:
+                self._size -= len(previous[3])
+                if previous[0] == stamp and previous[1] == digest:
+                    self.hits += 1
+                    data = previous[3]
+                else:
+                    self.misses += 1
+            else:
+                self.misses += 1
+            if len(data) <= self.max_bytes:
+                self._files[path_key] = (stamp, digest, read_ns, data)
+                self._size += len(data)
+                while self._size > self.max_bytes:
+                    _, evicted = self._files.popitem(last=False)
+                    self._size -= len(evicted[3])
+        return data
+
+    def parse_shared(self, path: Path, data: bytes, loader: Callable[[bytes], Any]) -> Any:
+        key = (self._path_key(path), getattr(loader, "__name__", ""), hashlib.sha256(data).hexdigest())
+
+        with self._lock:
+            master = self._parsed.get(key)
+            if master is not None:
+                self._parsed.move_to_end(key)
+                self.parse_hits += 1
+                return master
+
+        master = loader(data)
+        with self._lock:
+            self.parse_misses += 1
+            self._parsed[key] = master
+            while len(self._parsed) > self.max_parsed:
+                self._parsed.popitem(last=False)
+        return master
+
+    def parse(self, path: Path, data: bytes, loader: Callable[[bytes], Any]) -> Any:
+        return clone_structure(self.parse_shared(path, data, loader))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._files.clear()
+            self._parsed.clear()
+            self._size = 0
+
+
+_include_cache = IncludeCache()
+
+
+def get_include_cache() -> IncludeCache:
+    return _include_cache
@@ -0,0 +1,38 @@
+import re
+from bisect import bisect_right
+from typing import List, Tuple
+
+_NEWLINE = re.compile("\n")
+
+
+class LineIndex:
+
+    def __init__(self, text: str):
+        self.text = text
+        self.offsets: List[int] = [0]
+        self.offsets.extend(match.end() for match in _NEWLINE.finditer(text))
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def line(self, offset: int) -> int:
+        return bisect_right(self.offsets, offset)
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        line = bisect_right(self.offsets, offset)
+        return line, offset - self.offsets[line - 1] + 1
+
+    def line_start(self, offset: int) -> int:
+        return self.offsets[bisect_right(self.offsets, offset) - 1]
+
+    def line_end(self, offset: int) -> int:
+        line = bisect_right(self.offsets, offset)
+        return self.offsets[line] - 1 if line < len(self.offsets) else len(self.text)
+
+    def offset(self, line: int, column: int = 1) -> int:
+        line = min(max(line, 1), len(self.offsets))
+        return min(self.offsets[line - 1] + column - 1, len(self.text))
+
+    def format(self, offset: int) -> str:
+        line, column = self.position(offset)
+        return f"{line}:{column}"
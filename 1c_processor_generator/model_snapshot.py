@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import pickle
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .config_cache import user_cache_dir
+
+SNAPSHOT_MAGIC = b"1CPGPROC"
+SNAPSHOT_FORMAT_VERSION = 3
+SNAPSHOT_SUFFIX = ".processor.bin"
+SNAPSHOT_PICKLE_PROTOCOL = 5
+
+_HEADER = struct.Struct("<8sHI")
+
+
+def _file_hash(path: Path) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _file_stat(path: Path) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _file_record(path: Path) -> Optional[List]:
+    stat = _file_stat(path)
+    if stat is None:
+        return None
+    digest = _file_hash(path)
+    if digest is None:
+        return None
+    return [digest, *stat]
+
+
+def input_paths(files: Iterable[Path]) -> Dict[str, Path]:
+    paths: Dict[str, Path] = {}
+    for path in files:
+        paths.setdefault(Path(path).resolve().as_posix(), Path(path))
+    return paths
+
+
+def input_fingerprints(files: Iterable[Path]) -> Dict[str, Optional[List]]:
+    return {key: _file_record(path) for key, path in input_paths(files).items()}
+
+
+def inputs_unchanged(recorded: Dict[str, Optional[List]], paths: Dict[str, Path]) -> bool:
+    if any(key not in recorded for key in paths):
+        return False
+    for key, record in recorded.items():
+        path = paths.get(key, Path(key))
+        stat = _file_stat(path)
+        if record is None or stat is None:
+            if record is not None or stat is not None:
+                return False
+            continue
+        if not isinstance(record, list) or len(record) != 3:
+            return False
+        if stat == record[1:]:
+            continue
+        if _file_hash(path) != record[0]:
+            return False
+    return True
+
+
+def _runtime_tag() -> Dict[str, str]:
+    from . import __version__
+
+    return {
+        "generator": __version__,
+        "python": f"{sys.version_info[0]}.{sys.version_info[1]}",
+    }
+
+
+def write_snapshot(path: Path, processor, inputs: Dict[str, Optional[List]], options: Dict) -> bool:
+    header = json.dumps(
+        {**_runtime_tag(), "options": options, "inputs": inputs},
+        ensure_ascii=False,
+        sort_keys=True,
+    ).encode("utf-8")
+
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        payload = pickle.dumps(processor, protocol=SNAPSHOT_PICKLE_PROTOCOL)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(header)))
+            f.write(header)
+            f.write(payload)
+        os.replace(tmp_path, path)
+        return True
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+        print(f"⚠️  Не вдалося зберегти snapshot моделі {path.name}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return False
+
+
+def read_snapshot_header(path: Path) -> Optional[Tuple[Dict, int]]:
+    try:
+        with open(path, "rb") as f:
+            prefix = f.read(_HEADER.size)
+            if len(prefix) != _HEADER.size:
+                return None
+            magic, version, header_size = _HEADER.unpack(prefix)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_FORMAT_VERSION:
+                return None
+            header = json.loads(f.read(header_size).decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+    return header, _HEADER.size + header_size
+
+
+def read_snapshot(path: Path):
+    result = read_snapshot_header(path)
+    if result is None:
+        return None
+    _, offset = result
+    try:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError):
+        return None
+
+
+class ProcessorSnapshot:
+
+    def __init__(
+        self,
+        yaml_path: Path,
+        location: Optional[Path] = None,
+        handlers_dir: Optional[Path] = None,
+        handlers_file: Optional[Path] = None,
+        options: Optional[Dict] = None,
+    ):
+        self.yaml_path = Path(yaml_path)
+        self.handlers_dir = Path(handlers_dir) if handlers_dir else None
+        self.handlers_file = Path(handlers_file) if handlers_file else None
+        self.options = {
+            "handlers_dir": self.handlers_dir.resolve().as_posix() if self.handlers_dir else None,
+            "handlers_file": self.handlers_file.resolve().as_posix() if self.handlers_file else None,
+            **(options or {}),
+        }
+        self.path = self._snapshot_path(location)
+
+    def _snapshot_path(self, location: Optional[Path]) -> Path:
+        if location is not None and Path(location).suffix == ".bin":
+            return Path(location)
+        key = hashlib.sha256(
+            json.dumps([self.yaml_path.resolve().as_posix(), self.options], sort_keys=True).encode("utf-8")
+        ).hexdigest()[:16]
+        directory = Path(location) if location is not None else user_cache_dir("processor")
+        return directory / f"{self.yaml_path.stem}-{key}{SNAPSHOT_SUFFIX}"
+
+    def _files(self) -> list:
+        files = [self.yaml_path]
+        if self.handlers_file:
+            files.append(self.handlers_file)
+        return files
+
+    def load(self):
+        result = read_snapshot_header(self.path)
+        if result is None:
+            return None
+        header, _ = result
+
+        if {k: header.get(k) for k in _runtime_tag()} != _runtime_tag() or header.get("options") != self.options:
+            return None
+
+        recorded = header.get("inputs") or {}
+        if not inputs_unchanged(recorded, input_paths(self._files())):
+            return None
+        return read_snapshot(self.path)
+
+    def save(self, processor, inputs: Iterable[Path] = ()) -> bool:
+        inputs = input_fingerprints([*self._files(), *inputs])
+        return write_snapshot(self.path, processor, inputs, self.options)
@@ -2,17 +2,74 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from types import MemberDescriptorType
 from typing import List, Optional, Dict, Any
 from uuid import uuid4
 
+LAZY_UUID = "lazy_uuid"
+
 
 def generate_uuid() -> str:
                                                   
     return str(uuid4()).lower()
 
 
-@dataclass
+def uuid_field() -> Any:
+    return field(default=None, metadata={LAZY_UUID: True})
+
+
+class _LazyUUID:
+
+    __slots__ = ("name", "slot")
+
+    def __init__(self, name: str, slot: Optional[MemberDescriptorType] = None):
+        self.name = name
+        self.slot = slot
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        if self.slot is not None:
+            try:
+                value = self.slot.__get__(obj, owner)
+            except AttributeError:
+                value = None
+        else:
+            value = obj.__dict__.get(self.name)
+        if value is None:
+            value = generate_uuid()
+            self.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value) -> None:
+        if self.slot is not None:
+            self.slot.__set__(obj, value)
+        else:
+            obj.__dict__[self.name] = value
+
+
+def _materialized_state(self):
+    for name in type(self).__lazy_uuids__:
+        getattr(self, name)
+    return self.__dict__
+
+
+def lazy_uuids(cls):
+    names = []
+    for f in fields(cls):
+        if f.metadata.get(LAZY_UUID):
+            slot = cls.__dict__.get(f.name)
+            setattr(cls, f.name, _LazyUUID(f.name, slot if isinstance(slot, MemberDescriptorType) else None))
+            names.append(f.name)
+    cls.__lazy_uuids__ = tuple(names)
+    if "__slots__" not in cls.__dict__ and "__getstate__" not in cls.__dict__:
+        cls.__getstate__ = _materialized_state
+    return cls
+
+
+@lazy_uuids
+@dataclass(slots=True)
 class Column:
                                    
     name: str
@@ -24,7 +81,7 @@ class Column:
     digits: Optional[int] = None              
     fraction_digits: Optional[int] = None              
     read_only: bool = False                                
-    uuid: str = field(default_factory=generate_uuid)
+    uuid: str = uuid_field()
 
     def __post_init__(self):
         if not self.synonym_ru:
@@ -35,6 +92,7 @@ class Column:
             self.synonym_en = self.name
 
 
+@lazy_uuids
 @dataclass
 class TabularSection:
                                   
@@ -43,11 +101,11 @@ class TabularSection:
     synonym_uk: Optional[str] = None
     synonym_en: Optional[str] = None
     columns: List[Column] = field(default_factory=list)
-    uuid: str = field(default_factory=generate_uuid)
-    type_id: str = field(default_factory=generate_uuid)
-    value_id: str = field(default_factory=generate_uuid)
-    row_type_id: str = field(default_factory=generate_uuid)
-    row_value_id: str = field(default_factory=generate_uuid)
+    uuid: str = uuid_field()
+    type_id: str = uuid_field()
+    value_id: str = uuid_field()
+    row_type_id: str = uuid_field()
+    row_value_id: str = uuid_field()
 
     def __post_init__(self):
         if not self.synonym_ru:
@@ -58,7 +116,8 @@ class TabularSection:
             self.synonym_en = self.name
 
 
-@dataclass
+@lazy_uuids
+@dataclass(slots=True)
 class Attribute:
                           
     name: str
@@ -69,7 +128,7 @@ class Attribute:
     length: Optional[int] = None              
     digits: Optional[int] = None              
     fraction_digits: Optional[int] = None              
-    uuid: str = field(default_factory=generate_uuid)
+    uuid: str = uuid_field()
 
     def __post_init__(self):
         if not self.synonym_ru:
@@ -83,7 +142,7 @@ class Attribute:
                                                       
 
 
-@dataclass
+@dataclass(slots=True)
 class AppearanceStyle:
            
     back_color: Optional[str] = None               
@@ -94,7 +153,7 @@ class AppearanceStyle:
     enabled: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConditionalFilter:
            
     field: str                                      
@@ -103,17 +162,18 @@ class ConditionalFilter:
     value_type: str = "string"                                    
 
 
-@dataclass
+@lazy_uuids
+@dataclass(slots=True)
 class ConditionalAppearanceItem:
            
     name: str
     selection: List[str] = field(default_factory=list)
     filter: Optional[ConditionalFilter] = None
     appearance: Optional[AppearanceStyle] = None
-    uuid: str = field(default_factory=generate_uuid)
+    uuid: str = uuid_field()
 
 
-@dataclass
+@dataclass(slots=True)
 class FormElement:
                                                                 
     element_type: str                                                                                           
@@ -125,9 +185,10 @@ class FormElement:
     properties: Dict[str, any] = field(default_factory=dict)                                                                                  
     child_items: List = field(default_factory=list)                                       
     conditional_appearances: List[ConditionalAppearanceItem] = field(default_factory=list)                                  
+    bsl_code: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class FormGroup:
                                                          
     group_type: str                                             
@@ -142,7 +203,7 @@ class FormGroup:
     properties: Dict[str, any] = field(default_factory=dict)                         
 
 
-@dataclass
+@dataclass(slots=True)
 class LongOperationSettings:
            
                 
@@ -170,7 +231,8 @@ class LongOperationSettings:
         return self.progress_message
 
 
-@dataclass
+@lazy_uuids
+@dataclass(slots=True)
 class Command:
                        
     name: str
@@ -183,7 +245,7 @@ class Command:
     tooltip_en: Optional[str] = None
     picture: Optional[str] = None                                         
     shortcut: Optional[str] = None                    
-    uuid: str = field(default_factory=generate_uuid)
+    uuid: str = uuid_field()
     bsl_code: Optional[str] = None                                                
 
                                                  
@@ -196,7 +258,7 @@ class Command:
             self.long_operation_settings = LongOperationSettings()
 
 
-@dataclass
+@dataclass(slots=True)
 class FormAttribute:
            
     name: str
@@ -240,7 +302,8 @@ class FormAttribute:
             self.time_scale_format = formats.get(self.time_scale, 'DF="HH:mm"')
 
 
-@dataclass
+@lazy_uuids
+@dataclass(slots=True)
 class FormParameter:
            
     name: str
@@ -249,7 +312,7 @@ class FormParameter:
     synonym_uk: Optional[str] = None
     synonym_en: Optional[str] = None
     key_parameter: bool = False                                  
-    uuid: str = field(default_factory=generate_uuid)
+    uuid: str = uuid_field()
 
     def __post_init__(self):
         if not self.synonym_ru:
@@ -260,7 +323,7 @@ class FormParameter:
             self.synonym_en = self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplatePlaceholder:
            
     name: str                                            
@@ -275,6 +338,7 @@ class TemplateAssets:
     scripts: List[dict] = field(default_factory=list)                                          
 
 
+@lazy_uuids
 @dataclass
 class Template:
            
@@ -283,7 +347,7 @@ class Template:
     file_path: Optional[str] = None                                    
     content: Optional[str] = None                                          
     content_binary: Optional[bytes] = None                                                   
-    uuid: str = field(default_factory=generate_uuid)
+    uuid: str = uuid_field()
 
                                 
     auto_field: bool = False                                                            
@@ -324,7 +388,7 @@ class ValueTreeAttribute:
     id: int = 1                     
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamicListParameter:
                                      
     name: str
@@ -332,7 +396,7 @@ class DynamicListParameter:
     default_value: Optional[any] = None                             
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamicListColumn:
                                                       
     field: str                                                           
@@ -342,6 +406,7 @@ class DynamicListColumn:
     width: Optional[int] = None                                                                                      
 
 
+@lazy_uuids
 @dataclass
 class DynamicListAttribute:
                                         
@@ -363,10 +428,10 @@ class DynamicListAttribute:
     id: int = 1                     
 
                                                                      
-    filter_setting_id: str = field(default_factory=generate_uuid)
-    order_setting_id: str = field(default_factory=generate_uuid)
-    appearance_setting_id: str = field(default_factory=generate_uuid)
-    items_setting_id: str = field(default_factory=generate_uuid)
+    filter_setting_id: str = uuid_field()
+    order_setting_id: str = uuid_field()
+    appearance_setting_id: str = uuid_field()
+    items_setting_id: str = uuid_field()
 
     def __post_init__(self):
         if not self.title_ru:
@@ -381,6 +446,7 @@ class DynamicListAttribute:
             raise ValueError(f"DynamicList '{self.name}': main_table обов'язковий для manual_query=false")
 
 
+@lazy_uuids
 @dataclass
 class Form:
                           
@@ -427,7 +493,7 @@ class Form:
     module_variables: Optional[str] = None
 
                     
-    uuid: str = field(default_factory=generate_uuid)
+    uuid: str = uuid_field()
 
                                                  
     conditional_appearances: List[ConditionalAppearanceItem] = field(default_factory=list)
@@ -467,6 +533,7 @@ class ValidationConfig:
                                                       
 
 
+@lazy_uuids
 @dataclass
 class BSPCommand:
            
@@ -482,7 +549,7 @@ class BSPCommand:
     check_posting: bool = True                                                    
     hide: bool = False                                                      
     replaced_commands: Optional[str] = None                                               
-    uuid: str = field(default_factory=generate_uuid)
+    uuid: str = uuid_field()
 
     def __post_init__(self):
         if not self.title_uk:
@@ -491,6 +558,7 @@ class BSPCommand:
             self.title_en = self.title_ru
 
 
+@lazy_uuids
 @dataclass
 class BSPConfig:
            
@@ -501,7 +569,7 @@ class BSPConfig:
     targets: List[str] = field(default_factory=list)                                     
     commands: List[BSPCommand] = field(default_factory=list)                   
     print_handler: str = "Печать"                                              
-    uuid: str = field(default_factory=generate_uuid)
+    uuid: str = uuid_field()
 
                           
     VALID_TYPES = {
@@ -526,6 +594,7 @@ class BSPConfig:
             raise ValueError("BSPConfig: 'commands' cannot be empty")
 
 
+@lazy_uuids
 @dataclass
 class Processor:
                              
@@ -552,11 +621,12 @@ class Processor:
     object_module_from_handlers: Optional[str] = None                                                                  
 
                       
-    main_uuid: str = field(default_factory=generate_uuid)
-    object_id: str = field(default_factory=generate_uuid)
-    type_id: str = field(default_factory=generate_uuid)
-    value_id: str = field(default_factory=generate_uuid)
-    form_uuid: str = field(default_factory=generate_uuid)
+    main_uuid: str = uuid_field()
+    object_id: str = uuid_field()
+    type_id: str = uuid_field()
+    value_id: str = uuid_field()
+    form_uuid: str = uuid_field()
+    uuid_policy: Optional[str] = None
 
                                                 
     validation: ValidationConfig = field(default_factory=ValidationConfig)
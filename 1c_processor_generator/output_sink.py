@@ -0,0 +1,110 @@
+import io
+import os
+import tarfile
+import time
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+
+def archive_timestamp() -> float:
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    return float(epoch) if epoch and epoch.isdigit() else time.time()
+
+
+class OutputSink(ABC):
+
+    @abstractmethod
+    def write_bytes(self, rel_path: str, data: bytes) -> None:
+        pass
+
+    def write_stream(self, rel_path: str, chunks: Iterable[bytes]) -> None:
+        self.write_bytes(rel_path, b"".join(chunks))
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class MemorySink(OutputSink):
+
+    def __init__(self):
+        self.files: Dict[str, bytes] = {}
+
+    def write_bytes(self, rel_path: str, data: bytes) -> None:
+        self.files[rel_path] = bytes(data)
+
+    def read_bytes(self, rel_path: str) -> Optional[bytes]:
+        return self.files.get(rel_path)
+
+
+class ZipSink(OutputSink):
+
+    def __init__(self, target: Union[str, Path, io.IOBase], compression: int = zipfile.ZIP_DEFLATED):
+        self._zip = zipfile.ZipFile(target, "w", compression=compression)
+        self._date_time = time.gmtime(max(archive_timestamp(), 315532800))[:6]
+
+    def _info(self, rel_path: str) -> zipfile.ZipInfo:
+        info = zipfile.ZipInfo(rel_path, date_time=self._date_time)
+        info.compress_type = self._zip.compression
+        info.external_attr = 0o600 << 16
+        return info
+
+    def write_bytes(self, rel_path: str, data: bytes) -> None:
+        self._zip.writestr(self._info(rel_path), data)
+
+    def write_stream(self, rel_path: str, chunks: Iterable[bytes]) -> None:
+        with self._zip.open(self._info(rel_path), "w", force_zip64=True) as f:
+            for data in chunks:
+                f.write(data)
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+class TarSink(OutputSink):
+
+    def __init__(self, target: Union[str, Path, io.IOBase], compression: str = "gz"):
+        self._mtime = archive_timestamp()
+        self._gzip = None
+        if compression == "gz":
+            import gzip
+
+            if isinstance(target, (str, Path)):
+                self._gzip = gzip.GzipFile(str(target), "wb", mtime=int(self._mtime))
+            else:
+                self._gzip = gzip.GzipFile(filename="", fileobj=target, mode="wb", mtime=int(self._mtime))
+            self._tar = tarfile.open(fileobj=self._gzip, mode="w")
+        elif isinstance(target, (str, Path)):
+            self._tar = tarfile.open(str(target), f"w:{compression}" if compression else "w")
+        else:
+            self._tar = tarfile.open(fileobj=target, mode=f"w:{compression}" if compression else "w")
+
+    def write_bytes(self, rel_path: str, data: bytes) -> None:
+        info = tarfile.TarInfo(rel_path)
+        info.size = len(data)
+        info.mtime = self._mtime
+        self._tar.addfile(info, io.BytesIO(data))
+
+    def close(self) -> None:
+        self._tar.close()
+        if self._gzip is not None:
+            self._gzip.close()
+
+
+def create_archive_sink(target: Union[str, Path], archive_format: Optional[str] = None) -> OutputSink:
+    name = str(target).lower()
+    archive_format = archive_format or ("zip" if name.endswith(".zip") else "tar")
+    if archive_format == "zip":
+        return ZipSink(target)
+    if archive_format == "tar":
+        compression = "gz" if name.endswith((".tar.gz", ".tgz")) else ""
+        return TarSink(target, compression=compression)
+    raise ValueError(f"Unsupported archive format: {archive_format}")
@@ -1,7 +1,7 @@
    
 
 from .schemas import SCHEMAS, ElementSchema, PropSpec, get_schema
-from .extractors import normalize_multilang, extract_props
+from .extractors import normalize_multilang, extract_props, get_extractor
 from .elements import ElementParser
 
 __all__ = [
@@ -11,5 +11,6 @@ __all__ = [
     "get_schema",
     "normalize_multilang",
     "extract_props",
+    "get_extractor",
     "ElementParser",
 ]
@@ -3,7 +3,7 @@
 from typing import Dict, Optional, List, Any, Callable
 from ..models import FormElement, ConditionalAppearanceItem, ConditionalFilter, AppearanceStyle
 from .schemas import SCHEMAS, ElementSchema, COLUMN_GROUP_ALLOWED_CHILDREN, get_schema
-from .extractors import normalize_multilang, extract_props
+from .extractors import normalize_multilang, get_extractor
 
 
 class ElementParser:
@@ -23,7 +23,7 @@ class ElementParser:
     def parse(self, config: Dict[str, Any]) -> Optional[FormElement]:
                    
                                                                             
-        config = normalize_multilang(config, languages=self.languages)
+        config = normalize_multilang(config, languages=self.languages, in_place=True)
         elem_type = config.get("type")
 
         if not elem_type:
@@ -44,7 +44,7 @@ class ElementParser:
 
     def _parse_by_schema(self, config: Dict[str, Any], schema: ElementSchema) -> FormElement:
                    
-        props = extract_props(config, schema)
+        props = get_extractor(schema)(config)
 
                                                                                    
         tabular_section = None
@@ -101,7 +101,7 @@ class ElementParser:
     def _parse_pages(self, config: Dict[str, Any]) -> FormElement:
                    
         schema = get_schema("Pages")
-        props = extract_props(config, schema)
+        props = get_extractor(schema)(config)
 
         pages_elem = FormElement(
             element_type="Pages",
@@ -112,7 +112,7 @@ class ElementParser:
                           
         pages_config = config.get("pages", [])
         for page_config in pages_config:
-            page_config = normalize_multilang(page_config, languages=self.languages)
+            page_config = normalize_multilang(page_config, languages=self.languages, in_place=True)
             title = page_config.get("title", page_config["name"])
 
                                                 
@@ -140,7 +140,7 @@ class ElementParser:
     def _parse_column_group(self, config: Dict[str, Any]) -> FormElement:
                    
         schema = get_schema("ColumnGroup")
-        props = extract_props(config, schema)
+        props = get_extractor(schema)(config)
         name = config["name"]
 
                                                           
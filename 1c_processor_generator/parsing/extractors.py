@@ -1,13 +1,15 @@
    
 
 import re
-from typing import Dict, List, Any, Optional, Union
-from .schemas import PropSpec, ElementSchema
+from typing import Dict, List, Any, Optional, Tuple, Union
+from .schemas import ElementSchema
 
 
                                               
 DEFAULT_LANGUAGES = ["ru", "uk", "en"]
 
+MULTILANG_FIELDS = ("synonym", "title", "tooltip", "input_hint")
+
 
 def parse_multilang_value(
     value: Union[str, List[str], Dict[str, str]],
@@ -61,25 +63,26 @@ def parse_multilang_value(
 def normalize_multilang(
     config: Dict[str, Any],
     fields: Optional[List[str]] = None,
-    languages: Optional[List[str]] = None
+    languages: Optional[List[str]] = None,
+    in_place: bool = False,
 ) -> Dict[str, Any]:
            
     if fields is None:
-        fields = ["synonym", "title", "tooltip", "input_hint"]
+        fields = MULTILANG_FIELDS
 
     if languages is None:
         languages = DEFAULT_LANGUAGES
 
-    result = config.copy()
+    result = config if in_place else config.copy()
 
     for field in fields:
-        if field not in config:
+        if field not in result:
             continue
 
-        value = config[field]
+        value = result[field]
 
                                                        
-        if any(f"{field}_{lang}" in config for lang in languages):
+        if any(f"{field}_{lang}" in result for lang in languages):
             continue
 
                                               
@@ -96,42 +99,44 @@ def normalize_multilang(
     return result
 
 
-def extract_props(config: Dict[str, Any], schema: ElementSchema) -> Dict[str, Any]:
+class CompiledExtractor:
            
-    props: Dict[str, Any] = {}
 
-    for spec in schema.props:
-        if spec.multilang:
-            _extract_multilang_prop(config, props, spec.key)
-        else:
-            _extract_simple_prop(config, props, spec)
+    __slots__ = ("element_type", "steps")
 
-    return props
+    def __init__(self, schema: ElementSchema, languages: Tuple[str, ...] = tuple(DEFAULT_LANGUAGES)):
+        self.element_type = schema.element_type
+        steps: List[Tuple[str, str, Any]] = []
+        for spec in schema.props:
+            if spec.multilang:
+                steps.extend((f"{spec.key}_{lang}", f"{spec.key}_{lang}", None) for lang in languages)
+                steps.append((spec.key, spec.key, None))
+            else:
+                steps.append((spec.key, spec.target or spec.key, spec.default))
+        self.steps = tuple(steps)
 
+    def __call__(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            target: config.get(source, default)
+            for source, target, default in self.steps
+            if default is not None or source in config
+        }
 
-def _extract_multilang_prop(config: Dict[str, Any], props: Dict[str, Any], key: str) -> None:
-           
-    has_any = any(f"{key}_{lang}" in config for lang in ["ru", "uk", "en"])
 
-    if has_any:
-        for lang in ["ru", "uk", "en"]:
-            full_key = f"{key}_{lang}"
-            if full_key in config:
-                props[full_key] = config[full_key]
+_compiled_extractors: Dict[int, CompiledExtractor] = {}
 
-                                                   
-    if key in config:
-        props[key] = config[key]
+
+def get_extractor(schema: ElementSchema) -> CompiledExtractor:
+           
+    extractor = _compiled_extractors.get(id(schema))
+    if extractor is None or extractor.element_type != schema.element_type:
+        extractor = _compiled_extractors[id(schema)] = CompiledExtractor(schema)
+    return extractor
 
 
-def _extract_simple_prop(config: Dict[str, Any], props: Dict[str, Any], spec: PropSpec) -> None:
+def extract_props(config: Dict[str, Any], schema: ElementSchema) -> Dict[str, Any]:
            
-    if spec.key in config:
-        target = spec.target or spec.key
-        props[target] = config[spec.key]
-    elif spec.default is not None:
-        target = spec.target or spec.key
-        props[target] = spec.default
+    return get_extractor(schema)(config)
 
 
 def extract_simple_props(config: Dict[str, Any], props: Dict[str, Any], keys: List[str]) -> None:
@@ -2,19 +2,42 @@
 
 import re
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import xml.etree.ElementTree as ET
 
 
 class PostGenerationValidator:
                                                                      
 
-    def __init__(self, processor, output_dir: Path):
+    def __init__(self, processor, output_dir: Path, artifacts=None, reader=None):
                    
         self.processor = processor
         self.output_dir = Path(output_dir)
+        self.artifacts = artifacts
+        self.reader = reader
         self.errors = []
         self.warnings = []
+        self._xml_cache: Dict[Path, str] = {}
+
+    def _form_xml_path(self, form_name: str) -> Path:
+        if self.artifacts is not None:
+            path = self.artifacts.form_output(form_name, "form_xml")
+            if path is not None:
+                return path
+        return self.output_dir / self.processor.name / self.processor.name / "Forms" / form_name / "Ext" / "Form.xml"
+
+    def _read_xml(self, xml_path: Path) -> Optional[str]:
+        if xml_path not in self._xml_cache:
+            if self.reader is not None:
+                self._xml_cache[xml_path] = self.reader(xml_path)
+            else:
+                self._xml_cache[xml_path] = xml_path.read_text(encoding='utf-8')
+        return self._xml_cache[xml_path]
+
+    def _xml_exists(self, xml_path: Path) -> bool:
+        if self.reader is not None:
+            return self._read_xml(xml_path) is not None
+        return xml_path.exists()
 
     def _count_yaml_elements(self, elements: List, depth: int = 0) -> int:
                    
@@ -34,12 +57,12 @@ class PostGenerationValidator:
 
     def _count_xml_elements(self, xml_path: Path) -> int:
                    
-        if not xml_path.exists():
+        if not self._xml_exists(xml_path):
             return 0
 
         try:
                                                                                       
-            content = xml_path.read_text(encoding='utf-8')
+            content = self._read_xml(xml_path)
 
                                                              
                                                  
@@ -57,13 +80,13 @@ class PostGenerationValidator:
 
     def _find_empty_containers(self, form, xml_path: Path) -> List[Dict[str, str]]:
                    
-        if not xml_path.exists():
+        if not self._xml_exists(xml_path):
             return []
 
         empty_containers = []
 
         try:
-            content = xml_path.read_text(encoding='utf-8')
+            content = self._read_xml(xml_path)
 
                                                         
             def check_element(elem, elem_name_prefix=""):
@@ -141,7 +164,7 @@ class PostGenerationValidator:
             yaml_count = self._count_yaml_elements(form.elements)
 
                                             
-            xml_path = self.output_dir / self.processor.name / self.processor.name / "Forms" / form_name / "Ext" / "Form.xml"
+            xml_path = self._form_xml_path(form_name)
 
                                          
             xml_count = self._count_xml_elements(xml_path)
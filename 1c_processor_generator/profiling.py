@@ -0,0 +1,98 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class Profiler:
+
+    def __init__(self):
+        self.events: List[Dict] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+
+    @contextmanager
+    def span(self, name: str, category: str = "generator", **args):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            finished = time.perf_counter()
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((started - self._origin) * 1_000_000, 3),
+                "dur": round((finished - started) * 1_000_000, 3),
+                "pid": self._pid,
+                "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = {k: str(v) for k, v in args.items()}
+            with self._lock:
+                self.events.append(event)
+
+    def to_chrome_trace(self) -> Dict:
+        thread_names = {}
+        for thread in threading.enumerate():
+            thread_names[thread.ident] = thread.name
+
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": thread_names.get(tid, str(tid))}}
+            for tid in sorted({e["tid"] for e in self.events})
+        ]
+        events = sorted(self.events, key=lambda e: (e["ts"], -e["dur"]))
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace(), ensure_ascii=False), encoding="utf-8")
+        return path
+
+    def summary(self) -> Dict[str, float]:
+        totals: Dict[str, float] = {}
+        for event in self.events:
+            totals[event["name"]] = totals.get(event["name"], 0.0) + event["dur"] / 1_000_000
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+_active_profiler: Optional[Profiler] = None
+
+
+def start_profiling() -> Profiler:
+    global _active_profiler
+    _active_profiler = Profiler()
+    return _active_profiler
+
+
+def stop_profiling() -> Optional[Profiler]:
+    global _active_profiler
+    profiler, _active_profiler = _active_profiler, None
+    return profiler
+
+
+def get_profiler() -> Optional[Profiler]:
+    return _active_profiler
+
+
+@contextmanager
+def profile():
+    global _active_profiler
+    previous = _active_profiler
+    profiler = start_profiling()
+    try:
+        yield profiler
+    finally:
+        _active_profiler = previous
+
+
+def span(name: str, category: str = "generator", **args):
+    profiler = _active_profiler
+    if profiler is None:
+        return nullcontext()
+    return profiler.span(name, category, **args)
@@ -140,15 +140,7 @@ class SVGConverter:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
                                             
-        if width is None and height is None:
-            svg_width, svg_height = self.get_svg_dimensions(svg_path)
-            if svg_width and svg_height:
-                width, height = svg_width, svg_height
-                logger.debug(f"Using SVG native dimensions: {width}x{height}")
-            else:
-                                                      
-                width, height = 300, 300
-                logger.debug(f"Using default dimensions: {width}x{height}")
+        width, height = self._resolve_dimensions(svg_path, width, height)
 
                                              
         if self._cairosvg_available:
@@ -177,6 +169,67 @@ class SVGConverter:
             "Install cairosvg or Pillow: pip install cairosvg Pillow"
         )
 
+    def _resolve_dimensions(
+        self,
+        svg_path: str,
+        width: Optional[int],
+        height: Optional[int]
+    ) -> Tuple[Optional[int], Optional[int]]:
+        if width is None and height is None:
+            svg_width, svg_height = self.get_svg_dimensions(svg_path)
+            if svg_width and svg_height:
+                width, height = svg_width, svg_height
+                logger.debug(f"Using SVG native dimensions: {width}x{height}")
+            else:
+                                                      
+                width, height = 300, 300
+                logger.debug(f"Using default dimensions: {width}x{height}")
+        return width, height
+
+    def convert_svg_to_png_bytes(
+        self,
+        svg_path: str,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        dpi: int = 96,
+        background: str = 'transparent',
+        max_size_kb: Optional[int] = 100
+    ) -> bytes:
+                   
+        self.validate_svg(svg_path)
+        width, height = self._resolve_dimensions(svg_path, width, height)
+
+        if not self._cairosvg_available:
+            raise SVGConversionError(
+                "In-memory SVG conversion requires cairosvg. "
+                "Install it with: pip install cairosvg"
+            )
+
+        import cairosvg
+
+        kwargs = {'url': str(svg_path), 'dpi': dpi}
+        if width:
+            kwargs['output_width'] = width
+        if height:
+            kwargs['output_height'] = height
+        if background != 'transparent':
+            kwargs['background'] = background
+
+        data = cairosvg.svg2png(**kwargs)
+
+        if max_size_kb and self._pillow_available and len(data) > max_size_kb * 1024:
+            try:
+                import io
+                from PIL import Image
+
+                buffer = io.BytesIO()
+                Image.open(io.BytesIO(data)).save(buffer, 'PNG', optimize=True, compress_level=9)
+                data = buffer.getvalue()
+            except Exception as e:
+                logger.warning(f"PNG optimization failed: {e}")
+
+        return data
+
     def _convert_with_cairosvg(
         self,
         svg_path: str,
@@ -5,12 +5,13 @@ import json
 import shutil
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from ruamel.yaml import YAML
 
 from .xml_differ import XMLDiffer, ChangeType, ElementType, XMLChange
 from .bsl_differ import BSLDiffer, BSLCodeExtractor
+from .bsl_lexer import scan_bsl
 from .change_mapper import ChangeMapper, YAMLUpdate, BSLUpdate, StructuralUpdate
 from .yaml_patcher import YAMLPatcher
 from .diff_visualizer import DiffVisualizer           
@@ -51,6 +52,7 @@ class SyncTool:
                                
         self.xml_differ = XMLDiffer(original_xml, modified_xml)
         self.mapper = ChangeMapper(config_path)
+        self.config = self.mapper.config
 
                                                                
         self.modified_tree = self.xml_differ.modified_tree
@@ -935,16 +937,13 @@ class SyncTool:
         yaml.sequence_indent = 2
         yaml.sequence_dash_offset = 0
 
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            config = yaml.load(f)
-
                            
         for update in self.yaml_updates:
-            self._apply_single_yaml_update(config, update)
+            self._apply_single_yaml_update(self.config, update)
 
                              
         with open(self.config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(config, f)
+            yaml.dump(self.config, f)
 
         logger.info("YAML updates applied successfully")
 
@@ -1062,31 +1061,15 @@ class SyncTool:
 
         logger.info("BSL updates applied successfully")
 
-    def _build_procedure_regex(self, procedure_name: str) -> 're.Pattern':
+    def _find_procedure_span(self, bsl_code: str, procedure_name: str) -> Optional[Tuple[int, int]]:
                    
-        import re
-
-                                                                 
-        escaped_name = re.escape(procedure_name)
-
-                       
-        pattern = re.compile(
-            rf'(?:&[А-ЯЁа-яёA-Za-z]+\s*)*'                                         
-            rf'(?:Процедура|Функция)\s+'                                    
-            rf'{escaped_name}'                                         
-            rf'\s*\([^)]*\)'                                            
-            rf'(?:\s+Экспорт)?'                                       
-            rf'.*?'                                             
-            rf'Конец(?:Процедуры|Функции)',               
-            re.DOTALL | re.IGNORECASE                                              
-        )
-
-        return pattern
+        proc = scan_bsl(bsl_code).find_procedure(procedure_name)
+        if proc is None or not proc.terminated:
+            return None
+        return proc.start, proc.end
 
     def _apply_single_bsl_update(self, bsl_code: str, update: BSLUpdate) -> str:
                                                 
-        import re
-
         if update.update_type == "add":
                                                                                 
                                           
@@ -1111,14 +1094,13 @@ class SyncTool:
                                                                                 
             if update.new_code and update.procedure_name:
                                                                                     
-                pattern = self._build_procedure_regex(update.procedure_name)
+                span = self._find_procedure_span(bsl_code, update.procedure_name)
 
                                            
-                match = pattern.search(bsl_code)
-                if match:
+                if span:
                                                              
-                    bsl_code = pattern.sub(update.new_code, bsl_code, count=1)
-                    logger.debug(f"Modified procedure '{update.procedure_name}' using regex matching")
+                    bsl_code = bsl_code[:span[0]] + update.new_code + bsl_code[span[1]:]
+                    logger.debug(f"Modified procedure '{update.procedure_name}' using BSL lexer spans")
                 else:
                                                        
                     logger.warning(f"Could not find procedure '{update.procedure_name}' to modify")
@@ -1129,6 +1111,21 @@ class SyncTool:
                     else:
                         logger.error(f"Failed to modify procedure '{update.procedure_name}' - not found in BSL code")
 
+        elif update.update_type == "rename":
+            span = self._find_procedure_span(bsl_code, update.old_procedure_name)
+            if span:
+                bsl_code = bsl_code[:span[0]] + update.new_code + bsl_code[span[1]:]
+                logger.debug(f"Renamed procedure '{update.old_procedure_name}' to '{update.procedure_name}' in place")
+            elif update.old_code and update.old_code in bsl_code:
+                bsl_code = bsl_code.replace(update.old_code, update.new_code)
+            else:
+                logger.warning(f"Could not find procedure '{update.old_procedure_name}' to rename, adding '{update.procedure_name}'")
+                bsl_code = self._apply_single_bsl_update(bsl_code, BSLUpdate(
+                    update_type="add",
+                    procedure_name=update.procedure_name,
+                    new_code=update.new_code
+                ))
+
         return bsl_code
 
     def _apply_structural_updates(self):
@@ -1145,7 +1142,7 @@ class SyncTool:
                 bsl_code = f.read()
 
                                 
-        patcher = YAMLPatcher(self.config_path, bsl_code)
+        patcher = YAMLPatcher(self.config_path, bsl_code, config=self.config)
 
                                       
         for update in self.structural_updates:
@@ -1,11 +1,16 @@
    
 
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 from jinja2 import Environment
 
 from .models import Template
 from .constants import ENCODING_UTF8_BOM
+from .profiling import span
+
+
+def _write_text(template: Template, path: Path, content: str, encoding: str) -> None:
+    path.write_text(content, encoding=encoding)
 
 
 def generate_template_ext_xml(template: Template) -> str:
@@ -38,7 +43,8 @@ def generate_template_ext_xml(template: Template) -> str:
 def write_template_content(
     template: Template,
     content_dir: Path,
-    dry_run: bool = False
+    dry_run: bool = False,
+    writer: Optional[Callable] = None
 ) -> str:
            
     if template.template_type == "HTMLDocument":
@@ -46,7 +52,7 @@ def write_template_content(
         for lang in ["ru", "uk", "en"]:
             content_file = content_dir / f"{lang}.html"
             if not dry_run:
-                content_file.write_text(template.content, encoding="utf-8")
+                (writer or _write_text)(template, content_file, template.content, "utf-8")
         return f"Template/ru.html, uk.html, en.html ({len(template.content)} bytes)"
 
     elif template.template_type == "SpreadsheetDocument":
@@ -58,7 +64,7 @@ def write_template_content(
                                             
         content_file = content_dir / "Template.txt"
         if not dry_run:
-            content_file.write_text(template.content or "", encoding="utf-8")
+            (writer or _write_text)(template, content_file, template.content or "", "utf-8")
         return f"Template/Template.txt ({len(template.content or '')} bytes)"
 
 
@@ -68,9 +74,12 @@ def generate_template_files(
     env: Environment,
     namespaces: str,
     platform_version: str,
-    dry_run: bool = False
+    dry_run: bool = False,
+    writer: Optional[Callable] = None,
+    create_dirs: bool = True
 ) -> None:
            
+    writer = writer or _write_text
     template_name = template.name
     print(f"      Template '{template_name}'...")
 
@@ -82,7 +91,7 @@ def generate_template_files(
     template_ext_dir = template_dir / "Ext"
     template_content_dir = template_ext_dir / "Template"
 
-    if not dry_run:
+    if not dry_run and create_dirs:
         templates_root_dir.mkdir(parents=True, exist_ok=True)
         template_dir.mkdir(parents=True, exist_ok=True)
         template_ext_dir.mkdir(parents=True, exist_ok=True)
@@ -100,17 +109,17 @@ def generate_template_files(
 
     template_meta_xml = templates_root_dir / f"{template_name}.xml"
     if not dry_run:
-        template_meta_xml.write_text(meta_content, encoding=ENCODING_UTF8_BOM)
+        writer(template, template_meta_xml, meta_content, ENCODING_UTF8_BOM)
     print(f"         {'📄' if dry_run else '✅'} {template_meta_xml.name}")
 
                                                                
     ext_template_xml = template_ext_dir / "Template.xml"
     ext_xml_content = generate_template_ext_xml(template)
     if not dry_run:
-        ext_template_xml.write_text(ext_xml_content, encoding=ENCODING_UTF8_BOM)
+        writer(template, ext_template_xml, ext_xml_content, ENCODING_UTF8_BOM)
 
                                
-    content_description = write_template_content(template, template_content_dir, dry_run)
+    content_description = write_template_content(template, template_content_dir, dry_run, writer)
     print(f"         {'📄' if dry_run else '✅'} {content_description}")
 
 
@@ -120,7 +129,9 @@ def generate_all_templates(
     env: Environment,
     namespaces: str,
     platform_version: str,
-    dry_run: bool = False
+    dry_run: bool = False,
+    writer: Optional[Callable] = None,
+    create_dirs: bool = True
 ) -> None:
            
     if not templates:
@@ -131,13 +142,16 @@ def generate_all_templates(
     templates_root_dir = processor_dir / "Templates"
 
     for template in templates:
-        generate_template_files(
-            template=template,
-            templates_root_dir=templates_root_dir,
-            env=env,
-            namespaces=namespaces,
-            platform_version=platform_version,
-            dry_run=dry_run
-        )
+        with span(f"template:{template.name}", category="template"):
+            generate_template_files(
+                template=template,
+                templates_root_dir=templates_root_dir,
+                env=env,
+                namespaces=namespaces,
+                platform_version=platform_version,
+                dry_run=dry_run,
+                writer=writer,
+                create_dirs=create_dirs
+            )
 
     print(f"      Templates generated: {len(templates)}")
@@ -0,0 +1,90 @@
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from .profiling import get_profiler
+
+RuleCheck = Callable[[object, str, str], Optional[Iterable[str]]]
+
+
+@dataclass
+class ValidationRule:
+    name: str
+    check: RuleCheck
+    node_types: Optional[FrozenSet[str]] = None
+    hits: int = 0
+    elapsed: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    def applies_to(self, node_type: str) -> bool:
+        return self.node_types is None or node_type in self.node_types
+
+
+class RuleEngine:
+
+    def __init__(self):
+        self.rules: Dict[str, ValidationRule] = {}
+        self.nodes = 0
+        self._dispatch: Dict[str, List[ValidationRule]] = {}
+
+    def register(self, name: str, check: RuleCheck, node_types: Optional[Iterable[str]] = None) -> ValidationRule:
+        rule = ValidationRule(name, check, frozenset(node_types) if node_types is not None else None)
+        self.rules[name] = rule
+        self._dispatch.clear()
+        return rule
+
+    def _rules_for(self, node_type: str) -> List[ValidationRule]:
+        rules = self._dispatch.get(node_type)
+        if rules is None:
+            rules = [rule for rule in self.rules.values() if rule.applies_to(node_type)]
+            self._dispatch[node_type] = rules
+        return rules
+
+    def visit(self, elements, form_name: str, parent_path: str = "", timed: Optional[bool] = None) -> None:
+        if timed is None:
+            timed = get_profiler() is not None
+        self._visit(elements, form_name, parent_path, time.perf_counter if timed else None)
+
+    def _visit(self, elements, form_name: str, parent_path: str, clock) -> None:
+        if not elements:
+            return
+
+        for elem in elements:
+            elem_path = f"{parent_path}/{elem.name}" if parent_path else elem.name
+            self.nodes += 1
+
+            for rule in self._rules_for(elem.element_type):
+                if clock is None:
+                    found = rule.check(elem, form_name, elem_path)
+                else:
+                    started = clock()
+                    found = rule.check(elem, form_name, elem_path)
+                    rule.elapsed += clock() - started
+                rule.hits += 1
+                if found:
+                    rule.errors.extend(found)
+
+            if elem.child_items:
+                self._visit(elem.child_items, form_name, elem_path, clock)
+
+    def flush(self, name: str) -> List[str]:
+        rule = self.rules[name]
+        errors, rule.errors = rule.errors, []
+        return errors
+
+    def reset(self) -> None:
+        self.nodes = 0
+        for rule in self.rules.values():
+            rule.hits = 0
+            rule.elapsed = 0.0
+            rule.errors = []
+
+    def slowest(self, limit: Optional[int] = None) -> List[ValidationRule]:
+        rules = sorted(self.rules.values(), key=lambda rule: rule.elapsed, reverse=True)
+        return rules[:limit] if limit is not None else rules
+
+    def report(self, limit: Optional[int] = 5) -> List[str]:
+        return [
+            f"{rule.name:<28} {rule.elapsed * 1000:8.2f} ms  {rule.hits:>7} викликів"
+            for rule in self.slowest(limit)
+        ]
@@ -8,6 +8,10 @@ from .constants import (
     VALID_STD_PICTURES, BSL_RESERVED_KEYWORDS, FORM_BUILTIN_METHODS,
     VALID_FUNCTION_KEYS, VALID_SPECIAL_KEYS, VALID_MODIFIERS, VALID_KEY_NAMES,
 )
+from .bsl_lexer import scan_bsl
+from .form_index import FormIndex
+from .profiling import span
+from .validation_rules import RuleEngine
 
                                                                                                    
 RESERVED_METADATA_NAMES = {
@@ -631,6 +635,52 @@ def validate_reserved_metadata_name(name: str, object_type: str = "об'єкт")
     return True, ""
 
 
+ELEMENT_ENUM_PROPERTIES = (
+    ('horizontal_align', VALID_HORIZONTAL_ALIGN),
+    ('vertical_align', VALID_VERTICAL_ALIGN),
+    ('title_location', VALID_TITLE_LOCATION),
+    ('group_direction', VALID_GROUP_DIRECTION),
+    ('behavior', VALID_BEHAVIOR),
+    ('radio_button_type', VALID_RADIO_BUTTON_TYPE),
+    ('picture_size', VALID_PICTURE_SIZE),
+    ('initial_tree_view', VALID_INITIAL_TREE_VIEW),
+    ('choice_mode', VALID_CHOICE_MODE),
+    ('choice_folders_and_items', VALID_CHOICE_FOLDERS_AND_ITEMS),
+    ('choice_history_on_input', VALID_CHOICE_HISTORY_ON_INPUT),
+    ('stretch', VALID_STRETCH),
+    ('period', VALID_PLANNER_PERIOD),
+    ('group_layout', VALID_GROUP_LAYOUT),
+    ('time_scale', VALID_TIME_SCALE),
+    ('tooltip_representation', VALID_TOOLTIP_REPRESENTATION),
+    ('choice_button_representation', VALID_CHOICE_BUTTON_REPRESENTATION),
+)
+
+REPRESENTATION_BY_ELEMENT_TYPE = {
+    'Table': VALID_TABLE_REPRESENTATION,
+    'Button': VALID_BUTTON_REPRESENTATION,
+    'Popup': VALID_POPUP_REPRESENTATION,
+    'UsualGroup': VALID_REPRESENTATION,
+}
+
+
+def _conditional_appearance_color_errors(conditional_appearances, context: str) -> List[str]:
+    errors = []
+    for i, ca in enumerate(conditional_appearances):
+        app = getattr(ca, 'appearance', None)
+        if not app:
+            continue
+        for color_attr in ('text_color', 'back_color', 'border_color'):
+            color_val = getattr(app, color_attr, None)
+            if color_val:
+                is_valid, error = validate_color(
+                    color_val, color_attr,
+                    f"{context}: conditional_appearances[{i}].appearance"
+                )
+                if not is_valid:
+                    errors.append(error)
+    return errors
+
+
 class ProcessorValidator:
                                                 
 
@@ -638,6 +688,19 @@ class ProcessorValidator:
         self.processor = processor
         self.errors = []
         self.warnings = []
+        self.rules = self._build_rules()
+        self._valid_attrs: Set[str] = set()
+
+    def _build_rules(self) -> RuleEngine:
+        rules = RuleEngine()
+        rules.register("element.picture", self._check_element_picture, ("PictureDecoration", "Button"))
+        rules.register("element.choice_list", self._check_element_choice_list, ("InputField", "RadioButtonField"))
+        rules.register("element.properties", self._check_element_properties)
+        rules.register("element.attribute_ref", self._check_element_attribute_ref)
+        return rules
+
+    def rule_report(self, limit: Optional[int] = 5) -> List[str]:
+        return self.rules.report(limit)
 
     def _validate_name_and_reserved(self, name: str, context: str, object_type: str = "об'єкт") -> None:
                    
@@ -705,6 +768,8 @@ class ProcessorValidator:
                    
         self.errors = []
         self.warnings = []
+        self.rules.reset()
+        processor_attrs = {a.name for a in self.processor.attributes}
 
                          
         is_valid, error = validate_processor_name(self.processor.name)
@@ -770,27 +835,22 @@ class ProcessorValidator:
                     self._validate_column(col.name, col.type, f"Форма '{form.name}' - ValueTable колонка '{vt.name}.{col.name}'")
 
                                                     
-        for form in self.processor.forms:
+        form_indexes = [FormIndex(form) for form in self.processor.forms]
+        for form, form_index in zip(self.processor.forms, form_indexes):
             for dl in form.dynamic_list_attributes:
                 self._validate_name_and_reserved(dl.name, f"Форма '{form.name}' - DynamicList '{dl.name}'", "DynamicList атрибут")
 
                                                                        
                 if dl.use_always_fields:
                                                               
-                    has_table = any(
-                        elem.element_type == "Table"
-                        and elem.properties.get("is_dynamic_list", False)
-                        and elem.tabular_section == dl.name
-                        for elem in form.elements
-                    )
-                    if not has_table:
+                    if not form_index.has_dynamic_list_table(dl.name):
                         self.warnings.append(
                             f"Форма '{form.name}' - DynamicList '{dl.name}': use_always_fields визначено, але немає Table "
                             f"на формі для відображення цього списку. UseAlways буде проігноровано."
                         )
 
                                                                
-        for form in self.processor.forms:
+        for form, form_index in zip(self.processor.forms, form_indexes):
                                        
             for elem in form.elements:
                                                                                         
@@ -831,31 +891,18 @@ class ProcessorValidator:
                     if not is_valid:
                         self.errors.append(f"Форма '{form.name}' - Команда '{cmd.name}': {error}")
 
-                                                                                         
-            self._validate_element_pictures(form.elements, form.name)
-
-                                                                
-            self._validate_element_choice_lists(form.elements, form.name)
-
-                                                                                                      
-            self._validate_element_properties(form.elements, form.name)
+            self._valid_attrs = processor_attrs | set(form_index.form_attributes)
+            with span("validate.elements", form=form.name):
+                self.rules.visit(form.elements, form.name)
+            self.errors.extend(self.rules.flush("element.picture"))
+            self.errors.extend(self.rules.flush("element.choice_list"))
+            self.errors.extend(self.rules.flush("element.properties"))
 
                                                                      
             if hasattr(form, 'conditional_appearances') and form.conditional_appearances:
-                context = f"Форма '{form.name}'"
-                for i, ca in enumerate(form.conditional_appearances):
-                                                                                                
-                    if hasattr(ca, 'appearance') and ca.appearance:
-                        app = ca.appearance
-                        for color_attr in ['text_color', 'back_color', 'border_color']:
-                            color_val = getattr(app, color_attr, None)
-                            if color_val:
-                                is_valid, error = validate_color(
-                                    color_val, color_attr,
-                                    f"{context}: conditional_appearances[{i}].appearance"
-                                )
-                                if not is_valid:
-                                    self.errors.append(error)
+                self.errors.extend(
+                    _conditional_appearance_color_errors(form.conditional_appearances, f"Форма '{form.name}'")
+                )
 
                                                    
         self._validate_long_operations()
@@ -998,62 +1045,17 @@ class ProcessorValidator:
             self.warnings.append("Форма не має жодного елемента")
 
                                                                   
-        ref_errors = self._validate_form_element_references()
-        self.errors.extend(ref_errors)
+        self.errors.extend(self.rules.flush("element.attribute_ref"))
 
         return len(self.errors) == 0, self.errors, self.warnings
 
-    def _validate_form_element_references(self) -> List[str]:
-                   
-        errors = []
-        processor_attrs = {a.name for a in self.processor.attributes}
-
-        for form in self.processor.forms:
-                                           
-            form_attrs = set()
-            if hasattr(form, 'form_attributes') and form.form_attributes:
-                form_attrs = {a.name for a in form.form_attributes}
-
-                                                       
-            valid_attrs = processor_attrs | form_attrs
-
-            errors.extend(self._check_element_attribute_refs(
-                form.elements,
-                form.name,
-                valid_attrs
-            ))
-
-        return errors
-
-    def _check_element_attribute_refs(
-        self,
-        elements,
-        form_name: str,
-        valid_attrs: set
-    ) -> List[str]:
-                   
-        errors = []
-        if not elements:
-            return errors
-
-        for elem in elements:
-                                             
-            if hasattr(elem, 'attribute') and elem.attribute:
-                if elem.attribute not in valid_attrs:
-                    errors.append(
-                        f"Form '{form_name}', {elem.element_type} '{elem.name}': "
-                        f"attribute '{elem.attribute}' not found in processor.attributes"
-                    )
-
-                                                
-            if hasattr(elem, 'child_items') and elem.child_items:
-                errors.extend(self._check_element_attribute_refs(
-                    elem.child_items,
-                    form_name,
-                    valid_attrs
-                ))
-
-        return errors
+    def _check_element_attribute_ref(self, elem, form_name: str, elem_path: str) -> Optional[List[str]]:
+        if elem.attribute and elem.attribute not in self._valid_attrs:
+            return [
+                f"Form '{form_name}', {elem.element_type} '{elem.name}': "
+                f"attribute '{elem.attribute}' not found in processor.attributes"
+            ]
+        return None
 
     def _validate_bsl_code(self, code: str, module_name: str) -> Tuple[List[str], List[str]]:
                    
@@ -1063,27 +1065,22 @@ class ProcessorValidator:
         if not code or not code.strip():
             return errors, warnings
 
-                                              
-        pattern = re.compile(
-            r'^\s*(?:&\w+\s+)?(?:Процедура|Функция|Procedure|Function|Асинх|Async)\s+(\w+)',
-            re.MULTILINE | re.IGNORECASE
-        )
-        procedures = pattern.findall(code)
+        procedures = scan_bsl(code).procedures
 
                                             
-        for proc_name in procedures:
-            if proc_name in BSL_RESERVED_KEYWORDS:
+        for proc in procedures:
+            if proc.name in BSL_RESERVED_KEYWORDS:
                 errors.append(
-                    f"{module_name}: процедура '{proc_name}' конфліктує з зарезервованим словом BSL"
+                    f"{module_name} (рядок {proc.header_line}): процедура '{proc.name}' конфліктує з зарезервованим словом BSL"
                 )
 
                                                                   
                                                                               
         ukrainian_pattern = re.compile(r'[іІїЇєЄґҐ]')
-        for proc_name in procedures:
-            if ukrainian_pattern.search(proc_name):
+        for proc in procedures:
+            if ukrainian_pattern.search(proc.name):
                 errors.append(
-                    f"{module_name}: процедура '{proc_name}' містить українські літери (і, ї, є, ґ). "
+                    f"{module_name} (рядок {proc.header_line}): процедура '{proc.name}' містить українські літери (і, ї, є, ґ). "
                     f"Використовуйте тільки латиницю або російську кирилицю для назв процедур."
                 )
 
@@ -1125,150 +1122,74 @@ class ProcessorValidator:
 
         return errors, warnings
 
-    def _validate_element_pictures(self, elements, form_name: str, parent_path: str = "") -> None:
-                   
-        if not elements:
-            return
-
-        for elem in elements:
-            elem_path = f"{parent_path}/{elem.name}" if parent_path else elem.name
-
-                                                              
-            if elem.element_type in ("PictureDecoration", "Button"):
-                picture = elem.properties.get('picture') if elem.properties else None
-                if picture:
-                    is_valid, error = validate_picture(picture)
-                    if not is_valid:
-                        self.errors.append(f"Форма '{form_name}' - {elem.element_type} '{elem_path}': {error}")
-
-                                                              
-            if elem.child_items:
-                self._validate_element_pictures(elem.child_items, form_name, elem_path)
-
-    def _validate_element_choice_lists(self, elements, form_name: str, parent_path: str = "") -> None:
-                   
-        if not elements:
-            return
-
-        for elem in elements:
-            elem_path = f"{parent_path}/{elem.name}" if parent_path else elem.name
-
-                                                                    
-            if elem.element_type in ("InputField", "RadioButtonField"):
-                choice_list = elem.properties.get('choice_list') if elem.properties else None
-                if choice_list:
-                    context = f"Форма '{form_name}' - {elem.element_type} '{elem_path}'"
-                    is_valid, error = validate_choice_list(choice_list, context)
-                    if not is_valid:
-                        self.errors.append(error)
-
-                                             
-            if elem.child_items:
-                self._validate_element_choice_lists(elem.child_items, form_name, elem_path)
-
-    def _validate_element_properties(self, elements, form_name: str, parent_path: str = "") -> None:
-                   
-        if not elements:
-            return
+    def _check_element_picture(self, elem, form_name: str, elem_path: str) -> Optional[List[str]]:
+        picture = elem.properties.get('picture') if elem.properties else None
+        if picture:
+            is_valid, error = validate_picture(picture)
+            if not is_valid:
+                return [f"Форма '{form_name}' - {elem.element_type} '{elem_path}': {error}"]
+        return None
 
-        for elem in elements:
-            elem_path = f"{parent_path}/{elem.name}" if parent_path else elem.name
+    def _check_element_choice_list(self, elem, form_name: str, elem_path: str) -> Optional[List[str]]:
+        choice_list = elem.properties.get('choice_list') if elem.properties else None
+        if choice_list:
             context = f"Форма '{form_name}' - {elem.element_type} '{elem_path}'"
-            props = elem.properties or {}
-
-                                      
-            enum_checks = [
-                ('horizontal_align', VALID_HORIZONTAL_ALIGN),
-                ('vertical_align', VALID_VERTICAL_ALIGN),
-                ('title_location', VALID_TITLE_LOCATION),
-                ('group_direction', VALID_GROUP_DIRECTION),
-                ('behavior', VALID_BEHAVIOR),
-                ('radio_button_type', VALID_RADIO_BUTTON_TYPE),
-                ('picture_size', VALID_PICTURE_SIZE),
-                                                        
-                ('initial_tree_view', VALID_INITIAL_TREE_VIEW),
-                ('choice_mode', VALID_CHOICE_MODE),
-                ('choice_folders_and_items', VALID_CHOICE_FOLDERS_AND_ITEMS),
-                ('choice_history_on_input', VALID_CHOICE_HISTORY_ON_INPUT),
-                ('stretch', VALID_STRETCH),
-                ('period', VALID_PLANNER_PERIOD),
-                ('group_layout', VALID_GROUP_LAYOUT),
-                ('time_scale', VALID_TIME_SCALE),
-                ('tooltip_representation', VALID_TOOLTIP_REPRESENTATION),
-                ('choice_button_representation', VALID_CHOICE_BUTTON_REPRESENTATION),
-            ]
-            for prop_name, valid_values in enum_checks:
-                if prop_name in props:
-                    is_valid, error = validate_enum(
-                        props[prop_name], valid_values, prop_name, context
-                    )
-                    if not is_valid:
-                        self.errors.append(error)
-
-                                                                       
-            if 'representation' in props:
-                if elem.element_type == 'Table':
-                    valid_repr = VALID_TABLE_REPRESENTATION
-                elif elem.element_type == 'Button':
-                    valid_repr = VALID_BUTTON_REPRESENTATION
-                elif elem.element_type == 'Popup':
-                    valid_repr = VALID_POPUP_REPRESENTATION
-                elif elem.element_type == 'UsualGroup':
-                    valid_repr = VALID_REPRESENTATION
-                else:
-                                                                       
-                    valid_repr = None
+            is_valid, error = validate_choice_list(choice_list, context)
+            if not is_valid:
+                return [error]
+        return None
 
-                if valid_repr is not None:
-                    is_valid, error = validate_enum(
-                        props['representation'], valid_repr, 'representation', context
-                    )
-                    if not is_valid:
-                        self.errors.append(error)
+    def _check_element_properties(self, elem, form_name: str, elem_path: str) -> Optional[List[str]]:
+        errors = []
+        context = f"Форма '{form_name}' - {elem.element_type} '{elem_path}'"
+        props = elem.properties or {}
 
-                                               
-            if 'pages_representation' in props:
+        for prop_name, valid_values in ELEMENT_ENUM_PROPERTIES:
+            if prop_name in props:
                 is_valid, error = validate_enum(
-                    props['pages_representation'], VALID_PAGES_REPRESENTATION, 'pages_representation', context
+                    props[prop_name], valid_values, prop_name, context
                 )
                 if not is_valid:
-                    self.errors.append(error)
+                    errors.append(error)
 
-                                     
-            if 'font' in props:
-                is_valid, error = validate_font(props['font'], context)
+                                                                       
+        if 'representation' in props:
+            valid_repr = REPRESENTATION_BY_ELEMENT_TYPE.get(elem.element_type)
+            if valid_repr is not None:
+                is_valid, error = validate_enum(
+                    props['representation'], valid_repr, 'representation', context
+                )
                 if not is_valid:
-                    self.errors.append(error)
+                    errors.append(error)
 
-                                       
-            color_props = ['text_color', 'back_color', 'border_color']
-            for color_prop in color_props:
-                if color_prop in props:
-                    is_valid, error = validate_color(
-                        props[color_prop], color_prop, context
-                    )
-                    if not is_valid:
-                        self.errors.append(error)
+                                               
+        if 'pages_representation' in props:
+            is_valid, error = validate_enum(
+                props['pages_representation'], VALID_PAGES_REPRESENTATION, 'pages_representation', context
+            )
+            if not is_valid:
+                errors.append(error)
 
-                                                                      
-            if hasattr(elem, 'conditional_appearances') and elem.conditional_appearances:
-                for i, ca in enumerate(elem.conditional_appearances):
-                                                                                                
-                    if hasattr(ca, 'appearance') and ca.appearance:
-                        app = ca.appearance
-                        for color_attr in ['text_color', 'back_color', 'border_color']:
-                            color_val = getattr(app, color_attr, None)
-                            if color_val:
-                                is_valid, error = validate_color(
-                                    color_val, color_attr,
-                                    f"{context}: conditional_appearances[{i}].appearance"
-                                )
-                                if not is_valid:
-                                    self.errors.append(error)
+                             
+        if 'font' in props:
+            is_valid, error = validate_font(props['font'], context)
+            if not is_valid:
+                errors.append(error)
 
-                                             
-            if elem.child_items:
-                self._validate_element_properties(elem.child_items, form_name, elem_path)
+                               
+        for color_prop in ('text_color', 'back_color', 'border_color'):
+            if color_prop in props:
+                is_valid, error = validate_color(
+                    props[color_prop], color_prop, context
+                )
+                if not is_valid:
+                    errors.append(error)
+
+                                                              
+        if elem.conditional_appearances:
+            errors.extend(_conditional_appearance_color_errors(elem.conditional_appearances, context))
+
+        return errors
 
     def _validate_form_modules(self) -> Tuple[List[str], List[str]]:
                    
@@ -1314,12 +1235,6 @@ class ProcessorValidator:
 class HandlerValidator:
            
 
-                                                     
-    SIGNATURE_PATTERN = re.compile(
-        r'^(\s*&\w+\s*\n)?\s*(Процедура|Функция|Procedure|Function|Асинх|Async)\s+(\w+)',
-        re.MULTILINE | re.IGNORECASE
-    )
-
                                   
     DIRECTIVE_PATTERN = re.compile(
         r'^\s*&(НаКлиенте|НаСервере|НаСервереБезКонтекста|НаКлиентеНаСервереБезКонтекста|'
@@ -1327,12 +1242,6 @@ class HandlerValidator:
         re.MULTILINE | re.IGNORECASE
     )
 
-                                           
-    END_PROCEDURE_PATTERN = re.compile(
-        r'(КонецПроцедуры|КонецФункции|EndProcedure|EndFunction)',
-        re.IGNORECASE
-    )
-
                                                                       
                                                        
     OBJECT_ACCESS_PATTERN = re.compile(
@@ -1490,15 +1399,15 @@ class HandlerValidator:
                 )
 
                                                                 
-            sig_match = self.SIGNATURE_PATTERN.search(handler_code)
-            if not sig_match:
+            procedures = scan_bsl(handler_code).procedures
+            if not procedures:
                 errors.append(
                     f"Handler '{handler_name}' не має коректної сигнатури. "
                     f"Очікується: Процедура {handler_name}(...) або Функция {handler_name}(...)"
                 )
             else:
                                                                          
-                proc_name = sig_match.group(3)
+                proc_name = procedures[0].name
                 if proc_name != handler_name:
                     warnings.append(
                         f"Handler '{handler_name}' має іншу назву в сигнатурі: '{proc_name}'. "
@@ -1506,7 +1415,7 @@ class HandlerValidator:
                     )
 
                                                       
-            if not self.END_PROCEDURE_PATTERN.search(handler_code):
+            if not any(proc.terminated for proc in procedures):
                 errors.append(
                     f"Handler '{handler_name}' не має закриваючого тегу "
                     f"(КонецПроцедуры/КонецФункции). "
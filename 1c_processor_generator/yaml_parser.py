@@ -1,9 +1,10 @@
    
 
-import yaml
+import os
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from difflib import get_close_matches
 
 from .models import (
@@ -32,6 +33,10 @@ from .models import (
 )
 from .test_parser import parse_tests_yaml
 from .parsing import ElementParser, normalize_multilang
+from .profiling import span
+from .config_cache import ConfigCache, content_hash, load_yaml_bytes, load_yaml_bytes_fast
+from .file_prefetch import FilePrefetcher, InputRecorder
+from .include_cache import clone_structure, get_include_cache
 
 
                                                                                
@@ -228,110 +233,123 @@ ELEMENT_TYPE_ALIASES = {
 }
 
 
-def _normalize_form_attribute_types(config: Dict) -> tuple:
-           
-    warnings = []
-    if "forms" not in config:
-        return config, warnings
+class _TypeNormalizer:
+
+    def __init__(self):
+        self.form_attribute_warnings: List[str] = []
+        self.element_warnings: List[str] = []
+        self.attribute_warnings: List[str] = []
+
+    @property
+    def warnings(self) -> List[str]:
+        return self.form_attribute_warnings + self.element_warnings + self.attribute_warnings
 
-    for form in config["forms"]:
+    @staticmethod
+    def _canonicalize(item: Dict, aliases: Dict[str, str]) -> Optional[str]:
+        original = item["type"]
+        normalized = aliases.get(original, original)
+        if normalized == original:
+            return None
+        item["type"] = normalized
+        return f"type '{original}' → '{normalized}'"
+
+    def visit_config(self, config: Dict) -> None:
+        if not isinstance(config, dict):
+            return
+
+        for form in config.get("forms") or []:
+            if isinstance(form, dict):
+                self.visit_form(form)
+
+        for attr in config.get("attributes") or []:
+            if isinstance(attr, dict) and "type" in attr:
+                change = self._canonicalize(attr, FORM_ATTRIBUTE_TYPE_ALIASES)
+                if change:
+                    self.attribute_warnings.append(f"attribute '{attr.get('name', '?')}': {change}")
+
+        for owner_kind, owners in (
+            ("tabular_section", config.get("tabular_sections")),
+            ("value_table", config.get("value_tables")),
+        ):
+            for owner in owners or []:
+                for col in owner.get("columns") or []:
+                    if isinstance(col, dict) and "type" in col:
+                        change = self._canonicalize(col, FORM_ATTRIBUTE_TYPE_ALIASES)
+                        if change:
+                            self.attribute_warnings.append(
+                                f"{owner_kind} '{owner.get('name', '?')}'.'{col.get('name', '?')}': {change}"
+                            )
+
+    def visit_form(self, form: Dict) -> None:
         form_name = form.get("name", "Unknown")
-        if "form_attributes" not in form:
-            continue
-        for attr in form["form_attributes"]:
-            if "type" in attr:
-                original = attr["type"]
-                normalized = FORM_ATTRIBUTE_TYPE_ALIASES.get(original, original)
-                if normalized != original:
-                    attr["type"] = normalized
-                    warnings.append(
-                        f"form_attribute '{attr.get('name', '?')}' in form '{form_name}': "
-                        f"type '{original}' → '{normalized}'"
+
+        for attr in form.get("form_attributes") or []:
+            if isinstance(attr, dict) and "type" in attr:
+                change = self._canonicalize(attr, FORM_ATTRIBUTE_TYPE_ALIASES)
+                if change:
+                    self.form_attribute_warnings.append(
+                        f"form_attribute '{attr.get('name', '?')}' in form '{form_name}': {change}"
                     )
 
-    return config, warnings
+        self.visit_elements(form.get("elements") or [], form_name)
 
+    def visit_elements(self, elements: List[Dict], form_name: str) -> None:
+        for elem in elements:
+            if not isinstance(elem, dict):
+                continue
 
-def _normalize_element_types_recursive(elements: List[Dict], form_name: str, warnings: List[str]) -> None:
-                                                                   
-    for elem in elements:
-        if "type" in elem:
-            original = elem["type"]
-            normalized = ELEMENT_TYPE_ALIASES.get(original, original)
-            if normalized != original:
-                elem["type"] = normalized
-                warnings.append(
-                    f"element '{elem.get('name', '?')}' in form '{form_name}': "
-                    f"type '{original}' → '{normalized}'"
-                )
+            if "type" in elem:
+                change = self._canonicalize(elem, ELEMENT_TYPE_ALIASES)
+                if change:
+                    self.element_warnings.append(
+                        f"element '{elem.get('name', '?')}' in form '{form_name}': {change}"
+                    )
 
-                                      
-        if "elements" in elem:
-            _normalize_element_types_recursive(elem["elements"], form_name, warnings)
+                                  
+            if "elements" in elem:
+                self.visit_elements(elem["elements"] or [], form_name)
 
-                                                
-        if "pages" in elem:
-            for page in elem["pages"]:
-                if "elements" in page:
-                    _normalize_element_types_recursive(page["elements"], form_name, warnings)
+                                            
+            for page in elem.get("pages") or []:
+                if isinstance(page, dict) and "elements" in page:
+                    self.visit_elements(page["elements"] or [], form_name)
 
 
-def _normalize_element_types(config: Dict) -> tuple:
-           
-    warnings = []
-    if "forms" not in config:
-        return config, warnings
+def _normalize_config_types(config: Dict) -> List[str]:
+    normalizer = _TypeNormalizer()
+    normalizer.visit_config(config)
+    return normalizer.warnings
 
-    for form in config["forms"]:
-        form_name = form.get("name", "Unknown")
-        if "elements" in form:
-            _normalize_element_types_recursive(form["elements"], form_name, warnings)
 
-    return config, warnings
+@lru_cache(maxsize=1)
+def _load_yaml_schema() -> Dict:
+    schema_path = Path(__file__).parent / "yaml_schema.json"
+    with open(schema_path, "r", encoding="utf-8") as f:
+        return json.load(f)
 
 
-def _normalize_attribute_types(config: Dict) -> tuple:
-           
-    warnings = []
+@lru_cache(maxsize=1)
+def _get_schema_validator():
+    try:
+        import jsonschema
+    except ImportError:
+        raise ImportError(
+            "jsonschema is required for YAML validation.\n"
+            "Install it with: pip install jsonschema\n"
+            "Or install all dependencies: pip install -r requirements.txt"
+        )
 
-                                    
-    for attr in config.get("attributes", []):
-        if "type" in attr:
-            original = attr["type"]
-            normalized = FORM_ATTRIBUTE_TYPE_ALIASES.get(original, original)
-            if normalized != original:
-                attr["type"] = normalized
-                warnings.append(
-                    f"attribute '{attr.get('name', '?')}': type '{original}' → '{normalized}'"
-                )
+    schema = _load_yaml_schema()
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
 
-                                        
-    for ts in config.get("tabular_sections", []):
-        for col in ts.get("columns", []):
-            if "type" in col:
-                original = col["type"]
-                normalized = FORM_ATTRIBUTE_TYPE_ALIASES.get(original, original)
-                if normalized != original:
-                    col["type"] = normalized
-                    warnings.append(
-                        f"tabular_section '{ts.get('name', '?')}'.'{col.get('name', '?')}': "
-                        f"type '{original}' → '{normalized}'"
-                    )
 
-                                    
-    for vt in config.get("value_tables", []):
-        for col in vt.get("columns", []):
-            if "type" in col:
-                original = col["type"]
-                normalized = FORM_ATTRIBUTE_TYPE_ALIASES.get(original, original)
-                if normalized != original:
-                    col["type"] = normalized
-                    warnings.append(
-                        f"value_table '{vt.get('name', '?')}'.'{col.get('name', '?')}': "
-                        f"type '{original}' → '{normalized}'"
-                    )
+def iter_schema_errors(config: Dict) -> List:
+    from jsonschema.exceptions import best_match, relevance
 
-    return config, warnings
+    errors = sorted(_get_schema_validator().iter_errors(config), key=relevance, reverse=True)
+    return [best_match([error]) for error in errors]
 
 
 class YAMLParser:
@@ -340,10 +358,22 @@ class YAMLParser:
                                                   
     DEFAULT_LANGUAGES = ["ru", "uk", "en"]
 
-    def __init__(self, yaml_path: Path):
+    def __init__(self, yaml_path: Path, config_cache: Optional[ConfigCache] = None):
                    
         self.yaml_path = Path(yaml_path)
         self.config: Dict = {}
+        self._config_cache = config_cache
+        self._load_yaml_bytes = load_yaml_bytes_fast if config_cache is not None else load_yaml_bytes
+        self._root_bytes: Optional[bytes] = None
+        self._root_hash: Optional[str] = None
+        self._normalization_warnings: List[str] = []
+        self._includes: Dict[str, Dict] = {}
+        self._include_hashes: Dict[str, str] = {}
+        self._cache_hit = False
+        self._include_cache = get_include_cache()
+        self.inputs = InputRecorder()
+        self.inputs.record(self.yaml_path)
+        self._files = FilePrefetcher(cache=self._include_cache, inputs=self.inputs)
         self._element_parser = ElementParser()
                                               
         self.languages: List[str] = self.DEFAULT_LANGUAGES.copy()
@@ -351,8 +381,9 @@ class YAMLParser:
     def load_yaml(self) -> bool:
                    
         try:
-            with open(self.yaml_path, "r", encoding="utf-8") as f:
-                self.config = yaml.safe_load(f)
+            with span("yaml.load", path=self.yaml_path):
+                data = self._root_bytes if self._root_bytes is not None else self.yaml_path.read_bytes()
+                self.config = self._load_yaml_bytes(data)
             return True
         except Exception as e:
             print(f"❌ Помилка читання YAML: {e}")
@@ -361,54 +392,144 @@ class YAMLParser:
     def validate_schema(self) -> bool:
                    
         try:
-            schema_path = Path(__file__).parent / "yaml_schema.json"
-            with open(schema_path, "r", encoding="utf-8") as f:
-                schema = json.load(f)
+            _get_schema_validator()
 
-            try:
-                import jsonschema
-            except ImportError:
-                raise ImportError(
-                    "jsonschema is required for YAML validation.\n"
-                    "Install it with: pip install jsonschema\n"
-                    "Or install all dependencies: pip install -r requirements.txt"
-                )
+                                                          
+                                                          
+            with span("yaml.normalize_types"):
+                warnings = _normalize_config_types(self.config)
 
-            try:
-                                                              
-                                                              
-                self.config, attr_warnings = _normalize_form_attribute_types(self.config)
-                self.config, elem_warnings = _normalize_element_types(self.config)
-                self.config, type_warnings = _normalize_attribute_types(self.config)
+            with span("yaml.validate_schema"):
+                errors = iter_schema_errors(self.config)
+            if errors:
+                self._print_validation_errors(errors)
+                return False
+            print("✅ YAML структура валідна")
 
-                jsonschema.validate(instance=self.config, schema=schema)
-                print("✅ YAML структура валідна")
+                                                   
+            self._normalization_warnings = warnings
+            self._print_normalization_warnings(self._normalization_warnings)
 
-                                                       
-                all_warnings = attr_warnings + elem_warnings + type_warnings
-                if all_warnings:
-                    print(f"⚠️  Виправлено {len(all_warnings)} тип(ів) - використовуйте канонічні формати:")
-                    for warning in all_warnings:
-                        print(f"   • {warning}")
-                    print("   📖 Канонічні формати: types → snake_case, elements → PascalCase")
-
-                return True
-            except jsonschema.ValidationError as e:
-                                                                      
-                enhanced_message = self._enhance_validation_error(e)
+            return True
+        except Exception as e:
+            print(f"❌ Помилка валідації: {e}")
+            return False
+
+    def _print_validation_errors(self, errors: List) -> None:
+        if len(errors) > 1:
+            print(f"❌ YAML структура не валідна ({len(errors)} помилок):")
+        for index, error in enumerate(errors, start=1):
+                                                                  
+            enhanced_message = self._enhance_validation_error(error)
+            if len(errors) > 1:
+                print(f"   {index}. {enhanced_message}")
+            else:
                 print(f"❌ YAML структура не валідна: {enhanced_message}")
-                print(f"   Шлях: {' -> '.join(str(p) for p in e.path)}")
+            print(f"   Шлях: {' -> '.join(str(p) for p in error.path)}")
 
-                                                    
-                suggestion = self._get_validation_suggestion(e)
-                if suggestion:
-                    print(f"   💡 {suggestion}")
+                                                
+            suggestion = self._get_validation_suggestion(error)
+            if suggestion:
+                print(f"   💡 {suggestion}")
 
+    @staticmethod
+    def _print_normalization_warnings(warnings: List[str]) -> None:
+        if warnings:
+            print(f"⚠️  Виправлено {len(warnings)} тип(ів) - використовуйте канонічні формати:")
+            for warning in warnings:
+                print(f"   • {warning}")
+            print("   📖 Канонічні формати: types → snake_case, elements → PascalCase")
+
+    def _load_cached_config(self) -> bool:
+        if self._config_cache is None:
+            return False
+
+        with span("yaml.cache_lookup"):
+            try:
+                self._root_bytes = self.yaml_path.read_bytes()
+            except OSError:
                 return False
-        except Exception as e:
-            print(f"❌ Помилка валідації: {e}")
+            self._root_hash = content_hash(self._root_bytes)
+            entry = self._config_cache.load(self.yaml_path, self._root_hash)
+
+        if entry is None:
             return False
 
+        self.config = entry["config"]
+        self._includes = entry["includes"]
+        self._include_hashes = entry["include_hashes"]
+        self._normalization_warnings = entry["warnings"]
+        self._cache_hit = True
+        print("✅ YAML структура валідна (кеш)")
+        self._print_normalization_warnings(self._normalization_warnings)
+        return True
+
+    def _store_cached_config(self) -> None:
+        if self._config_cache is None or self._root_hash is None or self._cache_hit:
+            return
+
+        with span("yaml.cache_store"):
+            for form_config in self.config.get("forms") or []:
+                if not isinstance(form_config, dict) or "include" not in form_config:
+                    continue
+                if str(self._resolve_path(form_config["include"])) not in self._includes:
+                    return
+
+            self._config_cache.save(
+                self.yaml_path,
+                self._root_hash,
+                self.config,
+                self._normalization_warnings,
+                self._includes,
+                self._include_hashes,
+            )
+
+    def _prefetch_files(self) -> None:
+        with span("yaml.prefetch"):
+            forms = [f for f in self.config.get("forms") or [] if isinstance(f, dict)]
+            includes = [(f, self._resolve_path(f["include"])) for f in forms if f.get("include")]
+
+            paths = [include_path for _, include_path in includes]
+            paths += [self._resolve_path(f["documentation_file"]) for f in forms if f.get("documentation_file")]
+            for tmpl_config in self.config.get("templates") or []:
+                if not isinstance(tmpl_config, dict):
+                    continue
+                if tmpl_config.get("file"):
+                    content_path = self._resolve_path(tmpl_config["file"])
+                    if str(content_path).lower().endswith(".xlsx"):
+                        self._prefetch_excel_conversion(content_path)
+                    else:
+                        paths.append(content_path)
+                if tmpl_config.get("automation"):
+                    paths.append(self._resolve_path(tmpl_config["automation"]))
+            self._files.prefetch(paths)
+
+            for form_config, include_path in includes:
+                key = str(include_path)
+                if key not in self._includes:
+                    try:
+                        data = self._files.read_bytes(include_path)
+                        self._includes[key] = self._include_cache.parse_shared(include_path, data, self._load_yaml_bytes)
+                    except Exception:
+                        continue
+                    self._include_hashes[key] = content_hash(data)
+
+                included_config = self._includes[key]
+                if (
+                    isinstance(included_config, dict)
+                    and included_config.get("documentation_file")
+                    and "documentation_file" not in form_config
+                ):
+                    self._files.prefetch([self._resolve_path(included_config["documentation_file"])])
+
+    def _prefetch_excel_conversion(self, content_path: Path) -> None:
+        try:
+            from .pro import convert_excel_to_mxl, EXCEL_TO_MXL_AVAILABLE
+        except ImportError:
+            return
+        if EXCEL_TO_MXL_AVAILABLE:
+            self._files.prefetch_call(("excel2mxl", str(content_path)), convert_excel_to_mxl, str(content_path))
+
     def _enhance_validation_error(self, error) -> str:
                    
                                                            
@@ -516,35 +637,40 @@ class YAMLParser:
 
     def parse(self) -> Optional[Processor]:
                    
-        if not self.load_yaml():
-            return None
+        if not self._load_cached_config():
+            if not self.load_yaml():
+                return None
 
-        if not self.validate_schema():
-            return None
+            if not self.validate_schema():
+                return None
 
         try:
-            processor = self._create_processor()
+            self._prefetch_files()
+            self._store_cached_config()
+
+            with span("yaml.build_model"):
+                processor = self._create_processor()
 
                                                     
-            self._parse_bsp_config(processor)
+                self._parse_bsp_config(processor)
 
                                     
-            self._parse_attributes(processor)
-            self._parse_tabular_sections(processor)
-            self._parse_validation_config(processor)
-            self._parse_tests_config(processor)
-            self._parse_object_module(processor)
-            self._parse_templates(processor)
-            self._parse_forms(processor)
+                self._parse_attributes(processor)
+                self._parse_tabular_sections(processor)
+                self._parse_validation_config(processor)
+                self._parse_tests_config(processor)
+                self._parse_object_module(processor)
+                self._parse_templates(processor)
+                self._parse_forms(processor)
 
                                                                                
-            self._validate_data_references(processor)
+                self._validate_data_references(processor)
 
                                                        
-            self._process_template_auto_fields(processor)
+                self._process_template_auto_fields(processor)
 
                                                                       
-            self._process_template_linked_fields(processor)
+                self._process_template_linked_fields(processor)
 
             print(f"✅ YAML успішно розпарсено: {processor.name}")
             return processor
@@ -554,6 +680,8 @@ class YAMLParser:
             import traceback
             traceback.print_exc()
             return None
+        finally:
+            self._files.close()
 
                                                                                
                         
@@ -569,7 +697,8 @@ class YAMLParser:
 
         processor_config = normalize_multilang(
             self.config.get("processor", {}),
-            languages=self.languages
+            languages=self.languages,
+            in_place=True,
         )
 
         processor = Processor(
@@ -593,7 +722,7 @@ class YAMLParser:
     def _parse_attributes(self, processor: Processor) -> None:
                                         
         for attr_config in self.config.get("attributes", []):
-            attr_config = normalize_multilang(attr_config, languages=self.languages)
+            attr_config = normalize_multilang(attr_config, languages=self.languages, in_place=True)
             attr = Attribute(
                 name=attr_config["name"],
                 type=attr_config["type"],
@@ -609,7 +738,7 @@ class YAMLParser:
     def _parse_tabular_sections(self, processor: Processor) -> None:
                                               
         for ts_config in self.config.get("tabular_sections", []):
-            ts_config = normalize_multilang(ts_config, languages=self.languages)
+            ts_config = normalize_multilang(ts_config, languages=self.languages, in_place=True)
             ts = TabularSection(
                 name=ts_config["name"],
                 synonym_ru=ts_config.get("synonym_ru", ts_config["name"]),
@@ -623,7 +752,7 @@ class YAMLParser:
                                                                             
         columns = []
         for col_config in columns_config:
-            col_config = normalize_multilang(col_config, languages=self.languages)
+            col_config = normalize_multilang(col_config, languages=self.languages, in_place=True)
             col = Column(
                 name=col_config["name"],
                 type=col_config["type"],
@@ -741,15 +870,25 @@ class YAMLParser:
                     errors
                 )
 
+    def _resolve_path(self, value: str) -> Path:
+        path = Path(value)
+        if not path.is_absolute():
+            path = self.yaml_path.parent / path
+        return path
+
     def _load_form_include(self, form_config: Dict) -> Optional[Dict]:
                                                 
-        include_path = Path(form_config["include"])
-        if not include_path.is_absolute():
-            include_path = self.yaml_path.parent / include_path
+        include_path = self._resolve_path(form_config["include"])
+        self.inputs.record(include_path)
 
         try:
-            with open(include_path, "r", encoding="utf-8") as f:
-                included_config = yaml.safe_load(f)
+            included_config = self._includes.get(str(include_path))
+            if included_config is None:
+                included_config = self._include_cache.parse(
+                    include_path, self._files.read_bytes(include_path), self._load_yaml_bytes
+                )
+            else:
+                included_config = clone_structure(included_config)
                                                               
             return {**included_config, **form_config}
         except Exception as e:
@@ -842,10 +981,11 @@ class YAMLParser:
         if not doc_path.is_absolute():
             doc_path = self.yaml_path.parent / doc_path
 
+        self.inputs.record(doc_path)
         try:
-            with open(doc_path, 'r', encoding='utf-8') as f:
-                form.documentation_file = documentation_file
-                form.documentation = f.read().strip()
+            documentation = self._files.read_text(doc_path)
+            form.documentation_file = documentation_file
+            form.documentation = documentation.strip()
             print(f"📄 Завантажено документацію з файлу: {documentation_file}")
         except FileNotFoundError:
             print(f"⚠️ Файл документації не знайдено: {doc_path}")
@@ -910,7 +1050,7 @@ class YAMLParser:
 
     def _parse_command(self, config: Dict) -> Command:
                                             
-        config = normalize_multilang(config, languages=self.languages)
+        config = normalize_multilang(config, languages=self.languages, in_place=True)
 
         long_operation_settings = None
         if "long_operation_settings" in config:
@@ -962,7 +1102,7 @@ class YAMLParser:
 
     def _parse_value_table_config(self, config: Dict) -> ValueTableAttribute:
                                               
-        config = normalize_multilang(config, languages=self.languages)
+        config = normalize_multilang(config, languages=self.languages, in_place=True)
         vt = ValueTableAttribute(
             name=config["name"],
             title_ru=config.get("title_ru", config["name"]),
@@ -974,7 +1114,7 @@ class YAMLParser:
 
     def _parse_value_tree_config(self, config: Dict) -> ValueTreeAttribute:
                    
-        config = normalize_multilang(config, languages=self.languages)
+        config = normalize_multilang(config, languages=self.languages, in_place=True)
         vt = ValueTreeAttribute(
             name=config["name"],
             title_ru=config.get("title_ru", config["name"]),
@@ -999,7 +1139,7 @@ class YAMLParser:
                  
         columns = []
         for col_config in config.get("columns", []):
-            col_config = normalize_multilang(col_config, languages=self.languages)
+            col_config = normalize_multilang(col_config, languages=self.languages, in_place=True)
             col = DynamicListColumn(
                 field=col_config["field"],
                 title_ru=col_config.get("title_ru"),
@@ -1009,7 +1149,7 @@ class YAMLParser:
             )
             columns.append(col)
 
-        config = normalize_multilang(config, languages=self.languages)
+        config = normalize_multilang(config, languages=self.languages, in_place=True)
         return DynamicListAttribute(
             name=config["name"],
             title_ru=config.get("title_ru", config["name"]),
@@ -1078,6 +1218,7 @@ class YAMLParser:
         if not tests_path.is_absolute():
             tests_path = self.yaml_path.parent / tests_file
 
+        self.inputs.record(tests_path)
         if not tests_path.exists():
             print(f"⚠️ Файл tests.yaml не знайдено: {tests_path}")
             raise ValueError(f"Tests file not found: {tests_path}")
@@ -1120,6 +1261,7 @@ class YAMLParser:
         if not file_path.is_absolute():
             file_path = self.yaml_path.parent / file_path
 
+        self.inputs.record(file_path)
         if not file_path.exists():
             print(f"⚠️ ObjectModule файл не знайдено: {file_path}")
             return
@@ -1184,7 +1326,7 @@ class YAMLParser:
                         
         commands = []
         for cmd_data in bsp_data.get("commands", []):
-            cmd_data = normalize_multilang(cmd_data, languages=self.languages)
+            cmd_data = normalize_multilang(cmd_data, languages=self.languages, in_place=True)
 
                          
             raw_usage = cmd_data.get("usage", "server_method")
@@ -1259,6 +1401,7 @@ class YAMLParser:
             if not content_path.is_absolute():
                 content_path = self.yaml_path.parent / file_path
 
+            self.inputs.record(content_path)
             if not content_path.exists():
                 raise ValueError(f"Template '{template_name}': File not found: {content_path}")
 
@@ -1274,7 +1417,7 @@ class YAMLParser:
 
             try:
                 if template_type == "HTMLDocument":
-                    template.content = content_path.read_text(encoding="utf-8")
+                    template.content = self._files.read_text(content_path)
                     print(f"      Loaded HTML template: {template_name} ({len(template.content)} chars)")
                 elif template_type == "SpreadsheetDocument":
                                                                 
@@ -1287,7 +1430,9 @@ class YAMLParser:
                                     "Install: pip install openpyxl>=3.1.0"
                                 )
                             print(f"      Converting Excel → MXL: {content_path.name}")
-                            mxl_content = convert_excel_to_mxl(str(content_path))
+                            mxl_content = self._files.call(
+                                ("excel2mxl", str(content_path)), convert_excel_to_mxl, str(content_path)
+                            )
                             template.content_binary = mxl_content.encode('utf-8')
                             print(f"      Converted SpreadsheetDocument: {template_name} ({len(template.content_binary)} bytes)")
                         except ImportError:
@@ -1296,7 +1441,7 @@ class YAMLParser:
                                 "Use .mxl file directly or convert with: python -m 1c_processor_generator excel2mxl"
                             )
                     else:
-                        template.content_binary = content_path.read_bytes()
+                        template.content_binary = self._files.read_bytes(content_path)
                         print(f"      Loaded SpreadsheetDocument: {template_name} ({len(template.content_binary)} bytes)")
             except Exception as e:
                 raise ValueError(f"Template '{template_name}': Error loading file: {e}")
@@ -1314,11 +1459,12 @@ class YAMLParser:
         if not auto_file.is_absolute():
             auto_file = self.yaml_path.parent / automation_path
 
+        self.inputs.record(auto_file)
         if not auto_file.exists():
             raise ValueError(f"Template '{template.name}': Automation file not found: {auto_file}")
 
         try:
-            auto_config = yaml.safe_load(auto_file.read_text(encoding="utf-8"))
+            auto_config = self._load_yaml_bytes(self._files.read_bytes(auto_file))
         except Exception as e:
             raise ValueError(f"Template '{template.name}': Error loading automation file: {e}")
 
@@ -1356,6 +1502,7 @@ class YAMLParser:
                     if not css_path.is_absolute():
                         css_path = auto_file.parent / style_cfg["file"]
 
+                    self.inputs.record(css_path)
                     if not css_path.exists():
                         raise ValueError(f"Template '{template.name}': CSS file not found: {css_path}")
 
@@ -1371,6 +1518,7 @@ class YAMLParser:
                     if not js_path.is_absolute():
                         js_path = auto_file.parent / script_cfg["file"]
 
+                    self.inputs.record(js_path)
                     if not js_path.exists():
                         raise ValueError(f"Template '{template.name}': JS file not found: {js_path}")
 
@@ -1540,10 +1688,45 @@ def parse_yaml_config(
     handlers_dir: Optional[Path] = None,
     handlers_file: Optional[Path] = None,
     normalize_bsl_escapes: bool = False,
+    config_cache: Union[bool, str, Path, None] = None,
+    processor_snapshot: Union[bool, str, Path, None] = None,
+    deterministic_uuids: Union[bool, str, None] = None,
+    pin_uuids: Union[str, Path, None] = None,
 ) -> Optional[Processor]:
            
-    parser = YAMLParser(yaml_path)
-    processor = parser.parse()
+    if config_cache is None and os.environ.get("PROCESSOR_GENERATOR_CONFIG_CACHE"):
+        config_cache = os.environ["PROCESSOR_GENERATOR_CONFIG_CACHE"]
+    if processor_snapshot is None and os.environ.get("PROCESSOR_GENERATOR_PROCESSOR_SNAPSHOT"):
+        processor_snapshot = os.environ["PROCESSOR_GENERATOR_PROCESSOR_SNAPSHOT"]
+
+    snapshot = None
+    if processor_snapshot:
+        from .model_snapshot import ProcessorSnapshot
+
+        snapshot = ProcessorSnapshot(
+            yaml_path,
+            None if processor_snapshot is True else Path(processor_snapshot),
+            handlers_dir=handlers_dir,
+            handlers_file=handlers_file,
+            options={
+                "normalize_bsl_escapes": bool(normalize_bsl_escapes),
+                "deterministic_uuids": str(deterministic_uuids) if deterministic_uuids else None,
+                "pin_uuids": Path(pin_uuids).resolve().as_posix() if pin_uuids else None,
+            },
+        )
+        with span("processor_snapshot.load", path=snapshot.path):
+            processor = snapshot.load()
+        if processor is not None:
+            print(f"⚡ Модель обробки завантажено зі snapshot: {snapshot.path}")
+            return processor
+
+    cache = None
+    if config_cache:
+        cache = ConfigCache(None if config_cache is True else Path(config_cache))
+
+    with span("parse_yaml_config", path=yaml_path):
+        parser = YAMLParser(yaml_path, config_cache=cache)
+        processor = parser.parse()
 
                        
     needs_injection = False
@@ -1561,9 +1744,11 @@ def parse_yaml_config(
         injector = BSLInjector(
             handlers_dir=handlers_dir,
             handlers_file=handlers_file,
-            normalize_escapes=normalize_bsl_escapes
+            normalize_escapes=normalize_bsl_escapes,
+            inputs=parser.inputs,
         )
-        injector.inject_all_handlers(processor)
+        with span("handlers.inject"):
+            injector.inject_all_handlers(processor)
 
                                                                               
         if injector._object_module_from_handlers:
@@ -1577,7 +1762,8 @@ def parse_yaml_config(
             loaded_handlers=injector._loaded_handlers,
             handlers_file=handlers_file,
         )
-        is_valid, errors, warnings = handler_validator.validate()
+        with span("handlers.validate"):
+            is_valid, errors, warnings = handler_validator.validate()
 
         if warnings:
             print("⚠️  Попередження (handlers):")
@@ -1589,4 +1775,16 @@ def parse_yaml_config(
             for error in errors:
                 print(f"   - {error}")
 
+    if processor and (deterministic_uuids or pin_uuids):
+        from .deterministic_ids import apply_uuid_policy
+
+        with span("uuids.assign"):
+            apply_uuid_policy(processor, deterministic_uuids, pin_uuids)
+
+    if snapshot is not None and processor:
+        pin_inputs = [Path(pin_uuids)] if pin_uuids and Path(pin_uuids).is_file() else []
+        with span("processor_snapshot.save", path=snapshot.path):
+            if snapshot.save(processor, [*parser.inputs.paths.values(), *pin_inputs]):
+                print(f"💾 Snapshot моделі збережено: {snapshot.path}")
+
     return processor
@@ -228,7 +228,7 @@ class ReferenceChecker:
 class YAMLPatcher:
            
 
-    def __init__(self, config_path: str, bsl_code: str = ""):
+    def __init__(self, config_path: str, bsl_code: str = "", config: Optional[dict] = None):
                    
         self.config_path = config_path
         self.bsl_code = bsl_code
@@ -245,8 +245,11 @@ class YAMLPatcher:
                                                                                         
                                                                        
 
-        with open(config_path, 'r', encoding='utf-8') as f:
-            self.config = self.yaml.load(f)
+        if config is not None:
+            self.config = config
+        else:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                self.config = self.yaml.load(f)
 
         self.ref_checker = ReferenceChecker(self.config, bsl_code)
         self.warnings: List[str] = []
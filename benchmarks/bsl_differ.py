@@ -0,0 +1,67 @@
+import argparse
+import importlib
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "1c_processor_generator"
+
+DEFAULT_PROCEDURES = 2_000
+
+PROCEDURE_TEMPLATE = """&НаСервере
+Процедура {name}(Параметр{i})
+    // Коментар {i}
+    Для Індекс = 1 По {i} Цикл
+        Результат = Результат + Індекс * Параметр{i};
+        Если Результат > {limit} Тогда
+            Прервать;
+        КонецЕсли;
+    КонецЦикла;
+    Сообщить("Процедура {i}: " + Результат);
+КонецПроцедуры
+
+"""
+
+
+def build_module(count, renamed=(), modified=()):
+    parts = []
+    for i in range(count):
+        name = f"Перейменована{i}" if i in renamed else f"Процедура{i}"
+        limit = i + 1 if i in modified else i
+        parts.append(PROCEDURE_TEMPLATE.format(name=name, i=i, limit=limit))
+    return "".join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Порівняння BSL-модулів за відбитками процедур")
+    parser.add_argument("--procedures", type=int, default=DEFAULT_PROCEDURES,
+                        help=f"Кількість процедур у модулі (за замовчуванням {DEFAULT_PROCEDURES})")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(REPO_ROOT))
+    BSLDiffer = importlib.import_module(f"{PACKAGE}.bsl_differ").BSLDiffer
+
+    count = args.procedures
+    renamed = set(range(0, count, 50))
+    modified = set(range(25, count, 50))
+    original = build_module(count)
+    changed = build_module(count, renamed=renamed, modified=modified)
+
+    started = time.perf_counter()
+    differ = BSLDiffer(original, changed)
+    parsed = time.perf_counter()
+    changes = differ.detect_changes()
+    detected = time.perf_counter()
+
+    print(f"🧪 {count} процедур, {len(renamed)} перейменовано, {len(modified)} змінено")
+    print(f"⏱️  розбір модулів:    {(parsed - started) * 1000:.1f} ms")
+    print(f"⏱️  detect_changes():  {(detected - parsed) * 1000:.1f} ms")
+    for change_type in ("PROCEDURE_ADDED", "PROCEDURE_DELETED", "PROCEDURE_MODIFIED", "PROCEDURE_RENAMED"):
+        found = sum(1 for change in changes if change.change_type.name == change_type)
+        print(f"   {change_type:<20} {found}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
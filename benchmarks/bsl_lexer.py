@@ -0,0 +1,99 @@
+import argparse
+import importlib
+import re
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "1c_processor_generator"
+
+DEFAULT_LINES = 50_000
+
+HANDLER_TEMPLATE = """&НаКлиенте
+Процедура Обработчик{i}(Команда, Знач Параметр = "(значение)")
+    // Коментар: КонецПроцедуры усередині коментаря не закриває процедуру
+    Текст = "ВЫБРАТЬ
+    |   Поле
+    |ИЗ Таблица";
+    Для Каждого Строка Из Объект.Таблица Цикл
+        Если Строка.Сумма > 0 Тогда
+            Сообщить("Сумма " + Строка.Сумма);
+        КонецЕсли;
+    КонецЦикла;
+    Обработчик{i}НаСервере();
+КонецПроцедуры
+
+&НаСервере
+Функция Обработчик{i}НаСервере() Экспорт
+    Возврат Истина;
+КонецФункции
+
+"""
+
+LEGACY_SPLITTER = re.compile(
+    r'(?:^|\n)((?:&[^\n]+\n)+)?\s*(Процедура|Функция|Procedure|Function|Асинх|Async)\s+(\w+)\s*\(([^)]*)\)'
+    r'(.*?)(КонецПроцедуры|КонецФункции|EndProcedure|EndFunction)',
+    re.DOTALL | re.MULTILINE | re.IGNORECASE,
+)
+LEGACY_DIFFER = re.compile(
+    r'(?P<directives>(?:&[А-ЯЁа-яёA-Za-z]+\s*)*)(?P<type>Процедура|Функция)\s+(?P<name>[А-ЯЁа-яёA-Za-z0-9_]+)'
+    r'\s*\((?P<params>[^)]*)\)(?P<export>\s+Экспорт)?(?P<body>.*?)Конец(?:Процедуры|Функции)',
+    re.DOTALL | re.MULTILINE | re.IGNORECASE,
+)
+LEGACY_SIGNATURE = re.compile(
+    r'^\s*(?:&\w+\s+)?(?:Процедура|Функция|Procedure|Function|Асинх|Async)\s+(\w+)',
+    re.MULTILINE | re.IGNORECASE,
+)
+LEGACY_END = re.compile(r'^\s*(?:КонецПроцедуры|КонецФункции|EndProcedure|EndFunction)', re.IGNORECASE)
+
+
+def build_module(line_count):
+    lines_per_handler = HANDLER_TEMPLATE.count("\n")
+    return "".join(HANDLER_TEMPLATE.format(i=i) for i in range(line_count // lines_per_handler + 1))
+
+
+def legacy_passes(code):
+    found = [m.group(3) for m in LEGACY_SPLITTER.finditer(code)]
+    found += [code[:m.start()].count("\n") + 1 for m in LEGACY_DIFFER.finditer(code)]
+    found += LEGACY_SIGNATURE.findall(code)
+    depth = 0
+    for line in code.split("\n"):
+        if LEGACY_SIGNATURE.match(line):
+            depth += 1
+        elif LEGACY_END.match(line):
+            depth -= 1
+    return found
+
+
+def measure(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Один прохід BSL-лексера проти набору регулярних виразів")
+    parser.add_argument("--lines", type=int, default=DEFAULT_LINES,
+                        help=f"Розмір синтетичного handlers.bsl у рядках (за замовчуванням {DEFAULT_LINES})")
+    parser.add_argument("--skip-legacy", action="store_true",
+                        help="Не вимірювати старі регулярні вирази")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(REPO_ROOT))
+    scan_bsl = importlib.import_module(f"{PACKAGE}.bsl_lexer").scan_bsl
+
+    print(f"🧪 Синтетичний handlers.bsl: ~{args.lines} рядків")
+    for fraction in (4, 2, 1):
+        code = build_module(args.lines // fraction)
+        elapsed, module = measure(scan_bsl, code)
+        print(f"   lexer   {code.count(chr(10)):>7} рядків: {elapsed * 1000:9.1f} ms "
+              f"({len(module.procedures)} процедур, {len(module.directives)} директив)")
+        if not args.skip_legacy:
+            elapsed, _ = measure(legacy_passes, code)
+            print(f"   regex   {code.count(chr(10)):>7} рядків: {elapsed * 1000:9.1f} ms (splitter + differ + validator + injector)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
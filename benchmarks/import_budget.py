@@ -0,0 +1,110 @@
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "1c_processor_generator"
+
+DEFAULT_BUDGET_MS = 150.0
+
+FORBIDDEN_AT_STARTUP = (
+    f"{PACKAGE}.generator",
+    f"{PACKAGE}.yaml_parser",
+    f"{PACKAGE}.sync_tool",
+    f"{PACKAGE}.test_generator",
+    f"{PACKAGE}.bsl_injector",
+    f"{PACKAGE}.id_allocator",
+    f"{PACKAGE}.pro",
+    "jinja2",
+    "jsonschema",
+    "lxml",
+    "ruamel",
+)
+
+STARTUP_ARGS = ["features", "--category", "cli"]
+
+STARTUP_CODE = (
+    "import sys, time; "
+    "started = time.perf_counter(); "
+    f"__import__('{PACKAGE}.__main__'); "
+    f"sys.modules['{PACKAGE}.__main__'].main({STARTUP_ARGS!r}); "
+    "sys.stderr.write(f'main time: {(time.perf_counter() - started) * 1e6:.0f}\\n')"
+)
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+MAIN_TIME_LINE = re.compile(r"^main time: (\d+)$")
+
+
+def measure_startup():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_CODE],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr)
+        raise SystemExit(f"❌ Не вдалося імпортувати CLI (код {result.returncode})")
+
+    modules = {}
+    main_us = 0
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us), len(indent))
+            continue
+        match = MAIN_TIME_LINE.match(line)
+        if match:
+            main_us = int(match.group(1))
+    return modules, main_us
+
+
+def startup_failures(modules, main_us, budget_ms=None):
+    failures = []
+    eager = [name for name in FORBIDDEN_AT_STARTUP if any(m == name or m.startswith(name + ".") for m in modules)]
+    if eager:
+        failures.append(f"Модулі завантажуються до розбору аргументів: {', '.join(eager)}")
+    if budget_ms is not None and main_us / 1000 > budget_ms:
+        failures.append(f"Перевищено бюджет старту: main() {main_us / 1000:.1f} ms > {budget_ms:.0f} ms")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бюджет холодного старту CLI (python -X importtime)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Максимальний час main() від імпорту до виходу, мс (за замовчуванням {DEFAULT_BUDGET_MS})")
+    parser.add_argument("--top", type=int, default=10, help="Скільки найдовших імпортів показати")
+    args = parser.parse_args()
+
+    modules, main_us = measure_startup()
+    package_total_ms = sum(
+        cumulative for name, (_, cumulative, _) in modules.items()
+        if name in (PACKAGE, f"{PACKAGE}.__main__")
+    ) / 1000
+    total_ms = sum(self_us for self_us, _, _ in modules.values()) / 1000
+
+    print(f"📦 Імпортовано модулів: {len(modules)}")
+    print(f"⏱️  Загальний час імпорту: {total_ms:.1f} ms")
+    print(f"⏱️  Пакет {PACKAGE}: {package_total_ms:.1f} ms")
+    print(f"⏱️  main({' '.join(STARTUP_ARGS)}): {main_us / 1000:.1f} ms (бюджет {args.budget_ms:.0f} ms)")
+
+    slowest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+    for name, (self_us, cumulative_us, _) in slowest:
+        print(f"   {self_us / 1000:8.2f} ms  {cumulative_us / 1000:8.2f} ms  {name}")
+
+    failures = startup_failures(modules, main_us, args.budget_ms)
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+
+    print("✅ Холодний старт у межах бюджету")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
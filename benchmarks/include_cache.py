@@ -0,0 +1,78 @@
+import argparse
+import importlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "1c_processor_generator"
+
+DEFAULT_ELEMENTS = 500
+DEFAULT_ROUNDS = 20
+
+ELEMENT_TEMPLATE = """      - type: InputField
+        name: Поле{i}
+        attribute: Реквізит{i}
+        title_ru: Поле {i}
+        title_uk: Поле {i}
+        properties:
+          horizontal_align: Left
+          title_location: Top
+          choice_list:
+            - {{v: A{i}, ru: А{i}, uk: А{i}}}
+            - {{v: B{i}, ru: Б{i}, uk: Б{i}}}
+"""
+
+
+def build_include(element_count):
+    return (
+        "name: Форма\n"
+        "elements:\n"
+        "  - type: UsualGroup\n"
+        "    name: Група\n"
+        "    elements:\n"
+        + "".join(ELEMENT_TEMPLATE.format(i=i) for i in range(element_count))
+    )
+
+
+def measure(rounds, func, *args):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func(*args)
+    return (time.perf_counter() - started) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Повторний розбір include-файлу проти клонування з кешу")
+    parser.add_argument("--elements", type=int, default=DEFAULT_ELEMENTS,
+                        help=f"Кількість елементів у include-файлі (за замовчуванням {DEFAULT_ELEMENTS})")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="Кількість повторів")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(REPO_ROOT))
+    config_cache = importlib.import_module(f"{PACKAGE}.config_cache")
+    include_cache = importlib.import_module(f"{PACKAGE}.include_cache")
+
+    data = build_include(args.elements).encode("utf-8")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "form.yaml"
+        path.write_bytes(data)
+        cache = include_cache.IncludeCache()
+        cache.parse_shared(path, data, config_cache.load_yaml_bytes)
+
+        results = [
+            ("yaml SafeLoader", measure(args.rounds, config_cache.load_yaml_bytes, data)),
+            ("yaml CSafeLoader", measure(args.rounds, config_cache.load_yaml_bytes_fast, data)),
+            ("cache parse() (клон)", measure(args.rounds, cache.parse, path, data, config_cache.load_yaml_bytes)),
+            ("cache parse_shared()", measure(args.rounds, cache.parse_shared, path, data, config_cache.load_yaml_bytes)),
+        ]
+
+    print(f"🧪 Include-файл: {args.elements} елементів, {len(data) // 1024} KB")
+    for name, elapsed in results:
+        print(f"   {name:<22} {elapsed * 1000:9.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
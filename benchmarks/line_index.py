@@ -0,0 +1,79 @@
+import argparse
+import importlib
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "1c_processor_generator"
+
+DEFAULT_LINES = 20_000
+
+PROCEDURE_TEMPLATE = """&НаСервере
+Процедура Процедура{i}(Параметр)
+    Результат = Параметр * 2;
+    Сообщить("Результат: " + Результат);
+КонецПроцедуры
+
+"""
+
+
+def build_module(line_count):
+    lines_per_procedure = PROCEDURE_TEMPLATE.count("\n")
+    return "".join(PROCEDURE_TEMPLATE.format(i=i) for i in range(line_count // lines_per_procedure + 1))
+
+
+def procedure_offsets(code):
+    offsets = []
+    pos = code.find("Процедура ")
+    while pos >= 0:
+        offsets.append(pos)
+        pos = code.find("Процедура ", pos + 1)
+    return offsets
+
+
+def legacy_lines(code, offsets):
+    return [code[:offset].count("\n") + 1 for offset in offsets]
+
+
+def indexed_lines(line_index_cls, code, offsets):
+    index = line_index_cls(code)
+    return [index.line(offset) for offset in offsets]
+
+
+def measure(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Індекс рядків проти підрахунку code[:pos].count('\\n')")
+    parser.add_argument("--lines", type=int, default=DEFAULT_LINES,
+                        help=f"Розмір синтетичного модуля у рядках (за замовчуванням {DEFAULT_LINES})")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(REPO_ROOT))
+    line_index_cls = importlib.import_module(f"{PACKAGE}.line_index").LineIndex
+    scan_bsl = importlib.import_module(f"{PACKAGE}.bsl_lexer").scan_bsl
+
+    print(f"🧪 Синтетичний модуль: до ~{args.lines} рядків")
+    for fraction in (4, 2, 1):
+        code = build_module(args.lines // fraction)
+        offsets = procedure_offsets(code)
+        line_count = code.count("\n")
+
+        legacy_elapsed, legacy = measure(legacy_lines, code, offsets)
+        indexed_elapsed, indexed = measure(indexed_lines, line_index_cls, code, offsets)
+        scan_elapsed, module = measure(scan_bsl, code)
+        assert legacy == indexed == [proc.header_line for proc in module.procedures]
+
+        print(f"   {line_count:>7} рядків, {len(offsets)} процедур:")
+        print(f"      count('\\n')  {legacy_elapsed * 1000:9.2f} ms  ({legacy_elapsed * 1e6 / line_count:7.3f} µs/рядок)")
+        print(f"      LineIndex    {indexed_elapsed * 1000:9.2f} ms  ({indexed_elapsed * 1e6 / line_count:7.3f} µs/рядок)")
+        print(f"      scan_bsl     {scan_elapsed * 1000:9.2f} ms  ({scan_elapsed * 1e6 / line_count:7.3f} µs/рядок)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
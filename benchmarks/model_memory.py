@@ -0,0 +1,109 @@
+import argparse
+import dataclasses
+import gc
+import importlib
+import sys
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "1c_processor_generator"
+
+DEFAULT_ELEMENTS = 20_000
+
+
+def load_models():
+    sys.path.insert(0, str(REPO_ROOT))
+    return importlib.import_module(f"{PACKAGE}.models")
+
+
+def eager_variant(models, cls, cache):
+    if cls in cache:
+        return cache[cls]
+    specs = []
+    for f in dataclasses.fields(cls):
+        if f.metadata.get(models.LAZY_UUID):
+            specs.append((f.name, f.type, dataclasses.field(default_factory=models.generate_uuid)))
+        elif f.default is not dataclasses.MISSING:
+            specs.append((f.name, f.type, dataclasses.field(default=f.default)))
+        elif f.default_factory is not dataclasses.MISSING:
+            specs.append((f.name, f.type, dataclasses.field(default_factory=f.default_factory)))
+        else:
+            specs.append((f.name, f.type))
+    namespace = {}
+    if "__post_init__" in cls.__dict__:
+        namespace["__post_init__"] = cls.__dict__["__post_init__"]
+    cache[cls] = dataclasses.make_dataclass(f"Eager{cls.__name__}", specs, namespace=namespace)
+    return cache[cls]
+
+
+def build_processor(models, element_count, factory):
+    processor = factory(models.Processor)(name="ВеликаОбробка")
+    form = factory(models.Form)(name="Форма", default=True)
+    processor.forms.append(form)
+
+    for i in range(element_count // 4):
+        processor.attributes.append(factory(models.Attribute)(name=f"Реквізит{i}", type="string", length=100))
+
+    group = None
+    for i in range(element_count):
+        if i % 100 == 0:
+            group = factory(models.FormGroup)(group_type="UsualGroup", name=f"Група{i // 100}")
+            form.form_groups.append(group)
+        element = factory(models.FormElement)(
+            element_type="InputField",
+            name=f"Поле{i}",
+            attribute=f"Реквізит{i % (element_count // 4 or 1)}",
+            event_handlers={"OnChange": f"Поле{i}ПриЗміні"} if i % 4 == 0 else {},
+        )
+        group.child_items.append(element)
+        form.elements.append(element)
+
+    for i in range(element_count // 10):
+        form.commands.append(factory(models.Command)(name=f"Команда{i}", title_ru=f"Команда {i}", title_uk=f"Команда {i}"))
+        form.form_attributes.append(factory(models.FormAttribute)(name=f"РеквізитФорми{i}", type="string"))
+    return processor
+
+
+def measure(models, element_count, factory, touch_uuids=False):
+    gc.collect()
+    tracemalloc.start()
+    processor = build_processor(models, element_count, factory)
+    if touch_uuids:
+        for form in processor.forms:
+            for command in form.commands:
+                command.uuid
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del processor
+    return current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пам'ять моделі для синтетичної обробки з великою кількістю елементів")
+    parser.add_argument("--elements", type=int, default=DEFAULT_ELEMENTS,
+                        help=f"Кількість елементів форми (за замовчуванням {DEFAULT_ELEMENTS})")
+    args = parser.parse_args()
+
+    models = load_models()
+    cache = {}
+    variants = (
+        ("dict + eager UUID", lambda cls: eager_variant(models, cls, cache), False),
+        ("__slots__ + lazy UUID", lambda cls: cls, False),
+        ("__slots__ + lazy UUID (UUID команд прочитано)", lambda cls: cls, True),
+    )
+
+    print(f"🧪 Синтетична обробка: {args.elements} елементів форми")
+    results = []
+    for label, factory, touch in variants:
+        current, peak = measure(models, args.elements, factory, touch)
+        results.append(current)
+        print(f"   {label:<46} {current / 1024 / 1024:8.2f} MB (пік {peak / 1024 / 1024:.2f} MB)")
+
+    baseline, compact = results[0], results[1]
+    print(f"📉 Економія: {(baseline - compact) / 1024 / 1024:.2f} MB ({(1 - compact / baseline) * 100:.1f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+import argparse
+import importlib
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "1c_processor_generator"
+
+DEFAULT_ELEMENTS = 5_000
+ELEMENT_TYPES = ("InputField", "Button", "PictureDecoration", "RadioButtonField", "LabelDecoration")
+
+
+def load_modules():
+    sys.path.insert(0, str(REPO_ROOT))
+    return (
+        importlib.import_module(f"{PACKAGE}.models"),
+        importlib.import_module(f"{PACKAGE}.validators"),
+        importlib.import_module(f"{PACKAGE}.profiling"),
+    )
+
+
+def build_processor(models, element_count):
+    processor = models.Processor(name="ВеликаОбробка")
+    form = models.Form(name="Форма", default=True)
+    processor.forms.append(form)
+
+    for i in range(element_count // 4):
+        processor.attributes.append(models.Attribute(name=f"Реквізит{i}", type="string", length=100))
+
+    group = None
+    for i in range(element_count):
+        if i % 50 == 0:
+            group = models.FormElement(element_type="UsualGroup", name=f"Група{i // 50}",
+                                       properties={"representation": "NormalSeparation", "group_direction": "Vertical"})
+            form.elements.append(group)
+        element_type = ELEMENT_TYPES[i % len(ELEMENT_TYPES)]
+        properties = {"horizontal_align": "Left", "title_location": "Top", "text_color": "#336699"}
+        if element_type in ("Button", "PictureDecoration"):
+            properties["picture"] = "StdPicture.Print"
+        if element_type in ("InputField", "RadioButtonField"):
+            properties["choice_list"] = [{"value": "A", "presentation": "A"}]
+        group.child_items.append(models.FormElement(
+            element_type=element_type,
+            name=f"Елемент{i}",
+            attribute=f"Реквізит{i % (element_count // 4 or 1)}" if element_type == "InputField" else None,
+            properties=properties,
+        ))
+    return processor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Один прохід правил валідації для синтетичної форми")
+    parser.add_argument("--elements", type=int, default=DEFAULT_ELEMENTS,
+                        help=f"Кількість елементів форми (за замовчуванням {DEFAULT_ELEMENTS})")
+    parser.add_argument("--top", type=int, default=5, help="Скільки найповільніших правил показати")
+    args = parser.parse_args()
+
+    models, validators, profiling = load_modules()
+    processor = build_processor(models, args.elements)
+    validator = validators.ProcessorValidator(processor)
+
+    started = time.perf_counter()
+    is_valid, errors, warnings = validator.validate()
+    elapsed = time.perf_counter() - started
+
+    validator = validators.ProcessorValidator(processor)
+    with profiling.profile():
+        started = time.perf_counter()
+        validator.validate()
+        profiled = time.perf_counter() - started
+
+    print(f"🧪 Синтетична форма: {validator.rules.nodes} вузлів, {len(errors)} помилок, {len(warnings)} попереджень")
+    print(f"⏱️  validate(): {elapsed * 1000:.2f} ms (з профілюванням правил {profiled * 1000:.2f} ms)")
+    for line in validator.rule_report(args.top):
+        print(f"   {line}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+import importlib
+
+import pytest
+
+batch_builder = importlib.import_module("1c_processor_generator.batch_builder")
+
+
+def make_configs(root, *dirs):
+    configs = []
+    for name in dirs:
+        directory = root / name
+        directory.mkdir(parents=True)
+        config = directory / batch_builder.CONFIG_FILE_NAME
+        config.write_text("processor: {}\n", encoding="utf-8")
+        configs.append(config)
+    return configs
+
+
+def test_glob_configs_with_same_directory_name_get_distinct_outputs(tmp_path):
+    configs = make_configs(tmp_path / "src", "a/app", "b/app")
+    output = tmp_path / "out"
+
+    planned = batch_builder.plan_output_dirs(configs, output)
+
+    assert planned == [output / "a" / "app", output / "b" / "app"]
+
+
+def test_colliding_output_dirs_are_rejected(tmp_path):
+    configs = make_configs(tmp_path, "app", "app/app")
+
+    with pytest.raises(ValueError):
+        batch_builder.plan_output_dirs(configs, tmp_path / "out", base_dir=tmp_path / "app")
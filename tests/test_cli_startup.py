@@ -0,0 +1,19 @@
+import importlib.util
+from pathlib import Path
+
+BENCHMARK = Path(__file__).resolve().parent.parent / "benchmarks" / "import_budget.py"
+
+
+def load_import_budget():
+    spec = importlib.util.spec_from_file_location("import_budget", BENCHMARK)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_main_cold_start_skips_heavy_modules():
+    import_budget = load_import_budget()
+    modules, main_us = import_budget.measure_startup()
+
+    assert main_us > 0
+    assert import_budget.startup_failures(modules, main_us, import_budget.DEFAULT_BUDGET_MS) == []
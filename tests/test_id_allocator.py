@@ -0,0 +1,67 @@
+import importlib
+
+import pytest
+
+id_allocator = importlib.import_module("1c_processor_generator.id_allocator")
+element_id_store = importlib.import_module("1c_processor_generator.element_id_store")
+
+INCREMENTS = {"InputField": 3, "Table": 4, "TableColumn": 3}
+
+
+@pytest.fixture(autouse=True)
+def increments(monkeypatch):
+    monkeypatch.setattr(id_allocator, "_gen_ctx", {"element_id_increments": INCREMENTS})
+
+
+def allocate(id_map, steps):
+    allocator = id_allocator.StableIDAllocator.bind(id_map)()
+    result = []
+    for kind, name in steps:
+        if kind == "reserve":
+            result.append(("reserve", allocator.reserve(name)))
+        else:
+            result.append((name, allocator.allocate(kind, name)))
+    return result
+
+
+def test_reused_range_wider_than_recorded_size_does_not_collide():
+    id_map = id_allocator.ElementIDMap({"InputField:A": (1, 3), "Table:T": (10, 3)})
+    allocate(id_map, [("InputField", "A"), ("Table", "T"), ("InputField", "B")])
+
+    ranges = sorted(id_map.allocated.values())
+    assert id_map.allocated["Table:T"] == (10, 4)
+    for (start, size), (next_start, _) in zip(ranges, ranges[1:]):
+        assert start + size <= next_start
+
+
+def test_reserved_blocks_keep_their_ids_between_runs():
+    steps = [("InputField", "A"), ("reserve", 2), ("InputField", "B"), ("reserve", 5)]
+    first_map = id_allocator.ElementIDMap()
+    first = allocate(first_map, steps)
+
+    second_map = id_allocator.ElementIDMap(first_map.allocated, next_id=first_map.next_id)
+    second = allocate(second_map, steps)
+
+    assert second == first
+    assert second_map.next_id == first_map.next_id
+
+
+def test_table_columns_recovered_from_form_xml(tmp_path):
+    form_xml = tmp_path / "Form.xml"
+    form_xml.write_text(
+        '<Form xmlns="http://v8.1c.ru/8.3/xcf/logform">'
+        '<ChildItems>'
+        '<Table name="Товары" id="1"><ContextMenu name="ТоварыКонтекстноеМеню" id="2"/>'
+        '<ChildItems>'
+        '<LabelField name="ТоварыНомерСтроки" id="5"><ContextMenu name="М1" id="6"/></LabelField>'
+        '<InputField name="ТоварыЦіна" id="8"><ContextMenu name="М2" id="9"/></InputField>'
+        '</ChildItems></Table>'
+        '</ChildItems></Form>',
+        encoding="utf-8",
+    )
+    id_map = element_id_store.element_ids_from_form_xml(form_xml)
+    ids = dict(allocate(id_map, [
+        ("Table", "Товары"), ("TableColumn", "НомерСтроки"), ("TableColumn", "Ціна"),
+    ]))
+
+    assert ids == {"Товары": 1, "НомерСтроки": 5, "Ціна": 8}
@@ -0,0 +1,29 @@
+import importlib
+import os
+
+include_cache = importlib.import_module("1c_processor_generator.include_cache")
+
+
+def test_same_size_edit_with_preserved_mtime_is_not_served_from_cache(tmp_path):
+    path = tmp_path / "form.yaml"
+    path.write_bytes(b"name: A\n")
+    stat = os.stat(path)
+    cache = include_cache.IncludeCache()
+
+    assert cache.read_bytes(path) == b"name: A\n"
+    path.write_bytes(b"name: B\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert cache.read_bytes(path) == b"name: B\n"
+
+
+def test_settled_file_is_served_without_rereading(tmp_path, monkeypatch):
+    path = tmp_path / "form.yaml"
+    path.write_bytes(b"name: A\n")
+    cache = include_cache.IncludeCache()
+    monkeypatch.setattr(include_cache, "RACY_WINDOW_NS", -10**18)
+
+    cache.read_bytes(path)
+    cache.read_bytes(path)
+
+    assert (cache.hits, cache.misses) == (1, 1)